@@ -174,7 +174,16 @@ def _dispatch_execute(
         _logging.error("!! End Error Captured by Flyte !!")
 
     for k, v in output_file_dict.items():
-        _common_utils.write_proto_to_file(v.to_flyte_idl(), _os.path.join(ctx.execution_state.engine_dir, k))
+        path = _os.path.join(ctx.execution_state.engine_dir, k)
+        if isinstance(v, _dynamic_job.DynamicJobSpec):
+            # Written part by part, large specs would otherwise be held in memory twice
+            size = _common_utils.write_proto_parts_to_file(v.to_flyte_idl_parts(), path)
+            _logging.info(f"Wrote dynamic job spec of {size} bytes")
+            params = ctx.user_space_params
+            if params is not None and params.stats is not None:
+                params.stats.gauge("dynamic.spec_bytes", size)
+        else:
+            _common_utils.write_proto_to_file(v.to_flyte_idl(), path)
 
     ctx.file_access.upload_directory(ctx.execution_state.engine_dir, output_prefix)
     _logging.info(f"Engine folder written successfully to the output prefix {output_prefix}")
@@ -0,0 +1,55 @@
+import datetime
+
+import click
+
+from flytekit.core.local_cache import LocalTaskCache
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+@click.group("local-cache")
+@click.option(
+    "-d",
+    "--directory",
+    required=False,
+    type=click.Path(file_okay=False, resolve_path=True),
+    help="Directory of the local cache, defaults to the configured sdk.local_cache_dir.",
+)
+@click.pass_context
+def local_cache(ctx, directory):
+    """
+    Inspects and clears the outputs of cached tasks stored by local executions.
+    """
+    ctx.obj["local_cache"] = LocalTaskCache(directory)
+
+
+@local_cache.command("list")
+@click.option("-t", "--task", "task_name", required=False, type=str, help="Only list the entries of this task.")
+@click.pass_context
+def list_entries(ctx, task_name):
+    """
+    Lists the cached entries, most recently used first.
+    """
+    cache = ctx.obj["local_cache"]
+    entries = [e for e in cache.entries() if task_name is None or e.task_name == task_name]
+    click.secho(f"{len(entries)} entries in {cache.directory}", fg="green")
+    for e in entries:
+        last_used = datetime.datetime.fromtimestamp(e.last_used_at).isoformat(sep=" ", timespec="seconds")
+        click.echo(f"{e.key[:12]}  {e.task_name}  version={e.cache_version!r}  {_format_size(e.bytes)}  {last_used}")
+
+
+@local_cache.command("clear")
+@click.option("-t", "--task", "task_name", required=False, type=str, help="Only clear the entries of this task.")
+@click.pass_context
+def clear(ctx, task_name):
+    """
+    Removes the cached entries.
+    """
+    removed = ctx.obj["local_cache"].clear(task_name)
+    click.secho(f"Removed {len(removed)} entries", fg="green")
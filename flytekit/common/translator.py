@@ -187,7 +187,9 @@ def get_serializable_workflow(
         outputs=entity.output_bindings,
     )
 
-    return admin_workflow_models.WorkflowSpec(template=wf_t, sub_workflows=list(set(sub_wfs)))
+    # Deduplicate by id rather than through a set, which hashes every template by serializing it
+    sub_wfs = list({sub_wf.id: sub_wf for sub_wf in sub_wfs}.values())
+    return admin_workflow_models.WorkflowSpec(template=wf_t, sub_workflows=sub_wfs)
 
 
 def get_serializable_launch_plan(
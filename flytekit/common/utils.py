@@ -1,7 +1,10 @@
+import gc as _gc
 import logging as _logging
 import os as _os
+import re as _re
 import shutil as _shutil
 import tempfile as _tempfile
+import threading as _threading
 import time as _time
 from hashlib import sha224 as _sha224
 from pathlib import Path
@@ -10,6 +13,9 @@ import flytekit as _flytekit
 from flytekit.configuration import sdk as _sdk_config
 from flytekit.models.core import identifier as _identifier
 
+# Values that _dnsify would return unchanged, e.g. the generated node ids
+_DNS_COMPLIANT = _re.compile(r"[a-z0-9]([-a-z0-9]{0,60}[a-z0-9])?")
+
 
 def _dnsify(value):  # type: (str) -> str
     """
@@ -20,6 +26,8 @@ def _dnsify(value):  # type: (str) -> str
     :param Text value:
     :rtype: Text
     """
+    if _DNS_COMPLIANT.fullmatch(value):
+        return value
     res = ""
     MAX = 63
     HASH_LEN = 10
@@ -62,6 +70,22 @@ def write_proto_to_file(proto, path):
         writer.write(proto.SerializeToString())
 
 
+def write_proto_parts_to_file(protos, path):
+    """
+    Writes the concatenation of the serialized protobufs, serializing one at a time, and returns the number of bytes
+    written. Parsing the file merges the parts, which appends the elements of repeated fields, see
+    :py:meth:`flytekit.models.dynamic_job.DynamicJobSpec.to_flyte_idl_parts`.
+    """
+    Path(_os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+    size = 0
+    with open(path, "wb") as writer:
+        for proto in protos:
+            data = proto.SerializeToString()
+            writer.write(data)
+            size += len(data)
+    return size
+
+
 def get_version_message():
     return "Welcome to Flyte! Version: {}".format(_flytekit.__version__)
 
@@ -162,6 +186,41 @@ class PerformanceTimer(object):
         )
 
 
+class DeferredFullGarbageCollection(object):
+    """
+    Makes full garbage collections of the interpreter less frequent, for code that allocates a large number of objects
+    that all stay alive, like the nodes of a large workflow being compiled. Every full collection walks all these
+    objects again without freeing any of them. The younger generations are still collected as usual, so short-lived
+    cyclic garbage created meanwhile (e.g. by the user code of a dynamic workflow) is freed as before.
+    """
+
+    # Instances may be nested or entered by several threads at once (e.g. local workflow workers), only the outermost
+    # one raises the threshold and the last one to exit restores the original thresholds
+    _lock = _threading.Lock()
+    _depth = 0
+    _thresholds = None
+
+    def __init__(self, factor=10):
+        self._factor = factor
+
+    def __enter__(self):
+        cls = DeferredFullGarbageCollection
+        with cls._lock:
+            if cls._depth == 0:
+                cls._thresholds = _gc.get_threshold()
+                gen0, gen1, gen2 = cls._thresholds
+                _gc.set_threshold(gen0, gen1, gen2 * self._factor)
+            cls._depth += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        cls = DeferredFullGarbageCollection
+        with cls._lock:
+            cls._depth -= 1
+            if cls._depth == 0:
+                _gc.set_threshold(*cls._thresholds)
+                cls._thresholds = None
+
+
 class ExitStack(object):
     def __init__(self, entered_stack=None):
         self._contexts = entered_stack
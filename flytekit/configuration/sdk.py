@@ -91,3 +91,110 @@ This is the remote directory where fast-registered code will be uploaded to.
 Users calling fast-execute need write permission to this directory.
 Furthermore, it is important that whichever role executes your workflow has read access to this directory.
 """
+
+COMPACT_LIST_THRESHOLD = _config_common.FlyteIntegerConfigurationEntry("sdk", "compact_list_threshold", default=0)
+"""
+Output lists of ints, floats, bools or strs with at least this many entries are encoded as a single packed binary
+literal instead of one literal per entry, for tasks that opt in with ``compact_lists=True``. A value of 0 (the default)
+disables the compact encoding. The literal type of the list is not affected, so only flytekit tasks can read the packed
+form: Flyte map tasks, conditions and the console, as well as other SDKs, expect a collection of literals.
+"""
+
+LITERAL_OFFLOAD_THRESHOLD = _config_common.FlyteIntegerConfigurationEntry("sdk", "literal_offload_threshold", default=0)
+"""
+Outputs of tasks with ``offload_outputs=True`` whose serialized literal is at least this many bytes are uploaded to the
+raw output prefix and replaced with a reference, instead of being written into outputs.pb directly. References are
+resolved when the value is read by flytekit. A value of 0 (the default) disables offloading.
+"""
+
+DATAFRAME_FORMAT = _config_common.FlyteStringConfigurationEntry("sdk", "dataframe_format", default="parquet")
+"""
+This is the storage format used for dataframes (pandas.DataFrame, pyarrow.Table) that are passed without a typed
+FlyteSchema. One of 'parquet' or 'arrow'. Arrow files are memory mapped when read, which avoids decoding the data, but
+they can only be consumed by readers that understand the Arrow IPC file format.
+"""
+
+MAX_CONVERSION_WORKERS = _config_common.FlyteIntegerConfigurationEntry("sdk", "max_conversion_workers", default=4)
+"""
+This is the maximum number of task inputs or outputs that are converted (downloaded, uploaded, decoded or encoded)
+concurrently. Setting this to 1 converts them one after the other.
+"""
+
+PROTOBUF_BINARY_LITERALS = _config_common.FlyteBoolConfigurationEntry("sdk", "protobuf_binary_literals", default=False)
+"""
+If set, protobuf messages are stored as Binary literals holding the serialized message, instead of being converted to
+a Struct. This is faster, smaller and lossless (int64, bytes and enums), but the value cannot be inspected in the UI.
+Both representations are always accepted when reading.
+"""
+
+SCHEMA_PARTITION_ROWS = _config_common.FlyteIntegerConfigurationEntry("sdk", "schema_partition_rows", default=0)
+"""
+Dataframes written to a schema are split into files of at most this many rows, which are encoded concurrently and can
+be uploaded while the remaining files are still being written. A value of 0 (the default) writes every dataframe to a
+single file.
+"""
+
+SCHEMA_WRITE_WORKERS = _config_common.FlyteIntegerConfigurationEntry("sdk", "schema_write_workers", default=4)
+"""
+This is the maximum number of files of a schema that are encoded concurrently.
+"""
+
+SCHEMA_DIRECT_WRITES = _config_common.FlyteBoolConfigurationEntry("sdk", "schema_direct_writes", default=False)
+"""
+If set, dataframes are encoded straight into the remote directory of their schema, as a multipart upload on object
+stores, instead of being written to a local directory and uploaded afterwards. This needs no local scratch space and
+does not copy the data twice, but a failed write leaves a partially written schema behind.
+"""
+
+LOCAL_OBJECT_PASSTHROUGH = _config_common.FlyteBoolConfigurationEntry("sdk", "local_object_passthrough", default=False)
+"""
+If set, dataframes passed between the tasks of a local workflow execution are kept in memory instead of being written
+to and read back from the local sandbox. Consumers receive a copy of pandas DataFrames, so they cannot affect each
+other. Values are still serialized when they are consumed as a different type, e.g. as a FlyteSchema.
+"""
+
+LOCAL_WORKFLOW_WORKERS = _config_common.FlyteIntegerConfigurationEntry("sdk", "local_workflow_workers", default=1)
+"""
+This is the maximum number of nodes of a workflow that are run concurrently (on threads) when the workflow is executed
+locally. Nodes run as soon as all the nodes they depend on have completed. The default of 1 runs the nodes one after the
+other, in the order in which they were declared.
+"""
+
+LOCAL_RELEASE_INTERMEDIATES = _config_common.FlyteBoolConfigurationEntry(
+    "sdk", "local_release_intermediates", default=False
+)
+"""
+If this is set, local workflow executions delete the files that the outputs of a node were written to (in the local
+sandbox) as soon as every node that consumes them has run, rather than keeping them until the process exits. Workflows
+declared as functions are run through their compiled nodes to do so, unless they contain conditionals. The outputs
+themselves are always released from memory once consumed when the nodes of a workflow are run.
+"""
+
+LOCAL_FAST_EXECUTION = _config_common.FlyteBoolConfigurationEntry("sdk", "local_fast_execution", default=False)
+"""
+If this is set, tasks run in local workflow executions whose inputs and outputs are all of lossless types (primitives,
+and lists, dicts with string keys and dataclasses of them) get copies of their input values, and their outputs are
+passed on as they are, instead of being converted to literals and back. Values that are not exactly of the declared
+type are still converted. This speeds up tests that call small tasks many times.
+"""
+
+LOCAL_CACHE_ENABLED = _config_common.FlyteBoolConfigurationEntry("sdk", "local_cache_enabled", default=False)
+"""
+If this is set, local executions of tasks declared with ``cache=True`` store their outputs on local disk, and later
+executions with the same inputs and ``cache_version`` return them instead of running the task again.
+See :py:mod:`flytekit.core.local_cache`.
+"""
+
+LOCAL_CACHE_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "local_cache_dir", default=None)
+"""
+The directory of the local task cache. Defaults to a ``local_cache`` directory in the local sandbox, which has to be
+set to a fixed directory for cached outputs to be reused across processes.
+"""
+
+LOCAL_CACHE_MAX_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "local_cache_max_bytes", default=1024 * 1024 * 1024
+)
+"""
+The maximum total size of the local task cache. The least recently used entries are evicted when it is exceeded. A value
+of 0 disables eviction.
+"""
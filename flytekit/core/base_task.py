@@ -19,12 +19,14 @@
 
 import collections
 import datetime
+import functools
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 
 from flytekit.common.exceptions import user as _user_exceptions
 from flytekit.common.tasks.sdk_runnable import ExecutionParameters
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.context_manager import (
     BranchEvalMode,
     ExecutionState,
@@ -35,15 +37,18 @@ from flytekit.core.context_manager import (
 )
 from flytekit.core.docstring import Docstring
 from flytekit.core.interface import Interface, transform_interface_to_typed_interface
+from flytekit.core.literal_offloading import offload_if_oversized
+from flytekit.core.local_cache import cached_dispatch_execute
 from flytekit.core.promise import (
     Promise,
     VoidPromise,
     create_and_link_node,
     create_task_output,
+    promise_to_python_value,
     translate_inputs_to_literals,
 )
 from flytekit.core.tracker import TrackedInstance
-from flytekit.core.type_engine import TypeEngine
+from flytekit.core.type_engine import TypeEngine, pack_list_if_large
 from flytekit.loggers import logger
 from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import interface as _interface_models
@@ -88,6 +93,13 @@ class TaskMetadata(object):
         timeout (Optional[Union[datetime.timedelta, int]]): the max amount of time for which one execution of this task
             should be executed for. The execution will be terminated if the runtime exceeds the given timeout
             (approximately)
+        offload_outputs (bool): Allows outputs larger than the configured ``sdk.literal_offload_threshold`` to be
+            replaced with a reference to a blob, see :py:mod:`flytekit.core.literal_offloading`. Only flytekit can
+            resolve these references, so only enable this when every consumer of the outputs is a flytekit task
+        compact_lists (bool): Allows output lists of ints, floats, bools or strs with at least the configured
+            ``sdk.compact_list_threshold`` entries to be packed into a single binary literal. The literal type of the
+            output stays a collection, so Flyte itself cannot read the packed form: such outputs cannot be passed to
+            map tasks, used in conditions or shown in the UI, and only flytekit tasks can consume them
     """
 
     cache: bool = False
@@ -96,6 +108,8 @@ class TaskMetadata(object):
     deprecated: str = ""
     retries: int = 0
     timeout: Optional[Union[datetime.timedelta, int]] = None
+    offload_outputs: bool = False
+    compact_lists: bool = False
 
     def __post_init__(self):
         if self.timeout:
@@ -236,7 +250,9 @@ class Task(object):
         )
         input_literal_map = _literal_models.LiteralMap(literals=kwargs)
 
-        outputs_literal_map = self.dispatch_execute(ctx, input_literal_map)
+        outputs_literal_map = cached_dispatch_execute(
+            ctx, self, input_literal_map, functools.partial(self.dispatch_execute, ctx, input_literal_map)
+        )
         outputs_literals = outputs_literal_map.literals
 
         # TODO maybe this is the part that should be done for local execution, we pass the outputs to some special
@@ -431,6 +447,94 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         """
         return self._python_interface.inputs
 
+    def _local_execute(self, ctx: FlyteContext, **kwargs) -> Union[Tuple[Promise], Promise, VoidPromise]:
+        """
+        If :py:attr:`flytekit.configuration.sdk.LOCAL_FAST_EXECUTION` is set, and all the inputs and outputs of the task
+        are of lossless types (see :py:meth:`flytekit.core.type_engine.TypeEngine.is_lossless`), the task is run with
+        copies of its input values, and its outputs are passed on as they are. Otherwise the inputs and outputs are
+        converted to literals and back.
+        """
+        if _sdk_config.LOCAL_FAST_EXECUTION.get() and self._fast_local_executable():
+            native_inputs = self._native_local_inputs(ctx, kwargs)
+            if native_inputs is not None:
+                return self._fast_local_execute(ctx, native_inputs)
+        return super()._local_execute(ctx, **kwargs)
+
+    def _fast_local_executable(self) -> bool:
+        cls = type(self)
+        if (
+            cls.dispatch_execute is not PythonTask.dispatch_execute
+            or cls.get_input_types is not PythonTask.get_input_types
+            or cls.get_type_for_output_var is not PythonTask.get_type_for_output_var
+        ):
+            # The task converts its inputs or outputs in its own way
+            return False
+        if self.metadata.cache and _sdk_config.LOCAL_CACHE_ENABLED.get():
+            # Cached outputs are looked up by the literals of the inputs
+            return False
+        types = list(self.python_interface.inputs.values()) + list(self.python_interface.outputs.values())
+        return all(TypeEngine.is_lossless(t) for t in types)
+
+    def _native_local_inputs(self, ctx: FlyteContext, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the python values of the inputs of a fast local execution, or None if a value is not exactly of the
+        type of its input (e.g. an int given for a float), or may hold promises, and so has to be converted.
+        """
+        inputs = self.python_interface.inputs
+        if kwargs.keys() != inputs.keys():
+            return None
+        native_inputs = {}
+        for k, v in kwargs.items():
+            if isinstance(v, Promise):
+                if v.native is None and (not v.is_ready or v.val is None):
+                    return None
+                native_inputs[k] = promise_to_python_value(ctx, v, inputs[k])
+                continue
+            passed, native_inputs[k] = TypeEngine.native_passthrough(v, inputs[k])
+            if not passed:
+                return None
+        return native_inputs
+
+    def _fast_local_execute(
+        self, ctx: FlyteContext, native_inputs: Dict[str, Any]
+    ) -> Union[Tuple[Promise], Promise, VoidPromise]:
+        """
+        Runs the task like :py:meth:`dispatch_execute` does, but returns promises that hold the output values, which are
+        only converted to literals if the literals are asked for.
+        """
+        new_user_params = self.pre_execute(ctx.user_space_params)
+        with FlyteContextManager.with_context(
+            ctx.with_execution_state(ctx.execution_state.with_params(user_space_params=new_user_params))
+        ) as exec_ctx:
+            logger.debug(f"Invoking {self.name} with inputs: {native_inputs}")
+            try:
+                native_outputs = self.execute(**native_inputs)
+            except Exception as e:
+                logger.exception(f"Exception when executing {e}")
+                raise e
+            native_outputs = self.post_execute(new_user_params, native_outputs)
+
+            output_names = list(self.interface.outputs.keys())
+            if isinstance(native_outputs, _literal_models.LiteralMap):
+                outputs = {k: Promise(k, lv) for k, lv in native_outputs.literals.items()}
+            else:
+                outputs = {}
+                for k, v in self._native_outputs_as_map(native_outputs).items():
+                    t = self.python_interface.outputs[k]
+                    passed, native_v = TypeEngine.native_passthrough(v, t)
+                    if passed:
+                        outputs[k] = Promise.from_native(
+                            k, native_v, t, functools.partial(self._output_to_literal, exec_ctx, k, native_v, t)
+                        )
+                    else:
+                        outputs[k] = Promise(k, self._output_to_literal(exec_ctx, k, v, t))
+
+        if len(output_names) != len(outputs):
+            raise AssertionError(f"Length difference {len(output_names)} {len(outputs)}")
+        if len(output_names) == 0:
+            return VoidPromise(self.name)
+        return create_task_output([outputs[var] for var in output_names], self.python_interface)
+
     def construct_node_metadata(self) -> _workflow_model.NodeMetadata:
         """
         Used when constructing the node that encapsulates this task as part of a broader workflow definition.
@@ -474,7 +578,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         ) as exec_ctx:
             # TODO We could support default values here too - but not part of the plan right now
             # Translate the input literals to Python native
-            native_inputs = TypeEngine.literal_map_to_kwargs(exec_ctx, input_literal_map, self.python_interface.inputs)
+            native_inputs = TypeEngine.literal_map_to_kwargs(exec_ctx, input_literal_map, self.get_input_types())
 
             # TODO: Logger should auto inject the current context information to indicate if the task is running within
             #   a workflow or a subworkflow etc
@@ -485,7 +589,11 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
                 logger.exception(f"Exception when executing {e}")
                 raise e
 
-            logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
+            if isinstance(native_outputs, _dynamic_job.DynamicJobSpec):
+                # Formatting the spec of a large dynamic workflow as text takes longer than compiling it
+                logger.info(f"Task executed successfully in user level, outputs: {len(native_outputs.nodes)} nodes")
+            else:
+                logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
             # Lets run the post_execute method. This may result in a IgnoreOutputs Exception, which is
             # bubbled up to be handled at the callee layer.
             native_outputs = self.post_execute(new_user_params, native_outputs)
@@ -497,41 +605,51 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             ):
                 return native_outputs
 
-            expected_output_names = list(self._outputs_interface.keys())
-            if len(expected_output_names) == 1:
-                # Here we have to handle the fact that the task could've been declared with a typing.NamedTuple of
-                # length one. That convention is used for naming outputs - and single-length-NamedTuples are
-                # particularly troublesome but elegant handling of them is not a high priority
-                # Again, we're using the output_tuple_name as a proxy.
-                if self.python_interface.output_tuple_name and isinstance(native_outputs, tuple):
-                    native_outputs_as_map = {expected_output_names[0]: native_outputs[0]}
-                else:
-                    native_outputs_as_map = {expected_output_names[0]: native_outputs}
-            elif len(expected_output_names) == 0:
-                native_outputs_as_map = {}
-            else:
-                native_outputs_as_map = {
-                    expected_output_names[i]: native_outputs[i] for i, _ in enumerate(native_outputs)
-                }
+            native_outputs_as_map = self._native_outputs_as_map(native_outputs)
 
-            # We manually construct a LiteralMap here because task inputs and outputs actually violate the assumption
-            # built into the IDL that all the values of a literal map are of the same type.
-            literals = {}
+            # Outputs are converted concurrently, as each of them may require uploading data
+            conversions = {}
             for k, v in native_outputs_as_map.items():
-                literal_type = self._outputs_interface[k].type
                 py_type = self.get_type_for_output_var(k, v)
-
-                if isinstance(v, tuple):
-                    raise AssertionError(f"Output({k}) in task{self.name} received a tuple {v}, instead of {py_type}")
-                try:
-                    literals[k] = TypeEngine.to_literal(exec_ctx, v, py_type, literal_type)
-                except Exception as e:
-                    raise AssertionError(f"failed to convert return value for var {k}") from e
+                conversions[k] = (py_type, functools.partial(self._output_to_literal, exec_ctx, k, v, py_type))
+            literals = TypeEngine.convert_concurrently(conversions)
 
             outputs_literal_map = _literal_models.LiteralMap(literals=literals)
             # After the execute has been successfully completed
             return outputs_literal_map
 
+    def _native_outputs_as_map(self, native_outputs: Any) -> Dict[str, Any]:
+        """
+        Returns the values returned by the task by output name
+        """
+        expected_output_names = list(self._outputs_interface.keys())
+        if len(expected_output_names) == 1:
+            # Here we have to handle the fact that the task could've been declared with a typing.NamedTuple of
+            # length one. That convention is used for naming outputs - and single-length-NamedTuples are
+            # particularly troublesome but elegant handling of them is not a high priority
+            # Again, we're using the output_tuple_name as a proxy.
+            if self.python_interface.output_tuple_name and isinstance(native_outputs, tuple):
+                return {expected_output_names[0]: native_outputs[0]}
+            return {expected_output_names[0]: native_outputs}
+        elif len(expected_output_names) == 0:
+            return {}
+        return {expected_output_names[i]: native_outputs[i] for i, _ in enumerate(native_outputs)}
+
+    def _output_to_literal(self, ctx: FlyteContext, k: str, v: Any, py_type: type) -> _literal_models.Literal:
+        # We manually construct a LiteralMap here because task inputs and outputs actually violate the assumption
+        # built into the IDL that all the values of a literal map are of the same type.
+        if isinstance(v, tuple):
+            raise AssertionError(f"Output({k}) in task{self.name} received a tuple {v}, instead of {py_type}")
+        try:
+            lv = pack_list_if_large(v, py_type) if self.metadata.compact_lists else None
+            if lv is None:
+                lv = TypeEngine.to_literal(ctx, v, py_type, self._outputs_interface[k].type)
+        except Exception as e:
+            raise AssertionError(f"failed to convert return value for var {k}") from e
+        if not self.metadata.offload_outputs:
+            return lv
+        return offload_if_oversized(ctx, lv, k)
+
     def pre_execute(self, user_params: ExecutionParameters) -> ExecutionParameters:
         """
         This is the method that will be invoked directly before executing the task method and before all the inputs
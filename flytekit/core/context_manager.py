@@ -13,18 +13,22 @@
 
 from __future__ import annotations
 
+import contextvars
 import datetime as _datetime
+import functools
 import logging
 import logging as _logging
 import os
 import pathlib
 import re
+import sys
 import traceback
 import typing
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Generator, List, Optional
+from types import CodeType
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 from docker_image import reference
 
@@ -421,7 +425,8 @@ class FlyteContext(object):
     execution_state: Optional[ExecutionState] = None
     serialization_settings: Optional[SerializationSettings] = None
     in_a_condition: bool = False
-    origin_stackframe: Optional[traceback.FrameSummary] = None
+    # Where the context was pushed from, only formatted into a FrameSummary when it is asked for
+    _origin_frame: Optional[Union[traceback.FrameSummary, Tuple[CodeType, int]]] = None
 
     @property
     def user_space_params(self) -> Optional[ExecutionParameters]:
@@ -429,11 +434,20 @@ class FlyteContext(object):
             return self.execution_state.user_space_params
         return None
 
-    def set_stackframe(self, s: traceback.FrameSummary):
-        object.__setattr__(self, "origin_stackframe", s)
+    @property
+    def origin_stackframe(self) -> Optional[traceback.FrameSummary]:
+        if isinstance(self._origin_frame, tuple):
+            code, lineno = self._origin_frame
+            object.__setattr__(
+                self, "_origin_frame", traceback.FrameSummary(code.co_filename, lineno, code.co_name, lookup_line=False)
+            )
+        return self._origin_frame
+
+    def set_stackframe(self, s: Union[traceback.FrameSummary, Tuple[CodeType, int]]):
+        object.__setattr__(self, "_origin_frame", s)
 
     def get_origin_stackframe_repr(self) -> str:
-        if self.origin_stackframe:
+        if self._origin_frame:
             f = self.origin_stackframe
             return f"StackOrigin({f.name}, {f.lineno}, {f.filename})"
         return ""
@@ -578,9 +592,14 @@ class FlyteContext(object):
 class FlyteContextManager(object):
     """
     FlyteContextManager manages the execution context within Flytekit. It holds global state of either compilation
-    or Execution. It is not thread-safe and can only be run as a single threaded application currently.
-    Context's within Flytekit is useful to manage compilation state and execution state. Refer to ``CompilationState``
-    and ``ExecutionState`` for for information. FlyteContextManager provides a singleton stack to manage these contexts.
+    or Execution. Context's within Flytekit is useful to manage compilation state and execution state. Refer to
+    ``CompilationState`` and ``ExecutionState`` for for information. FlyteContextManager provides a stack to manage
+    these contexts.
+
+    The stack is kept in a :py:class:`contextvars.ContextVar`, so every thread and every asyncio task sees a stack of
+    its own. Asyncio tasks start with the stack of the code that created them. Threads start with just the default
+    context set up by ``initialize``, use ``run_in_thread`` to run a function in another thread with the stack of the
+    calling thread.
 
     Typical usage is
 
@@ -596,48 +615,96 @@ class FlyteContextManager(object):
         FlyteContextManager.pop_context()
     """
 
-    _OBJS: typing.List[FlyteContext] = []
+    # The stack of the current thread or asyncio task. Tuples are used, as a stack is shared by the copies of a
+    # contextvars.Context (e.g. by an asyncio task and the code that created it) until one of them pushes or pops.
+    _STACK: contextvars.ContextVar[typing.Tuple[FlyteContext, ...]] = contextvars.ContextVar("flyte_context_stack")
+    # The stack every thread starts with
+    _ROOT: typing.Tuple[FlyteContext, ...] = ()
+
+    @staticmethod
+    def _stack() -> typing.Tuple[FlyteContext, ...]:
+        return FlyteContextManager._STACK.get(FlyteContextManager._ROOT)
+
+    @staticmethod
+    def run_in_thread(fn: typing.Callable) -> typing.Callable:
+        """
+        Returns a function that calls fn with the context stack of the calling thread. Use it to run flytekit entities
+        in other threads (e.g. on a thread pool) in the current context. Every call gets its own copy of the stack, so
+        the contexts pushed and popped by concurrent calls do not interfere with each other, or with the caller.
+        """
+        objs = FlyteContextManager._stack()
+
+        def run(*args, **kwargs):
+            FlyteContextManager._STACK.set(objs)
+            return fn(*args, **kwargs)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return contextvars.copy_context().run(run, *args, **kwargs)
+
+        return wrapper
 
     @staticmethod
     def get_origin_stackframe(limit=2) -> traceback.FrameSummary:
-        ss = traceback.extract_stack(limit=limit + 1)
-        if len(ss) > limit + 1:
-            return ss[limit]
-        return ss[0]
+        code, lineno = FlyteContextManager._origin(limit)
+        return traceback.FrameSummary(code.co_filename, lineno, code.co_name, lookup_line=False)
+
+    @staticmethod
+    def _origin(depth: int) -> Tuple[CodeType, int]:
+        """
+        Returns the code and line of the frame ``depth`` levels above the caller (or of the outermost frame). Unlike
+        traceback.extract_stack, this does not walk and format the whole stack, and unlike keeping the frame itself, it
+        does not keep the locals of the frame alive.
+        """
+        f = sys._getframe(1)
+        for _ in range(depth):
+            if f.f_back is None:
+                break
+            f = f.f_back
+        return f.f_code, f.f_lineno
 
     @staticmethod
     def current_context() -> FlyteContext:
-        if FlyteContextManager._OBJS:
-            return FlyteContextManager._OBJS[-1]
+        objs = FlyteContextManager._stack()
+        if objs:
+            return objs[-1]
         return None
 
     @staticmethod
-    def push_context(ctx: FlyteContext, f: Optional[traceback.FrameSummary] = None) -> FlyteContext:
+    def push_context(
+        ctx: FlyteContext, f: Optional[Union[traceback.FrameSummary, Tuple[CodeType, int]]] = None
+    ) -> FlyteContext:
         if not f:
-            f = FlyteContextManager.get_origin_stackframe(limit=2)
+            f = FlyteContextManager._origin(1)
         ctx.set_stackframe(f)
-        FlyteContextManager._OBJS.append(ctx)
-        t = "\t"
-        logging.debug(
-            f"{t * ctx.level}[{len(FlyteContextManager._OBJS)}] Pushing context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
-        )
+        objs = FlyteContextManager._stack() + (ctx,)
+        FlyteContextManager._STACK.set(objs)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            t = "\t"
+            logging.debug(
+                f"{t * ctx.level}[{len(objs)}] Pushing context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
+            )
         return ctx
 
     @staticmethod
     def pop_context() -> FlyteContext:
-        ctx = FlyteContextManager._OBJS.pop()
-        t = "\t"
-        logging.debug(
-            f"{t * ctx.level}[{len(FlyteContextManager._OBJS) + 1}] Popping context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
-        )
-        if len(FlyteContextManager._OBJS) == 0:
+        objs = FlyteContextManager._stack()
+        ctx, objs = objs[-1], objs[:-1]
+        FlyteContextManager._STACK.set(objs)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            t = "\t"
+            logging.debug(
+                f"{t * ctx.level}[{len(objs) + 1}] Popping context - {'compile' if ctx.compilation_state else 'execute'}, branch[{ctx.in_a_condition}], {ctx.get_origin_stackframe_repr()}"
+            )
+        if len(objs) == 0:
             raise AssertionError(f"Illegal Context state! Popped, {ctx}")
         return ctx
 
     @staticmethod
     @contextmanager
     def with_context(b: FlyteContext.Builder) -> Generator[FlyteContext, None, None]:
-        ctx = FlyteContextManager.push_context(b.build(), FlyteContextManager.get_origin_stackframe(limit=3))
+        # Skips contextlib, so the origin is the with statement
+        ctx = FlyteContextManager.push_context(b.build(), FlyteContextManager._origin(2))
         l = FlyteContextManager.size()
         try:
             yield ctx
@@ -654,14 +721,14 @@ class FlyteContextManager(object):
             # conditionals using the context manager syntax is not easy to follow. So we wanted to optimize for the user
             # ergonomics
             # Also we know that top level construct like workflow and tasks always use context managers and that
-            # context manager mutations are single threaded, hence we can safely cleanup leaks in this section
+            # every thread (and asyncio task) has a stack of its own, hence we can safely cleanup leaks in this section
             # Also this is only in the error cases!
             while FlyteContextManager.size() >= l:
                 FlyteContextManager.pop_context()
 
     @staticmethod
     def size() -> int:
-        return len(FlyteContextManager._OBJS)
+        return len(FlyteContextManager._stack())
 
     @staticmethod
     def initialize():
@@ -688,8 +755,9 @@ class FlyteContextManager(object):
         default_context = default_context.with_execution_state(
             default_context.new_execution_state().with_params(user_space_params=default_user_space_params)
         ).build()
-        default_context.set_stackframe(s=FlyteContextManager.get_origin_stackframe())
-        FlyteContextManager._OBJS = [default_context]
+        default_context.set_stackframe(s=FlyteContextManager._origin(1))
+        FlyteContextManager._ROOT = (default_context,)
+        FlyteContextManager._STACK.set(FlyteContextManager._ROOT)
 
 
 class FlyteEntities(object):
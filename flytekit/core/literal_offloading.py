@@ -0,0 +1,87 @@
+"""
+Outputs of tasks declared with ``offload_outputs=True`` that are larger than
+:py:attr:`flytekit.configuration.sdk.LITERAL_OFFLOAD_THRESHOLD` are not written into the outputs protobuf file directly.
+Instead they are serialized to a file under the raw output prefix, and the literal is replaced with a Blob literal that
+references this file. Consumers resolve these references on demand, when the value is converted back to a python value.
+
+The Blob literal does not match the literal type declared by the task interface, and only flytekit knows how to resolve
+it. Flyte itself (e.g. when evaluating conditions or splitting the inputs of map tasks), the console and other SDKs see
+the reference rather than the value, which is why offloading has to be enabled per task.
+"""
+import os
+
+from flyteidl.core import literals_pb2 as _literals_pb2
+
+from flytekit.common import utils as _common_utils
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core.context_manager import FlyteContext
+from flytekit.loggers import logger
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+
+OFFLOADED_LITERAL_FORMAT = "flytekit.offloaded_literal"
+_OFFLOADED_LITERAL_FILE_NAME = "literal.pb"
+
+
+def _incr(ctx: FlyteContext, metric: str, count: int = 1):
+    params = ctx.user_space_params
+    if params is not None and params.stats is not None:
+        params.stats.incr(f"literal_offloading.{metric}", count)
+
+
+def is_offloaded(lv: Literal) -> bool:
+    """
+    Returns true if the given literal is a reference to an offloaded literal
+    """
+    return bool(
+        lv.scalar is not None
+        and lv.scalar.blob is not None
+        and lv.scalar.blob.metadata.type.format == OFFLOADED_LITERAL_FORMAT
+    )
+
+
+def offload_if_oversized(ctx: FlyteContext, lv: Literal, name: str = "") -> Literal:
+    """
+    Uploads the literal to the raw output prefix and returns a reference to it, if the serialized literal is larger
+    than the configured threshold. Returns the literal unchanged otherwise.
+    """
+    threshold = _sdk_config.LITERAL_OFFLOAD_THRESHOLD.get()
+    if threshold <= 0 or (lv.scalar is not None and lv.scalar.blob is not None):
+        return lv
+
+    pb = lv.to_flyte_idl()
+    size = pb.ByteSize()
+    if size < threshold:
+        return lv
+
+    local_path = os.path.join(ctx.file_access.get_random_local_directory(), _OFFLOADED_LITERAL_FILE_NAME)
+    _common_utils.write_proto_to_file(pb, local_path)
+    remote_path = ctx.file_access.get_random_remote_path(_OFFLOADED_LITERAL_FILE_NAME)
+    ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+    logger.info(f"Offloaded literal {name} of {size} bytes to {remote_path}")
+    _incr(ctx, "offloaded")
+    _incr(ctx, "offloaded_bytes", size)
+
+    return Literal(
+        scalar=Scalar(
+            blob=Blob(
+                metadata=BlobMetadata(
+                    type=_core_types.BlobType(
+                        format=OFFLOADED_LITERAL_FORMAT,
+                        dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE,
+                    )
+                ),
+                uri=remote_path,
+            )
+        )
+    )
+
+
+def load_offloaded(ctx: FlyteContext, lv: Literal) -> Literal:
+    """
+    Downloads and returns the literal referenced by an offloaded literal.
+    """
+    local_path = os.path.join(ctx.file_access.get_random_local_directory(), _OFFLOADED_LITERAL_FILE_NAME)
+    ctx.file_access.get_data(lv.scalar.blob.uri, local_path, is_multipart=False)
+    _incr(ctx, "loaded")
+    return Literal.from_flyte_idl(_common_utils.load_proto_from_file(_literals_pb2.Literal, local_path))
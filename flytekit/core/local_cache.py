@@ -0,0 +1,286 @@
+"""
+Local executions of tasks with ``cache=True`` reuse the outputs of earlier executions with the same inputs and
+``cache_version``, when :py:attr:`flytekit.configuration.sdk.LOCAL_CACHE_ENABLED` is set. This mimics the caching
+done by Flyte, so iterating on a pipeline locally does not recompute expensive upstream tasks.
+
+Every cached execution is stored in a directory of :py:attr:`flytekit.configuration.sdk.LOCAL_CACHE_DIR`, holding the
+output literals along with a copy of the files and directories they reference. Entries are evicted, least recently
+used first, when the total size exceeds :py:attr:`flytekit.configuration.sdk.LOCAL_CACHE_MAX_BYTES`. Use
+``pyflyte local-cache`` to inspect or clear the cache.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+from flyteidl.core import literals_pb2 as _literals_pb2
+
+from flytekit.common import utils as _common_utils
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.local_objects import LocalObjectTable
+from flytekit.loggers import logger
+from flytekit.models.literals import LiteralMap
+
+_OUTPUTS_FILE_NAME = "outputs.pb"
+_METADATA_FILE_NAME = "metadata.json"
+_DATA_DIR_NAME = "data"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CacheEntry(object):
+    """
+    Describes an entry of the local cache
+    """
+
+    key: str
+    task_name: str
+    cache_version: str
+    created_at: float
+    last_used_at: float
+    bytes: int
+
+
+def _is_local(uri: str) -> bool:
+    return "://" not in uri
+
+
+def _hash_path(path: str) -> str:
+    """
+    Hashes the content of a file, or the names and content of all the files in a directory
+    """
+    h = hashlib.sha256()
+    if os.path.isdir(path):
+        files = []
+        for root, _, names in os.walk(path):
+            files.extend(os.path.join(root, n) for n in names)
+        paths = sorted(files)
+    else:
+        paths = [path]
+    for p in paths:
+        h.update(os.path.relpath(p, path).encode("utf-8"))
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _referenced_uris(literal: _literals_pb2.Literal) -> typing.Iterator[typing.Tuple[typing.Any, str]]:
+    """
+    Yields (message, uri) for every blob and schema in the literal, where message is the protobuf holding the uri
+    """
+    kind = literal.WhichOneof("value")
+    if kind == "scalar":
+        scalar_kind = literal.scalar.WhichOneof("value")
+        if scalar_kind == "blob":
+            yield literal.scalar.blob, literal.scalar.blob.uri
+        elif scalar_kind == "schema":
+            yield literal.scalar.schema, literal.scalar.schema.uri
+    elif kind == "collection":
+        for lit in literal.collection.literals:
+            yield from _referenced_uris(lit)
+    elif kind == "map":
+        for lit in literal.map.literals.values():
+            yield from _referenced_uris(lit)
+
+
+def _materialize(ctx: FlyteContext, uri: str):
+    # Values kept in memory by a local workflow execution have to be written before they can be hashed or copied
+    objects = LocalObjectTable.current(ctx)
+    if objects is not None:
+        objects.materialize(uri)
+
+
+def hash_literal_map(ctx: FlyteContext, lm: LiteralMap) -> str:
+    """
+    Returns a hash of the literal map that does not depend on where the files it references are stored: blobs and
+    schemas stored locally are hashed by content. Remote ones are hashed by uri, which is unique for every output
+    written by Flyte.
+    """
+    pb = lm.to_flyte_idl()
+    for literal in pb.literals.values():
+        for msg, uri in _referenced_uris(literal):
+            _materialize(ctx, uri)
+            if _is_local(uri) and os.path.exists(uri):
+                msg.uri = f"sha256:{_hash_path(uri)}"
+    return hashlib.sha256(pb.SerializeToString(deterministic=True)).hexdigest()
+
+
+class LocalTaskCache(object):
+    """
+    A cache of task outputs on local disk, see the module documentation
+    """
+
+    # Serializes writes and evictions within the process, entries are moved into place atomically
+    _lock = threading.Lock()
+
+    def __init__(self, directory: typing.Optional[str] = None, max_bytes: typing.Optional[int] = None):
+        self._directory = directory or _sdk_config.LOCAL_CACHE_DIR.get() or os.path.join(
+            _sdk_config.LOCAL_SANDBOX.get(), "local_cache"
+        )
+        self._max_bytes = _sdk_config.LOCAL_CACHE_MAX_BYTES.get() if max_bytes is None else max_bytes
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @staticmethod
+    def key(ctx: FlyteContext, task_name: str, cache_version: str, inputs: LiteralMap) -> str:
+        h = hashlib.sha256()
+        for part in (task_name, cache_version, hash_literal_map(ctx, inputs)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    def get(self, ctx: FlyteContext, key: str) -> typing.Optional[LiteralMap]:
+        """
+        Returns the cached outputs for the key, or None. The files the outputs reference are copied out of the cache,
+        so the entry can be evicted while the outputs are in use.
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            outputs_path = os.path.join(entry_dir, _OUTPUTS_FILE_NAME)
+            pb = _common_utils.load_proto_from_file(_literals_pb2.LiteralMap, outputs_path)
+            os.utime(os.path.join(entry_dir, _METADATA_FILE_NAME))
+            for literal in pb.literals.values():
+                for msg, uri in _referenced_uris(literal):
+                    if uri.startswith(entry_dir + os.sep):
+                        msg.uri = self._copy_out(ctx, uri)
+        except (OSError, ValueError) as e:
+            # Missing, or evicted (e.g. by another process) while it was being read
+            logger.debug(f"Local cache miss for {key}: {e}")
+            return None
+        return LiteralMap.from_flyte_idl(pb)
+
+    @staticmethod
+    def _copy_out(ctx: FlyteContext, path: str) -> str:
+        if os.path.isdir(path):
+            target = ctx.file_access.get_random_remote_directory()
+            ctx.file_access.put_data(path, target, is_multipart=True)
+        else:
+            target = ctx.file_access.get_random_remote_path(path)
+            ctx.file_access.put_data(path, target)
+        return target
+
+    def put(self, ctx: FlyteContext, key: str, task_name: str, cache_version: str, outputs: LiteralMap):
+        """
+        Stores the outputs, along with a copy of the local files and directories they reference
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        staging = os.path.join(self._directory, f".{key}.{os.getpid()}.{threading.get_ident()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        data_dir = os.path.join(staging, _DATA_DIR_NAME)
+        os.makedirs(data_dir)
+        try:
+            pb = outputs.to_flyte_idl()
+            for i, (msg, uri) in enumerate(u for lit in pb.literals.values() for u in _referenced_uris(lit)):
+                _materialize(ctx, uri)
+                if not _is_local(uri) or not os.path.exists(uri):
+                    continue
+                target = os.path.join(data_dir, str(i), os.path.basename(uri.rstrip(os.sep)) or "data")
+                if os.path.isdir(uri):
+                    shutil.copytree(uri, target)
+                else:
+                    os.makedirs(os.path.dirname(target))
+                    shutil.copy2(uri, target)
+                msg.uri = os.path.join(self._entry_dir(key), os.path.relpath(target, staging))
+            _common_utils.write_proto_to_file(pb, os.path.join(staging, _OUTPUTS_FILE_NAME))
+            now = time.time()
+            with open(os.path.join(staging, _METADATA_FILE_NAME), "w") as f:
+                json.dump({"task_name": task_name, "cache_version": cache_version, "created_at": now}, f)
+            with self._lock:
+                shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+                os.replace(staging, self._entry_dir(key))
+                self.evict()
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def entries(self) -> typing.List[CacheEntry]:
+        """
+        Returns the entries of the cache, most recently used first
+        """
+        entries = []
+        if not os.path.isdir(self._directory):
+            return entries
+        for key in os.listdir(self._directory):
+            metadata_path = os.path.join(self._entry_dir(key), _METADATA_FILE_NAME)
+            if key.startswith(".") or not os.path.exists(metadata_path):
+                continue
+            try:
+                with open(metadata_path) as f:
+                    metadata = json.load(f)
+                size = 0
+                for root, _, names in os.walk(self._entry_dir(key)):
+                    size += sum(os.path.getsize(os.path.join(root, n)) for n in names)
+                entries.append(
+                    CacheEntry(
+                        key=key,
+                        task_name=metadata["task_name"],
+                        cache_version=metadata["cache_version"],
+                        created_at=metadata["created_at"],
+                        last_used_at=os.path.getmtime(metadata_path),
+                        bytes=size,
+                    )
+                )
+            except (OSError, ValueError, KeyError):
+                # Removed or being replaced concurrently
+                continue
+        return sorted(entries, key=lambda e: e.last_used_at, reverse=True)
+
+    def evict(self, max_bytes: typing.Optional[int] = None) -> typing.List[CacheEntry]:
+        """
+        Removes the least recently used entries until the cache is at most max_bytes (by default the configured
+        maximum) in size, and returns the removed entries. A maximum of 0 or less means the cache is unbounded.
+        """
+        max_bytes = self._max_bytes if max_bytes is None else max_bytes
+        if max_bytes <= 0:
+            return []
+        entries = self.entries()
+        total = sum(e.bytes for e in entries)
+        removed = []
+        while entries and total > max_bytes:
+            e = entries.pop()
+            shutil.rmtree(self._entry_dir(e.key), ignore_errors=True)
+            total -= e.bytes
+            removed.append(e)
+        if removed:
+            logger.info(f"Evicted {len(removed)} entries from the local cache {self._directory}")
+        return removed
+
+    def clear(self, task_name: typing.Optional[str] = None) -> typing.List[CacheEntry]:
+        """
+        Removes all the entries, or only those of the given task, and returns them
+        """
+        removed = [e for e in self.entries() if task_name is None or e.task_name == task_name]
+        for e in removed:
+            shutil.rmtree(self._entry_dir(e.key), ignore_errors=True)
+        return removed
+
+
+def cached_dispatch_execute(
+    ctx: FlyteContext, task: typing.Any, input_literal_map: LiteralMap, dispatch: typing.Callable[[], typing.Any]
+) -> typing.Any:
+    """
+    Calls dispatch, unless the local cache holds the outputs of an earlier execution of the task with the same inputs
+    and cache version. Only tasks with ``cache=True`` are cached, and only if the local cache is enabled.
+    """
+    if not task.metadata.cache or not _sdk_config.LOCAL_CACHE_ENABLED.get():
+        return dispatch()
+    cache = LocalTaskCache()
+    key = LocalTaskCache.key(ctx, task.name, task.metadata.cache_version, input_literal_map)
+    outputs = cache.get(ctx, key)
+    if outputs is not None:
+        logger.info(f"Using the cached outputs of {task.name} (version {task.metadata.cache_version})")
+        return outputs
+    outputs = dispatch()
+    if isinstance(outputs, LiteralMap):
+        cache.put(ctx, key, task.name, task.metadata.cache_version, outputs)
+    return outputs
@@ -0,0 +1,126 @@
+"""
+When :py:attr:`flytekit.configuration.sdk.LOCAL_OBJECT_PASSTHROUGH` is enabled, local workflow executions keep the
+python values of outputs that would otherwise be written to files (e.g. dataframes) in memory. The literal that stands
+for such a value has a uri like any other, but nothing is written to it. Consumers in the same execution get the python
+value back from memory, and the value is only serialized to its uri when it is needed in another form, for example when
+a pandas DataFrame output is consumed as a FlyteSchema.
+"""
+import threading
+import typing
+
+from flytekit.core.context_manager import ExecutionState, FlyteContext
+from flytekit.loggers import logger
+from flytekit.models.literals import Literal
+
+LOCAL_OBJECTS_KEY = "local_objects"
+"""
+Key of the :py:class:`LocalObjectTable` in the additional context of the execution state
+"""
+
+
+class _Entry(object):
+    def __init__(
+        self,
+        value: typing.Any,
+        python_type: type,
+        write: typing.Callable[[], None],
+        copy: typing.Optional[typing.Callable[[typing.Any], typing.Any]],
+    ):
+        self.value = value
+        self.python_type = python_type
+        self.write = write
+        self.copy = copy
+        self.written = False
+
+
+class LocalObjectTable(object):
+    """
+    Holds the python values of the outputs of a local workflow execution, keyed by the uri of their literal.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: typing.Dict[str, _Entry] = {}
+
+    @staticmethod
+    def current(ctx: FlyteContext) -> typing.Optional["LocalObjectTable"]:
+        """
+        Returns the table of the local workflow execution of the given context, or None if there is none or it has
+        not enabled pass-through.
+        """
+        state = ctx.execution_state
+        if state is None or state.mode != ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION or not state.additional_context:
+            return None
+        return state.additional_context.get(LOCAL_OBJECTS_KEY)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri.rstrip("/") in self._entries
+
+    def put(
+        self,
+        uri: str,
+        value: typing.Any,
+        python_type: type,
+        write: typing.Callable[[], None],
+        copy: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    ):
+        """
+        Records the python value that the literal with the given uri stands for, instead of writing it.
+
+        :param write: Writes the value to the uri, called if the value is ever needed in serialized form
+        :param copy: Returns a copy of the value that consumers can mutate without affecting each other, mutable values
+            should always provide one
+        """
+        with self._lock:
+            self._entries[uri.rstrip("/")] = _Entry(value, python_type, write, copy)
+
+    def get(self, lv: Literal, python_type: type) -> typing.Tuple[bool, typing.Any]:
+        """
+        Returns (True, value) if the literal stands for a value in the table that was produced as the requested python
+        type. Otherwise makes sure the data of the literal was written (if it is in the table), so that it can be read
+        the regular way, and returns (False, None).
+        """
+        uri = _literal_uri(lv)
+        if uri is None:
+            return False, None
+        entry = self._entries.get(uri.rstrip("/"))
+        if entry is None:
+            return False, None
+        if entry.python_type is python_type:
+            return True, entry.copy(entry.value) if entry.copy else entry.value
+        self.materialize(uri)
+        return False, None
+
+    def discard(self, uri: str):
+        """
+        Drops the value of the given uri, once no literal that stands for it is in use anymore
+        """
+        with self._lock:
+            self._entries.pop(uri.rstrip("/"), None)
+
+    def materialize(self, uri: str):
+        """
+        Writes the value of the given uri, if it was not written yet
+        """
+        entry = self._entries.get(uri.rstrip("/"))
+        if entry is None:
+            return
+        with self._lock:
+            if entry.written:
+                return
+            logger.debug(f"Writing in-memory value of {uri}, as it was requested as a different type")
+            entry.write()
+            entry.written = True
+
+
+def _literal_uri(lv: Literal) -> typing.Optional[str]:
+    if lv is None or lv.scalar is None:
+        return None
+    if lv.scalar.schema is not None:
+        return lv.scalar.schema.uri
+    if lv.scalar.blob is not None:
+        return lv.scalar.blob.uri
+    return None
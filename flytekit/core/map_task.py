@@ -13,7 +13,9 @@ from flytekit.common.exceptions import scopes as exception_scopes
 from flytekit.core.base_task import PythonTask
 from flytekit.core.context_manager import ExecutionState, FlyteContext, FlyteContextManager, SerializationSettings
 from flytekit.core.interface import transform_interface_to_list_interface
+from flytekit.core.promise import Promise
 from flytekit.core.python_function_task import PythonFunctionTask
+from flytekit.core.type_engine import LazyList, ListTransformer
 from flytekit.models.array_job import ArrayJob
 from flytekit.models.interface import Variable
 from flytekit.models.task import Container, K8sPod
@@ -66,6 +68,23 @@ class MapPythonTask(PythonTask):
             task_type_version=1,
             **kwargs,
         )
+        if self.metadata.compact_lists:
+            raise ValueError("Map tasks cannot pack their outputs, the array plugin expects a collection of literals")
+
+    def compile(self, ctx: FlyteContext, *args, **kwargs):
+        """
+        Rejects inputs produced by tasks that pack their output lists, because the array plugin cannot split a packed
+        list into the inputs of the individual instances.
+        """
+        for k, v in kwargs.items():
+            if isinstance(v, Promise) and not v.is_ready:
+                upstream = v.ref.node.flyte_entity
+                if isinstance(upstream, PythonTask) and upstream.metadata.compact_lists:
+                    raise ValueError(
+                        f"Input {k} of {self.name} is an output of {upstream.name}, which packs its output lists with"
+                        f" compact_lists=True. Map task inputs must not be packed."
+                    )
+        return super().compile(ctx, *args, **kwargs)
 
     def get_command(self, settings: SerializationSettings) -> List[str]:
         container_args = [
@@ -146,6 +165,17 @@ class MapPythonTask(PythonTask):
             return self.interface.outputs
         return self._run_task.interface.outputs
 
+    def get_input_types(self) -> Optional[Dict[str, type]]:
+        """
+        We override this method from PythonTask because each instance of an array task only uses a single element of
+        every input collection. Converting the inputs to lazy lists during platform executions avoids converting all
+        the other elements.
+        """
+        ctx = FlyteContextManager.current_context()
+        if ctx.execution_state is not None and ctx.execution_state.mode == ExecutionState.Mode.TASK_EXECUTION:
+            return {k: LazyList[ListTransformer.get_sub_type(v)] for k, v in self._python_interface.inputs.items()}
+        return self._python_interface.inputs
+
     def get_type_for_output_var(self, k: str, v: Any) -> Optional[Type[Any]]:
         """
         We override this method from flytekit.core.base_task Task because the dispatch_execute method uses this
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import collections
 import typing
+import weakref
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Protocol
 
 from flytekit.common import constants as _common_constants
 from flytekit.common.exceptions import user as _user_exceptions
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core import context_manager as _flyte_context
 from flytekit.core import interface as flyte_interface
 from flytekit.core import type_engine
@@ -317,15 +319,33 @@ class Promise(object):
         self._var = var
         self._promise_ready = True
         self._val = val
+        self._native = None
+        self._to_literal = None
         if val and isinstance(val, NodeOutput):
             self._ref = val
             self._promise_ready = False
             self._val = None
 
+    @classmethod
+    def from_native(
+        cls, var: str, python_val: Any, python_type: type, to_literal: Callable[[], _literal_models.Literal]
+    ) -> Promise:
+        """
+        Creates a ready promise for a python value of a lossless type (see
+        :py:meth:`flytekit.core.type_engine.TypeEngine.is_lossless`), which is only converted to a literal, by calling
+        to_literal, if the literal is asked for. Used by fast local executions.
+        """
+        p = cls(var, None)
+        p._native = (python_val, python_type)
+        p._to_literal = to_literal
+        return p
+
     def __hash__(self):
         return hash(id(self))
 
     def with_var(self, new_var: str) -> Promise:
+        if self._native is not None and self._val is None:
+            return Promise.from_native(new_var, self._native[0], self._native[1], self._to_literal)
         if self.is_ready:
             return Promise(var=new_var, val=self.val)
         return Promise(var=new_var, val=self.ref)
@@ -349,8 +369,17 @@ class Promise(object):
         """
         If the promise is ready then this holds the actual evaluate value in Flyte's type system
         """
+        if self._val is None and self._to_literal is not None:
+            self._val = self._to_literal()
         return self._val
 
+    @property
+    def native(self) -> Optional[Tuple[Any, type]]:
+        """
+        The python value and type of promises created with :py:meth:`from_native`, None otherwise
+        """
+        return self._native
+
     @property
     def ref(self) -> NodeOutput:
         """
@@ -366,7 +395,7 @@ class Promise(object):
         return self._var
 
     def eval(self) -> Any:
-        if not self._promise_ready or self._val is None:
+        if not self._promise_ready or self.val is None:
             raise ValueError("Cannot Eval with incomplete promises")
         if self.val.scalar is None or self.val.scalar.primitive is None:
             raise ValueError("Eval can be invoked for primitive types only")
@@ -420,13 +449,25 @@ class Promise(object):
 
     def __repr__(self):
         if self._promise_ready:
-            return f"Resolved({self._var}={self._val})"
+            return f"Resolved({self._var}={self._val if self._native is None else self._native[0]})"
         return f"Promise(node:{self.ref.node_id}.{self._var})"
 
     def __str__(self):
         return str(self.__repr__())
 
 
+def promise_to_python_value(ctx: FlyteContext, p: Promise, python_type: type) -> Any:
+    """
+    Returns the python value of a ready promise, which is a copy of the value itself for promises created by fast local
+    executions, if they hold a value of the requested type.
+    """
+    if p.native is not None and p.native[1] == python_type:
+        passed, v = TypeEngine.native_passthrough(p.native[0], python_type)
+        if passed:
+            return v
+    return TypeEngine.to_python_value(ctx, p.val, python_type)
+
+
 def create_native_named_tuple(
     ctx: FlyteContext, promises: Union[Promise, typing.List[Promise]], entity_interface: Interface
 ) -> Optional[Tuple]:
@@ -443,7 +484,7 @@ def create_native_named_tuple(
 
     if isinstance(promises, Promise):
         v = [v for k, v in entity_interface.outputs.items()][0]  # get output native type
-        return TypeEngine.to_python_value(ctx, promises.val, v)
+        return promise_to_python_value(ctx, promises, v)
 
     if len(promises) == 0:
         return None
@@ -459,7 +500,7 @@ def create_native_named_tuple(
                 "Workflow outputs can only be promises that are returned by tasks. Found a value of"
                 f"type {type(p)}. Workflows cannot return local variables or constants."
             )
-        outputs[p.var] = TypeEngine.to_python_value(ctx, p.val, entity_interface.outputs[p.var])
+        outputs[p.var] = promise_to_python_value(ctx, p, entity_interface.outputs[p.var])
 
     # Should this class be part of the Interface?
     t = collections.namedtuple(named_tuple_name, list(outputs.keys()))
@@ -718,6 +759,20 @@ class SupportsNodeCreation(Protocol):
         ...
 
 
+# Typed interfaces of the entities that nodes were created for, so they are not recomputed for every node. They are
+# keyed on the settings that literal types depend on as well, so changing those settings is never ignored
+_typed_interfaces: "weakref.WeakKeyDictionary[Interface, Dict[Tuple, _interface_models.TypedInterface]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _literal_type_settings() -> Tuple:
+    """
+    Returns the settings that the literal types of python types may depend on, e.g. the format of dataframes
+    """
+    return (_sdk_config.DATAFRAME_FORMAT.get(),)
+
+
 def create_and_link_node(
     ctx: FlyteContext,
     entity: SupportsNodeCreation,
@@ -733,7 +788,12 @@ def create_and_link_node(
     bindings = []
 
     interface = entity.python_interface
-    typed_interface = flyte_interface.transform_interface_to_typed_interface(interface)
+    settings = _literal_type_settings()
+    typed_interfaces = _typed_interfaces.setdefault(interface, {})
+    typed_interface = typed_interfaces.get(settings)
+    if typed_interface is None:
+        typed_interface = flyte_interface.transform_interface_to_typed_interface(interface)
+        typed_interfaces[settings] = typed_interface
     # Mypy needs some extra help to believe that `typed_interface` will not be `None`
     assert typed_interface is not None
 
@@ -766,12 +826,10 @@ def create_and_link_node(
     # Detect upstream nodes
     # These will be our core Nodes until we can amend the Promise to use NodeOutputs that reference our Nodes
     upstream_nodes = list(
-        set(
-            [
-                input_val.ref.node
-                for input_val in kwargs.values()
-                if isinstance(input_val, Promise) and input_val.ref.node_id != _common_constants.GLOBAL_INPUT_NODE_ID
-            ]
+        dict.fromkeys(
+            input_val.ref.node
+            for input_val in kwargs.values()
+            if isinstance(input_val, Promise) and input_val.ref.node_id != _common_constants.GLOBAL_INPUT_NODE_ID
         )
     )
 
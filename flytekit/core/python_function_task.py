@@ -14,12 +14,14 @@
 """
 
 
+import contextlib
 import inspect
 from abc import ABC
 from collections import OrderedDict
 from enum import Enum
 from typing import Any, Callable, List, Optional, TypeVar, Union
 
+from flytekit.common import utils as _common_utils
 from flytekit.common.exceptions import scopes as exception_scopes
 from flytekit.core.base_task import Task, TaskResolverMixin
 from flytekit.core.context_manager import ExecutionState, FastSerializationSettings, FlyteContext, FlyteContextManager
@@ -42,6 +44,11 @@ from flytekit.models.admin import workflow as admin_workflow_models
 T = TypeVar("T")
 
 
+def _stats(ctx: FlyteContext):
+    params = ctx.execution_state.user_space_params if ctx.execution_state else None
+    return params.stats if params is not None else None
+
+
 class PythonInstanceTask(PythonAutoContainerTask[T], ABC):
     """
     This class should be used as the base class for all Tasks that do not have a user defined function body, but have
@@ -172,7 +179,9 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
         else:
             cs = ctx.compilation_state.with_params(prefix="dynamic")
 
-        with FlyteContextManager.with_context(ctx.with_compilation_state(cs)):
+        with FlyteContextManager.with_context(
+            ctx.with_compilation_state(cs)
+        ), _common_utils.DeferredFullGarbageCollection():
             # TODO: Resolve circular import
             from flytekit.common.translator import get_serializable
 
@@ -182,16 +191,18 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
             )
 
             self._wf = PythonFunctionWorkflow(task_function, metadata=workflow_metadata, default_metadata=defaults)
-            self._wf.compile(**kwargs)
-
-            wf = self._wf
-            model_entities = OrderedDict()
-            # See comment on reference entity checking a bit down below in this function.
-            # This is the only circular dependency between the translator.py module and the rest of the flytekit
-            # authoring experience.
-            workflow_spec: admin_workflow_models.WorkflowSpec = get_serializable(
-                model_entities, ctx.serialization_settings, wf
-            )
+            stats = _stats(ctx)
+            with stats.timer("dynamic.compile") if stats is not None else contextlib.nullcontext():
+                self._wf.compile(**kwargs)
+
+                wf = self._wf
+                model_entities = OrderedDict()
+                # See comment on reference entity checking a bit down below in this function.
+                # This is the only circular dependency between the translator.py module and the rest of the flytekit
+                # authoring experience.
+                workflow_spec: admin_workflow_models.WorkflowSpec = get_serializable(
+                    model_entities, ctx.serialization_settings, wf
+                )
 
             # If no nodes were produced, let's just return the strict outputs
             if len(workflow_spec.template.nodes) == 0:
@@ -201,8 +212,9 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
                     }
                 )
 
-            # Gather underlying TaskTemplates that get referenced.
-            tts = []
+            # Gather underlying TaskTemplates that get referenced. Distinct task objects can serialize to the same
+            # template, e.g. a map task created in a loop, so they are deduplicated by id.
+            templates = OrderedDict()
             for entity, model in model_entities.items():
                 # We only care about gathering tasks here. Launch plans are handled by
                 # propeller. Subworkflows should already be in the workflow spec.
@@ -222,7 +234,8 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
 
                 # Store the valid task template so that we can pass it to the
                 # DynamicJobSpec later
-                tts.append(model.template)
+                templates.setdefault(model.template.id, model.template)
+            tts = list(templates.values())
 
             if ctx.serialization_settings.should_fast_serialize():
                 if (
@@ -235,17 +248,14 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
                         "distribution could be retrieved"
                     )
                 logger.warn(f"ctx.execution_state.additional_context {ctx.execution_state.additional_context}")
+                replacements = {
+                    "{{ .remote_package_path }}": ctx.execution_state.additional_context.get("dynamic_addl_distro"),
+                    "{{ .dest_dir }}": ctx.execution_state.additional_context.get("dynamic_dest_dir", "."),
+                }
                 for task_template in tts:
-                    sanitized_args = []
-                    for arg in task_template.container.args:
-                        if arg == "{{ .remote_package_path }}":
-                            sanitized_args.append(ctx.execution_state.additional_context.get("dynamic_addl_distro"))
-                        elif arg == "{{ .dest_dir }}":
-                            sanitized_args.append(ctx.execution_state.additional_context.get("dynamic_dest_dir", "."))
-                        else:
-                            sanitized_args.append(arg)
-                    del task_template.container.args[:]
-                    task_template.container.args.extend(sanitized_args)
+                    if task_template.container is None:
+                        continue
+                    task_template.container.args[:] = [replacements.get(a, a) for a in task_template.container.args]
 
             dj_spec = _dynamic_job.DynamicJobSpec(
                 min_successes=len(workflow_spec.template.nodes),
@@ -254,6 +264,13 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
                 outputs=workflow_spec.template.outputs,
                 subworkflows=workflow_spec.sub_workflows,
             )
+            logger.info(
+                f"Compiled dynamic workflow {wf.name} into {len(dj_spec.nodes)} nodes, {len(tts)} tasks and"
+                f" {len(dj_spec.subworkflows)} sub-workflows"
+            )
+            if stats is not None:
+                stats.gauge("dynamic.nodes", len(dj_spec.nodes))
+                stats.gauge("dynamic.tasks", len(tts))
 
             return dj_spec
 
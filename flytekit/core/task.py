@@ -87,6 +87,8 @@ def task(
     limits: Optional[Resources] = None,
     secret_requests: Optional[List[Secret]] = None,
     execution_mode: Optional[PythonFunctionTask.ExecutionBehavior] = PythonFunctionTask.ExecutionBehavior.DEFAULT,
+    offload_outputs: bool = False,
+    compact_lists: bool = False,
 ) -> Union[Callable, PythonFunctionTask]:
     """
     This is the core decorator to use for any task type in flytekit.
@@ -170,6 +172,14 @@ def task(
                      Refer to :py:class:`Secret` to understand how to specify the request for a secret. It
                      may change based on the backend provider.
     :param execution_mode: This is mainly for internal use. Please ignore. It is filled in automatically.
+    :param offload_outputs: Replace outputs larger than the configured ``sdk.literal_offload_threshold`` with a
+                    reference to a blob holding them. The references do not match the declared output types, so only
+                    flytekit tasks can consume them: do not enable this for outputs read by Flyte itself (e.g. in
+                    conditions or map tasks), by the UI or by other SDKs.
+    :param compact_lists: Encode output lists of ints, floats, bools or strs with at least the configured
+                    ``sdk.compact_list_threshold`` entries as a single packed binary literal. Like offloaded outputs,
+                    the packed lists can only be consumed by flytekit tasks: they cannot be inputs to map tasks, and
+                    cannot be read in conditions, by the UI or by other SDKs.
     """
 
     def wrapper(fn) -> PythonFunctionTask:
@@ -180,6 +190,8 @@ def task(
             interruptible=interruptible,
             deprecated=deprecated,
             timeout=timeout,
+            offload_outputs=offload_outputs,
+            compact_lists=compact_lists,
         )
 
         task_instance = TaskPlugins.find_pythontask_plugin(type(task_config))(
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import copy
 import dataclasses
 import datetime as _datetime
 import enum
+import functools
 import json as _json
 import mimetypes
 import os
@@ -20,12 +24,24 @@ from google.protobuf.struct_pb2 import Struct
 from marshmallow_jsonschema import JSONSchema
 
 from flytekit.common.types import primitives as _primitives
-from flytekit.core.context_manager import FlyteContext
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core import literal_offloading as _literal_offloading
+from flytekit.core.context_manager import FlyteContext, FlyteContextManager
+from flytekit.core.local_objects import LocalObjectTable
 from flytekit.loggers import logger
 from flytekit.models import interface as _interface_models
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
-from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralCollection, LiteralMap, Primitive, Scalar
+from flytekit.models.literals import (
+    Binary,
+    Blob,
+    BlobMetadata,
+    Literal,
+    LiteralCollection,
+    LiteralMap,
+    Primitive,
+    Scalar,
+)
 from flytekit.models.types import LiteralType, SimpleType
 
 T = typing.TypeVar("T")
@@ -36,10 +52,11 @@ class TypeTransformer(typing.Generic[T]):
     Base transformer type that should be implemented for every python native type that can be handled by flytekit
     """
 
-    def __init__(self, name: str, t: Type[T], enable_type_assertions: bool = True):
+    def __init__(self, name: str, t: Type[T], enable_type_assertions: bool = True, thread_safe: bool = True):
         self._t = t
         self._name = name
         self._type_assertions_enabled = enable_type_assertions
+        self._thread_safe = thread_safe
 
     @property
     def name(self):
@@ -59,6 +76,14 @@ class TypeTransformer(typing.Generic[T]):
         """
         return self._type_assertions_enabled
 
+    @property
+    def thread_safe(self) -> bool:
+        """
+        Indicates if values of this type may be converted concurrently with values of other variables. Transformers
+        that share state across calls without synchronizing should pass ``thread_safe=False``.
+        """
+        return self._thread_safe
+
     @abstractmethod
     def get_literal_type(self, t: Type[T]) -> LiteralType:
         """
@@ -72,6 +97,14 @@ class TypeTransformer(typing.Generic[T]):
         """
         raise ValueError("By default, transformers do not translate from Flyte types back to Python types")
 
+    def reversible_literal_type_kinds(self) -> typing.Optional[typing.Set[typing.Hashable]]:
+        """
+        Returns the kinds of LiteralTypes (see :py:func:`literal_type_kind`) that ``guess_python_type`` may be able to
+        reverse. The TypeEngine only asks this transformer to reverse LiteralTypes of these kinds. The default of None
+        means that any kind of LiteralType may be reversible.
+        """
+        return None
+
     @abstractmethod
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         """
@@ -105,6 +138,26 @@ class TypeTransformer(typing.Generic[T]):
         return str(self.__repr__())
 
 
+def literal_type_kind(lt: LiteralType) -> typing.Optional[typing.Hashable]:
+    """
+    Returns a key for the variant of the given LiteralType, that is used to index the transformers that can reverse it.
+    Simple types are keyed by the simple type and blobs by their dimensionality.
+    """
+    if lt.simple is not None:
+        return "simple", lt.simple
+    if lt.blob is not None:
+        return "blob", lt.blob.dimensionality
+    if lt.schema is not None:
+        return "schema"
+    if lt.collection_type is not None:
+        return "collection"
+    if lt.map_value_type is not None:
+        return "map"
+    if lt.enum_type is not None:
+        return "enum"
+    return None
+
+
 class SimpleTransformer(TypeTransformer[T]):
     """
     A Simple implementation of a type transformer that uses simple lambdas to transform and reduces boilerplate
@@ -132,6 +185,9 @@ class SimpleTransformer(TypeTransformer[T]):
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
         return self._from_literal_transformer(lv)
 
+    def reversible_literal_type_kinds(self) -> typing.Optional[typing.Set[typing.Hashable]]:
+        return {literal_type_kind(self._lt)}
+
     def guess_python_type(self, literal_type: LiteralType) -> Type[T]:
         if literal_type.simple is not None and literal_type.simple == self._lt.simple:
             return self.python_type
@@ -154,6 +210,205 @@ class RestrictedType(TypeTransformer[T], ABC):
         raise RestrictedTypeError(f"Transformer for type {self.python_type} is restricted currently")
 
 
+def _set_struct_value(target: _struct.Value, v: typing.Any):
+    """
+    Fills the given ``struct_pb2.Value`` from a python value, without going through a JSON string. Raises a ValueError
+    for values that have no direct Struct representation, so that callers can fall back to JSON encoding.
+    """
+    if v is None:
+        target.null_value = _struct.NULL_VALUE
+    elif isinstance(v, bool):
+        # bool has to be checked before int, as bool is a subclass of int
+        target.bool_value = v
+    elif isinstance(v, str):
+        target.string_value = v
+    elif isinstance(v, (int, float)):
+        target.number_value = v
+    elif isinstance(v, dict):
+        target.struct_value.SetInParent()
+        _fill_struct(target.struct_value, v)
+    elif isinstance(v, (list, tuple)):
+        lv = target.list_value
+        lv.SetInParent()
+        for x in v:
+            _set_struct_value(lv.values.add(), x)
+    elif dataclasses.is_dataclass(v) and not isinstance(v, type):
+        target.struct_value.SetInParent()
+        _fill_struct_from_dataclass(target.struct_value, v)
+    else:
+        raise ValueError(f"Type {type(v)} cannot be directly converted to a Struct value")
+
+
+def _fill_struct(s: Struct, d: dict):
+    for k, v in d.items():
+        if not isinstance(k, str):
+            raise ValueError(f"Struct keys have to be strings, received {type(k)}")
+        _set_struct_value(s.fields[k], v)
+
+
+def _dict_to_struct(d: dict) -> Struct:
+    """
+    Builds a ``Struct`` directly from a python dictionary. Values that cannot be represented directly (for example
+    non-string keys or objects that need a custom json encoder) are handled by round-tripping through json instead.
+    """
+    s = Struct()
+    try:
+        _fill_struct(s, d)
+    except ValueError:
+        s = _json_format.Parse(_json.dumps(d), _struct.Struct())
+    return s
+
+
+def _struct_value_to_python(v: _struct.Value) -> typing.Any:
+    kind = v.WhichOneof("kind")
+    if kind == "struct_value":
+        return _struct_to_dict(v.struct_value)
+    if kind == "list_value":
+        return [_struct_value_to_python(x) for x in v.list_value.values]
+    if kind == "number_value":
+        return v.number_value
+    if kind == "string_value":
+        return v.string_value
+    if kind == "bool_value":
+        return v.bool_value
+    return None
+
+
+def _struct_to_dict(s: Struct) -> dict:
+    """
+    Reads a ``Struct`` into a python dictionary directly. Numbers are always returned as floats, same as they would be
+    when reading the json representation of the Struct.
+    """
+    return {k: _struct_value_to_python(v) for k, v in s.fields.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_field_types(t: type) -> typing.Dict[str, type]:
+    try:
+        hints = typing.get_type_hints(t)
+    except Exception:
+        hints = {}
+    return {f.name: hints.get(f.name, f.type) for f in dataclasses.fields(t)}
+
+
+def _restore_ints(v: typing.Any, t: type) -> typing.Any:
+    """
+    Protobuf Struct does not support explicit int types, int types are upconverted to a double value
+    https://developers.google.com/protocol-buffers/docs/reference/google.protobuf#google.protobuf.Value
+    Thus we walk the given value alongside its declared type and typecast values to int, where expected. This
+    descends into nested dataclasses, lists, dicts and optionals.
+    """
+    if v is None:
+        return v
+    if t is int:
+        return int(v) if isinstance(v, float) else v
+    if dataclasses.is_dataclass(t):
+        if isinstance(v, dict):
+            for name, ft in _dataclass_field_types(t).items():
+                if name in v:
+                    v[name] = _restore_ints(v[name], ft)
+        return v
+    origin = getattr(t, "__origin__", None)
+    args = getattr(t, "__args__", None)
+    if not args:
+        return v
+    if origin is list and isinstance(v, list):
+        return [_restore_ints(x, args[0]) for x in v]
+    if origin is dict and isinstance(v, dict) and len(args) == 2:
+        return {k: _restore_ints(x, args[1]) for k, x in v.items()}
+    if origin is typing.Union:
+        non_none = [a for a in args if a is not type(None)]  # noqa: E721
+        if len(non_none) == 1:
+            return _restore_ints(v, non_none[0])
+    return v
+
+
+_DIRECT_LEAF_TYPES = (int, float, str, bool, type(None), dict, list, typing.Any)
+_DIRECT_DATACLASS_FIELDS: typing.Dict[type, typing.Optional[typing.Dict[str, type]]] = {}
+
+
+def _is_direct_struct_type(t: type) -> bool:
+    if t in _DIRECT_LEAF_TYPES:
+        return True
+    if dataclasses.is_dataclass(t):
+        return _direct_dataclass_fields(t) is not None
+    origin = getattr(t, "__origin__", None)
+    args = getattr(t, "__args__", None) or ()
+    if origin is list:
+        return len(args) == 0 or _is_direct_struct_type(args[0])
+    if origin is dict:
+        return len(args) == 0 or (args[0] is str and _is_direct_struct_type(args[1]))
+    if origin is typing.Union:
+        non_none = [a for a in args if a is not type(None)]  # noqa: E721
+        return len(non_none) == 1 and _is_direct_struct_type(non_none[0])
+    return False
+
+
+def _direct_dataclass_fields(t: type) -> typing.Optional[typing.Dict[str, type]]:
+    """
+    Returns the field types of a dataclass, if it can be converted to and from a Struct directly without going through
+    dataclass_json. This is the case when neither the class nor its fields use dataclass_json configuration (letter
+    case, custom encoders and decoders etc) and all fields are json primitives, nested dataclasses of the same kind or
+    lists, dicts and optionals of those. Returns None otherwise.
+    """
+    if t in _DIRECT_DATACLASS_FIELDS:
+        return _DIRECT_DATACLASS_FIELDS[t]
+    # Marks the type while its fields are inspected, so self referencing dataclasses are left to dataclass_json
+    _DIRECT_DATACLASS_FIELDS[t] = None
+    fields = None
+    dc_fields = dataclasses.fields(t)
+    if not getattr(t, "dataclass_json_config", None) and all(
+        f.init and "dataclasses_json" not in f.metadata for f in dc_fields
+    ):
+        try:
+            hints = typing.get_type_hints(t)
+            candidate = {f.name: hints[f.name] for f in dc_fields}
+            if all(_is_direct_struct_type(ft) for ft in candidate.values()):
+                fields = candidate
+        except Exception as e:
+            logger.debug(f"Dataclass {t} will be converted using dataclass_json, reason {e}")
+    _DIRECT_DATACLASS_FIELDS[t] = fields
+    return fields
+
+
+def _fill_struct_from_dataclass(s: Struct, o: typing.Any):
+    fields = _direct_dataclass_fields(type(o))
+    if fields is None:
+        raise ValueError(f"Dataclass {type(o)} cannot be directly converted to a Struct")
+    for name in fields.keys():
+        _set_struct_value(s.fields[name], getattr(o, name))
+
+
+def _typed_struct_value_to_python(v: _struct.Value, t: type) -> typing.Any:
+    """
+    Reads a ``struct_pb2.Value`` guided by the expected python type, restoring ints and constructing nested dataclasses
+    on the way.
+    """
+    kind = v.WhichOneof("kind")
+    if kind is None or kind == "null_value":
+        return None
+    if t is int and kind == "number_value":
+        return int(v.number_value)
+    if kind == "struct_value" and dataclasses.is_dataclass(t):
+        return _struct_to_dataclass(v.struct_value, t)
+    args = getattr(t, "__args__", None)
+    if args:
+        origin = getattr(t, "__origin__", None)
+        if origin is list and kind == "list_value":
+            return [_typed_struct_value_to_python(x, args[0]) for x in v.list_value.values]
+        if origin is dict and kind == "struct_value":
+            return {k: _typed_struct_value_to_python(x, args[1]) for k, x in v.struct_value.fields.items()}
+        if origin is typing.Union:
+            non_none = [a for a in args if a is not type(None)]  # noqa: E721
+            return _typed_struct_value_to_python(v, non_none[0])
+    return _struct_value_to_python(v)
+
+
+def _struct_to_dataclass(s: Struct, t: type) -> typing.Any:
+    fields = _direct_dataclass_fields(t)
+    return t(**{k: _typed_struct_value_to_python(s.fields[k], ft) for k, ft in fields.items() if k in s.fields})
+
+
 class DataclassTransformer(TypeTransformer[object]):
     """
     The Dataclass Transformer, provides a type transformer for arbitrary Python dataclasses, that have
@@ -228,7 +483,16 @@ class DataclassTransformer(TypeTransformer[object]):
             raise AssertionError(
                 f"Dataclass {python_type} should be decorated with @dataclass_json to be " f"serialized correctly"
             )
-        return Literal(scalar=Scalar(generic=_json_format.Parse(python_val.to_json(), _struct.Struct())))
+        generic = Struct()
+        try:
+            if _direct_dataclass_fields(type(python_val)) is not None:
+                _fill_struct_from_dataclass(generic, python_val)
+            else:
+                _fill_struct(generic, python_val.to_dict())
+        except ValueError:
+            # Some field types (datetime, Enum, Decimal, etc) are only handled by dataclass_json's json encoder
+            generic = _json_format.Parse(python_val.to_json(), _struct.Struct())
+        return Literal(scalar=Scalar(generic=generic))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
         if not dataclasses.is_dataclass(expected_python_type):
@@ -241,14 +505,11 @@ class DataclassTransformer(TypeTransformer[object]):
                 f"Dataclass {expected_python_type} should be decorated with @dataclass_json to be "
                 f"serialized correctly"
             )
-        dc = expected_python_type.from_json(_json_format.MessageToJson(lv.scalar.generic))
-        # NOTE: Protobuf Struct does not support explicit int types, int types are upconverted to a double value
-        # https://developers.google.com/protocol-buffers/docs/reference/google.protobuf#google.protobuf.Value
-        # Thus we will have to walk the given dataclass and typecast values to int, where expected.
-        for f in dataclasses.fields(expected_python_type):
-            if f.type == int:
-                dc.__setattr__(f.name, int(dc.__getattribute__(f.name)))
-        return dc
+        if _direct_dataclass_fields(expected_python_type) is not None:
+            return _struct_to_dataclass(lv.scalar.generic, expected_python_type)
+        # Ints have to be restored before the dataclass is constructed, as nested dataclasses are built by from_dict
+        d = _restore_ints(_struct_to_dict(lv.scalar.generic), expected_python_type)
+        return expected_python_type.from_dict(d)
 
 
 class ProtobufTransformer(TypeTransformer[_proto_reflection.GeneratedProtocolMessageType]):
@@ -264,14 +525,31 @@ class ProtobufTransformer(TypeTransformer[_proto_reflection.GeneratedProtocolMes
     def get_literal_type(self, t: Type[T]) -> LiteralType:
         return LiteralType(simple=SimpleType.STRUCT, metadata={ProtobufTransformer.PB_FIELD_KEY: self.tag(t)})
 
+    @staticmethod
+    def binary_tag(t: Type[T]) -> str:
+        return f"{ProtobufTransformer.PB_FIELD_KEY}={ProtobufTransformer.tag(t)}"
+
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
+        if _sdk_config.PROTOBUF_BINARY_LITERALS.get():
+            return Literal(
+                scalar=Scalar(binary=Binary(value=python_val.SerializeToString(), tag=self.binary_tag(python_type)))
+            )
         struct = Struct()
         struct.update(_MessageToDict(python_val))
         return Literal(scalar=Scalar(generic=struct))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
+        if lv and lv.scalar and lv.scalar.binary:
+            if lv.scalar.binary.tag != self.binary_tag(expected_python_type):
+                raise AssertionError(
+                    f"Cannot convert binary literal tagged {lv.scalar.binary.tag} to {expected_python_type}"
+                )
+            pb_obj = expected_python_type()
+            pb_obj.ParseFromString(lv.scalar.binary.value)
+            return pb_obj
+
         if not (lv and lv.scalar and lv.scalar.generic):
-            raise AssertionError("Can only covert a generic literal to a Protobuf")
+            raise AssertionError("Can only covert a generic or binary literal to a Protobuf")
 
         pb_obj = expected_python_type()
         dictionary = _MessageToDict(lv.scalar.generic)
@@ -288,6 +566,13 @@ class TypeEngine(typing.Generic[T]):
 
     _REGISTRY: typing.Dict[type, TypeTransformer[T]] = {}
     _DATACLASS_TRANSFORMER: TypeTransformer = DataclassTransformer()
+    # Transformers that may reverse a kind of LiteralType and memoized results of guess_python_type, both are rebuilt
+    # whenever a transformer is registered
+    _REVERSE_INDEX: typing.Dict[typing.Hashable, typing.List[TypeTransformer]] = {}
+    _GUESSED_TYPES: typing.Dict[bytes, type] = {}
+    # Memoized results of is_lossless
+    _LOSSLESS: typing.Dict[typing.Hashable, bool] = {}
+    _LOSSLESS_PRIMITIVES = (int, float, str, bool)
 
     @classmethod
     def register(cls, transformer: TypeTransformer):
@@ -301,6 +586,8 @@ class TypeEngine(typing.Generic[T]):
                 f" Cannot override with {transformer.name}"
             )
         cls._REGISTRY[transformer.python_type] = transformer
+        cls._REVERSE_INDEX = {}
+        cls._GUESSED_TYPES = {}
 
     @classmethod
     def get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
@@ -374,6 +661,14 @@ class TypeEngine(typing.Generic[T]):
         """
         Converts a Literal value with an expected python type into a python value.
         """
+        if _literal_offloading.is_offloaded(lv):
+            lv = _literal_offloading.load_offloaded(ctx, lv)
+        objects = LocalObjectTable.current(ctx)
+        if objects is not None:
+            # In a local workflow execution, the value may have been kept in memory by the task that produced it
+            found, value = objects.get(lv, expected_python_type)
+            if found:
+                return value
         transformer = cls.get_transformer(expected_python_type)
         return transformer.to_python_value(ctx, lv, expected_python_type)
 
@@ -400,7 +695,131 @@ class TypeEngine(typing.Generic[T]):
                 f"Received more input values {len(lm.literals)}" f" than allowed by the input spec {len(python_types)}"
             )
 
-        return {k: TypeEngine.to_python_value(ctx, lm.literals[k], v) for k, v in python_types.items()}
+        return cls.convert_concurrently(
+            {k: (v, functools.partial(cls.to_python_value, ctx, lm.literals[k], v)) for k, v in python_types.items()}
+        )
+
+    @classmethod
+    def is_thread_safe(cls, python_type: Type) -> bool:
+        """
+        Returns true if the transformers for the given type and all its type arguments (e.g. List[T]) are thread safe
+        """
+        try:
+            if not cls.get_transformer(python_type).thread_safe:
+                return False
+        except ValueError:
+            return False
+        args = getattr(python_type, "__args__", None) or ()
+        return all(cls.is_thread_safe(a) for a in args if isinstance(a, type) or hasattr(a, "__origin__"))
+
+    @classmethod
+    def is_lossless(cls, python_type: Type) -> bool:
+        """
+        Returns true if values of the given type come back from a round trip through a literal as equal values of the
+        same type, which is the case for primitives and lists, dicts with string keys and dataclasses of them. Such
+        values are converted in memory, and local executions may pass them between tasks as they are.
+        """
+        try:
+            return cls._LOSSLESS[python_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # Not hashable
+            return False
+        lossless = False
+        origin = getattr(python_type, "__origin__", None)
+        args = getattr(python_type, "__args__", None) or ()
+        if python_type in cls._LOSSLESS_PRIMITIVES:
+            lossless = True
+        elif origin is list and len(args) == 1:
+            lossless = cls.is_lossless(args[0])
+        elif origin is dict and len(args) == 2:
+            lossless = args[0] is str and cls.is_lossless(args[1])
+        elif (
+            isinstance(python_type, type)
+            and dataclasses.is_dataclass(python_type)
+            and issubclass(python_type, DataClassJsonMixin)
+            and python_type not in cls._REGISTRY
+        ):
+            # Guards against recursive dataclasses
+            cls._LOSSLESS[python_type] = False
+            try:
+                hints = typing.get_type_hints(python_type)
+                lossless = all(cls.is_lossless(hints[f.name]) for f in dataclasses.fields(python_type))
+            except Exception:
+                lossless = False
+        cls._LOSSLESS[python_type] = lossless
+        return lossless
+
+    @classmethod
+    def native_passthrough(cls, python_val: typing.Any, python_type: Type) -> typing.Tuple[bool, typing.Any]:
+        """
+        Returns (True, copy of the value) if the type is lossless (see :py:meth:`is_lossless`) and the value is exactly
+        of that type, so that the copy is what converting the value to a literal and back would return. Otherwise
+        returns (False, None) and the value has to be converted.
+        """
+        if not cls.is_lossless(python_type) or not cls._conforms(python_val, python_type):
+            return False, None
+        if type(python_val) in cls._LOSSLESS_PRIMITIVES:
+            return True, python_val
+        return True, copy.deepcopy(python_val)
+
+    @classmethod
+    def _conforms(cls, v: typing.Any, t: Type) -> bool:
+        if t in cls._LOSSLESS_PRIMITIVES:
+            # bool is an int and an int is not a float, but they are not converted as such
+            return type(v) is t
+        origin = getattr(t, "__origin__", None)
+        if origin is list:
+            return type(v) is list and all(cls._conforms(x, t.__args__[0]) for x in v)
+        if origin is dict:
+            return type(v) is dict and all(type(k) is str and cls._conforms(x, t.__args__[1]) for k, x in v.items())
+        if type(v) is not t:
+            return False
+        hints = typing.get_type_hints(t)
+        return all(cls._conforms(getattr(v, f.name), hints[f.name]) for f in dataclasses.fields(t))
+
+    @classmethod
+    def convert_concurrently(
+        cls, conversions: typing.Dict[str, typing.Tuple[Type, typing.Callable[[], typing.Any]]]
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Runs the conversions of independent variables, given as a dictionary of variable name to the python type and a
+        function performing the conversion, using up to ``sdk.max_conversion_workers`` threads. Conversions of types
+        whose transformers are not thread safe are run in the calling thread. All conversions are run to completion,
+        if any of them failed the error of the first failed variable (in the given order) is raised.
+        """
+        max_workers = min(_sdk_config.MAX_CONVERSION_WORKERS.get(), len(conversions))
+        # Lossless types are converted in memory, there is nothing to gain from threads
+        if max_workers <= 1 or all(cls.is_lossless(t) for t, _ in conversions.values()):
+            return {k: fn() for k, (_, fn) in conversions.items()}
+
+        futures = {}
+        errors = {}
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flyte-convert") as ex:
+            for k, (t, fn) in conversions.items():
+                if cls.is_thread_safe(t):
+                    # Transformers that look up the current context see the one of the calling thread
+                    futures[k] = ex.submit(FlyteContextManager.run_in_thread(fn))
+            for k, (t, fn) in conversions.items():
+                if k not in futures:
+                    try:
+                        results[k] = fn()
+                    except Exception as e:
+                        errors[k] = e
+            for k, f in futures.items():
+                try:
+                    results[k] = f.result()
+                except Exception as e:
+                    errors[k] = e
+
+        for k in conversions.keys():
+            if k in errors:
+                if len(errors) > 1:
+                    logger.error(f"Conversion failed for variables {[n for n in conversions if n in errors]}")
+                raise errors[k]
+        return {k: results[k] for k in conversions.keys()}
 
     @classmethod
     def dict_to_literal_map(cls, ctx: FlyteContext, d: typing.Dict[str, typing.Any]) -> LiteralMap:
@@ -441,13 +860,98 @@ class TypeEngine(typing.Generic[T]):
         """
         Transforms a flyte-specific ``LiteralType`` to a regular python value.
         """
-        for _, transformer in cls._REGISTRY.items():
+        key = flyte_type.to_flyte_idl().SerializeToString(deterministic=True)
+        if key in cls._GUESSED_TYPES:
+            return cls._GUESSED_TYPES[key]
+
+        for transformer in cls._reverse_transformers(literal_type_kind(flyte_type)):
             try:
-                return transformer.guess_python_type(flyte_type)
+                guessed = transformer.guess_python_type(flyte_type)
             except ValueError:
                 logger.debug(f"Skipping transformer {transformer.name} for {flyte_type}")
+                continue
+            cls._GUESSED_TYPES[key] = guessed
+            return guessed
         raise ValueError(f"No transformers could reverse Flyte literal type {flyte_type}")
 
+    @classmethod
+    def _reverse_transformers(cls, kind: typing.Hashable) -> typing.List[TypeTransformer]:
+        """
+        Returns the transformers, in registration order, that may reverse LiteralTypes of the given kind. Transformers
+        that do not implement guess_python_type are never included.
+        """
+        transformers = cls._REVERSE_INDEX.get(kind)
+        if transformers is None:
+            transformers = []
+            for t in cls._REGISTRY.values():
+                if type(t).guess_python_type is TypeTransformer.guess_python_type:
+                    continue
+                kinds = t.reversible_literal_type_kinds()
+                if kinds is None or kind in kinds:
+                    transformers.append(t)
+            cls._REVERSE_INDEX[kind] = transformers
+        return transformers
+
+
+_PACKED_LIST_TAG_PREFIX = "flytekit.packed_list."
+_PACKED_LIST_DTYPES = {int: "<i8", float: "<f8", bool: "|b1"}
+_PACKED_LIST_TYPES = {"int": int, "float": float, "bool": bool, "str": str}
+
+
+def _pack_primitive_list(v: list, t: type) -> typing.Optional[Binary]:
+    """
+    Packs a list of ints, floats, bools or strs into a single Binary scalar. Numbers and bools are stored as a little
+    endian numpy array, strs as an array of their lengths followed by the utf-8 encoded concatenation of all of them.
+    Returns None if the list cannot be packed, in which case the regular per element encoding should be used.
+    """
+    if t not in _PACKED_LIST_TYPES.values() or any(type(x) is not t for x in v):
+        return None
+    import numpy as _np
+
+    try:
+        if t is str:
+            data = "".join(v).encode("utf-8")
+            lengths = _np.fromiter(map(len, v), dtype="<u8", count=len(v))
+            value = len(v).to_bytes(8, "little") + lengths.tobytes() + data
+        else:
+            value = _np.array(v, dtype=_PACKED_LIST_DTYPES[t]).tobytes()
+    except (OverflowError, UnicodeEncodeError):
+        # ints that do not fit into 64 bits or strs that are not valid unicode
+        return None
+    return Binary(value=value, tag=_PACKED_LIST_TAG_PREFIX + t.__name__)
+
+
+def _unpack_primitive_list(b: Binary) -> list:
+    import numpy as _np
+
+    t = _PACKED_LIST_TYPES.get(b.tag[len(_PACKED_LIST_TAG_PREFIX) :])
+    if t is None:
+        raise AssertionError(f"Unknown packed list encoding {b.tag}")
+    if t is not str:
+        return _np.frombuffer(b.value, dtype=_PACKED_LIST_DTYPES[t]).tolist()
+    n = int.from_bytes(b.value[:8], "little")
+    ends = _np.cumsum(_np.frombuffer(b.value, dtype="<u8", count=n, offset=8)).tolist()
+    text = b.value[8 + 8 * n :].decode("utf-8")
+    return [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
+def pack_list_if_large(python_val: typing.Any, python_type: Type) -> typing.Optional[Literal]:
+    """
+    Returns a single packed binary literal for lists of ints, floats, bools or strs with at least
+    ``sdk.compact_list_threshold`` entries, and None for any other value. The literal type of the list is not changed,
+    so only consumers running flytekit can read the packed form. This is why it is only applied to the outputs of tasks
+    that opt in with :py:attr:`flytekit.TaskMetadata.compact_lists`.
+    """
+    threshold = _sdk_config.COMPACT_LIST_THRESHOLD.get()
+    if threshold <= 0 or not isinstance(python_val, list) or len(python_val) < threshold:
+        return None
+    if getattr(python_type, "__origin__", None) is not list or not getattr(python_type, "__args__", None):
+        return None
+    packed = _pack_primitive_list(python_val, python_type.__args__[0])
+    if packed is None:
+        return None
+    return Literal(scalar=Scalar(binary=packed))
+
 
 class ListTransformer(TypeTransformer[T]):
     """
@@ -483,9 +987,14 @@ class ListTransformer(TypeTransformer[T]):
         return Literal(collection=LiteralCollection(literals=lit_list))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
+        if lv.scalar and lv.scalar.binary and lv.scalar.binary.tag.startswith(_PACKED_LIST_TAG_PREFIX):
+            return _unpack_primitive_list(lv.scalar.binary)
         st = self.get_sub_type(expected_python_type)
         return [TypeEngine.to_python_value(ctx, x, st) for x in lv.collection.literals]
 
+    def reversible_literal_type_kinds(self) -> typing.Optional[typing.Set[typing.Hashable]]:
+        return {"collection"}
+
     def guess_python_type(self, literal_type: LiteralType) -> Type[T]:
         if literal_type.collection_type:
             ct = TypeEngine.guess_python_type(literal_type.collection_type)
@@ -517,7 +1026,7 @@ class DictTransformer(TypeTransformer[dict]):
         """
         Creates a flyte-specific ``Literal`` value from a native python dictionary.
         """
-        return Literal(scalar=Scalar(generic=_json_format.Parse(_json.dumps(v), _struct.Struct())))
+        return Literal(scalar=Scalar(generic=_dict_to_struct(v)))
 
     def get_literal_type(self, t: Type[dict]) -> LiteralType:
         """
@@ -566,9 +1075,12 @@ class DictTransformer(TypeTransformer[dict]):
         # for empty generic we have to explicitly test for lv.scalar.generic is not None as empty dict
         # evaluates to false
         if lv and lv.scalar and lv.scalar.generic is not None:
-            return _json.loads(_json_format.MessageToJson(lv.scalar.generic))
+            return _struct_to_dict(lv.scalar.generic)
         raise TypeError(f"Cannot convert from {lv} to {expected_python_type}")
 
+    def reversible_literal_type_kinds(self) -> typing.Optional[typing.Set[typing.Hashable]]:
+        return {"map"}
+
     def guess_python_type(self, literal_type: LiteralType) -> Type[T]:
         if literal_type.map_value_type:
             mt = TypeEngine.guess_python_type(literal_type.map_value_type)
@@ -576,6 +1088,198 @@ class DictTransformer(TypeTransformer[dict]):
         raise ValueError(f"Dictionary transformer cannot reverse {literal_type}")
 
 
+_UNCONVERTED = object()
+
+
+class LazyList(collections.abc.Sequence, typing.Generic[T]):
+    """
+    A read-only list whose elements are converted from their literals on first access and cached afterwards. Annotate
+    a task input with ``LazyList[T]`` instead of ``typing.List[T]`` to avoid converting every element before the task
+    starts, e.g. for large collections of files or schemas of which only a few are used. The literal type is the same
+    as for ``typing.List[T]``.
+
+    Indexing converts a single element, slicing converts the elements of the slice and iteration converts
+    ``batch_size`` elements at a time.
+    """
+
+    DEFAULT_BATCH_SIZE = 16
+
+    def __init__(
+        self,
+        ctx: FlyteContext,
+        literals: typing.List[Literal],
+        element_type: Type[T],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self._ctx = ctx
+        self._literals = literals
+        self._element_type = element_type
+        self._batch_size = max(1, batch_size)
+        self._values = [_UNCONVERTED] * len(literals)
+        self._has_literals = True
+
+    @classmethod
+    def _from_values(cls, ctx: FlyteContext, values: typing.List[T], element_type: Type[T]) -> LazyList[T]:
+        ll = cls(ctx, [None] * len(values), element_type)
+        ll._values = list(values)
+        ll._has_literals = False
+        return ll
+
+    @property
+    def element_type(self) -> Type[T]:
+        return self._element_type
+
+    @property
+    def num_converted(self) -> int:
+        return sum(1 for v in self._values if v is not _UNCONVERTED)
+
+    def _convert(self, indices: typing.Iterable[int]):
+        for i in indices:
+            if self._values[i] is _UNCONVERTED:
+                self._values[i] = TypeEngine.to_python_value(self._ctx, self._literals[i], self._element_type)
+
+    def __len__(self) -> int:
+        return len(self._literals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            self._convert(indices)
+            return [self._values[i] for i in indices]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyList index out of range")
+        self._convert((index,))
+        return self._values[index]
+
+    def __iter__(self) -> typing.Iterator[T]:
+        for start in range(0, len(self), self._batch_size):
+            end = min(start + self._batch_size, len(self))
+            self._convert(range(start, end))
+            yield from self._values[start:end]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        # Does not convert any elements, as inputs are logged before the task is executed
+        return f"LazyList[{self._element_type}](len={len(self)}, converted={self.num_converted})"
+
+
+class LazyDict(collections.abc.Mapping, typing.Generic[T]):
+    """
+    A read-only ``Dict[str, T]`` whose values are converted from their literals on first access and cached afterwards.
+    Annotate a task input with ``LazyDict[T]`` instead of ``typing.Dict[str, T]`` to avoid converting every value
+    before the task starts. The literal type is the same as for ``typing.Dict[str, T]``.
+    """
+
+    def __init__(self, ctx: FlyteContext, literals: typing.Dict[str, Literal], value_type: Type[T]):
+        self._ctx = ctx
+        self._literals = literals
+        self._value_type = value_type
+        self._values = {}
+
+    @property
+    def value_type(self) -> Type[T]:
+        return self._value_type
+
+    @property
+    def num_converted(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, key: str) -> T:
+        if key not in self._values:
+            self._values[key] = TypeEngine.to_python_value(self._ctx, self._literals[key], self._value_type)
+        return self._values[key]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._literals)
+
+    def __len__(self) -> int:
+        return len(self._literals)
+
+    def __repr__(self) -> str:
+        return f"LazyDict[{self._value_type}](len={len(self)}, converted={self.num_converted})"
+
+
+class LazyListTransformer(TypeTransformer[LazyList]):
+    """
+    Transformer for :py:class:`LazyList`, which shares its literal representation with ``typing.List[T]``
+    """
+
+    def __init__(self):
+        super().__init__("Lazy List", LazyList)
+
+    @staticmethod
+    def get_sub_type(t: Type[LazyList]) -> type:
+        if getattr(t, "__origin__", None) is LazyList and getattr(t, "__args__", None):
+            return t.__args__[0]
+        raise ValueError("Only univariate LazyList[T] types are supported.")
+
+    def get_literal_type(self, t: Type[LazyList]) -> LiteralType:
+        return TypeEngine.to_literal_type(typing.List[self.get_sub_type(t)])
+
+    def to_literal(
+        self, ctx: FlyteContext, python_val: typing.Any, python_type: Type[LazyList], expected: LiteralType
+    ) -> Literal:
+        st = self.get_sub_type(python_type)
+        if isinstance(python_val, LazyList) and python_val._has_literals:
+            # Elements that were never accessed are passed on without converting them back and forth
+            literals = [
+                lit if v is _UNCONVERTED else TypeEngine.to_literal(ctx, v, st, expected.collection_type)
+                for lit, v in zip(python_val._literals, python_val._values)
+            ]
+            return Literal(collection=LiteralCollection(literals=literals))
+        return TypeEngine.to_literal(ctx, list(python_val), typing.List[st], expected)
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[LazyList]) -> LazyList:
+        st = self.get_sub_type(expected_python_type)
+        if lv.collection is None:
+            # Packed lists are decoded in bulk anyways
+            return LazyList._from_values(ctx, TypeEngine.to_python_value(ctx, lv, typing.List[st]), st)
+        return LazyList(ctx, lv.collection.literals, st)
+
+
+class LazyDictTransformer(TypeTransformer[LazyDict]):
+    """
+    Transformer for :py:class:`LazyDict`, which shares its literal representation with ``typing.Dict[str, T]``
+    """
+
+    def __init__(self):
+        super().__init__("Lazy Dict", LazyDict)
+
+    @staticmethod
+    def get_value_type(t: Type[LazyDict]) -> type:
+        if getattr(t, "__origin__", None) is LazyDict and getattr(t, "__args__", None):
+            return t.__args__[0]
+        raise ValueError("Only univariate LazyDict[T] types are supported.")
+
+    def get_literal_type(self, t: Type[LazyDict]) -> LiteralType:
+        return TypeEngine.to_literal_type(typing.Dict[str, self.get_value_type(t)])
+
+    def to_literal(
+        self, ctx: FlyteContext, python_val: typing.Any, python_type: Type[LazyDict], expected: LiteralType
+    ) -> Literal:
+        vt = self.get_value_type(python_type)
+        if isinstance(python_val, LazyDict):
+            literals = {
+                k: TypeEngine.to_literal(ctx, python_val._values[k], vt, expected.map_value_type)
+                if k in python_val._values
+                else lit
+                for k, lit in python_val._literals.items()
+            }
+            return Literal(map=LiteralMap(literals=literals))
+        return TypeEngine.to_literal(ctx, dict(python_val), typing.Dict[str, vt], expected)
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[LazyDict]) -> LazyDict:
+        if lv.map is None:
+            raise TypeError(f"Cannot convert from {lv} to {expected_python_type}")
+        return LazyDict(ctx, lv.map.literals, self.get_value_type(expected_python_type))
+
+
 class TextIOTransformer(TypeTransformer[typing.TextIO]):
     """
     Handler for TextIO
@@ -793,6 +1497,8 @@ def _register_default_type_transformers():
     )
     TypeEngine.register(ListTransformer())
     TypeEngine.register(DictTransformer())
+    TypeEngine.register(LazyListTransformer())
+    TypeEngine.register(LazyDictTransformer())
     TypeEngine.register(TextIOTransformer())
     TypeEngine.register(PathLikeTransformer())
     TypeEngine.register(BinaryIOTransformer())
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import heapq
 import inspect
+import os
+import shutil
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from flytekit.common import constants as _common_constants
+from flytekit.common import utils as _common_utils
 from flytekit.common.exceptions import scopes as exception_scopes
 from flytekit.common.exceptions.user import FlyteValidationException, FlyteValueException
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.base_task import PythonTask
 from flytekit.core.class_based_resolver import ClassStorageTaskResolver
 from flytekit.core.condition import ConditionalSection
@@ -27,6 +34,7 @@ from flytekit.core.interface import (
     transform_signature_to_interface,
 )
 from flytekit.core.launch_plan import LaunchPlan
+from flytekit.core.local_objects import LOCAL_OBJECTS_KEY, LocalObjectTable
 from flytekit.core.node import Node
 from flytekit.core.promise import (
     NodeOutput,
@@ -41,6 +49,7 @@ from flytekit.core.promise import (
 from flytekit.core.python_auto_container import PythonAutoContainerTask
 from flytekit.core.reference_entity import ReferenceEntity, WorkflowReference
 from flytekit.core.type_engine import TypeEngine
+from flytekit.interfaces.data.local.local_file_proxy import LocalFileProxy
 from flytekit.loggers import logger
 from flytekit.models import interface as _interface_models
 from flytekit.models import literals as _literal_models
@@ -167,6 +176,217 @@ def get_promise_map(
     return entity_kwargs
 
 
+def _binding_upstream_nodes(binding_data: _literal_models.BindingData) -> List[Node]:
+    if binding_data.promise is not None:
+        return [binding_data.promise.node]
+    if binding_data.collection is not None:
+        return [n for bd in binding_data.collection.bindings for n in _binding_upstream_nodes(bd)]
+    if binding_data.map is not None:
+        return [n for bd in binding_data.map.bindings.values() for n in _binding_upstream_nodes(bd)]
+    return []
+
+
+def _run_node(node: Node, outputs_cache: Dict[Node, Dict[str, Promise]]) -> Dict[str, Promise]:
+    """
+    Runs the entity of the node with the inputs its bindings require, and returns its outputs by name.
+    """
+    # Retrieve the entity from the node, and call it by looking up the promises the node's bindings require,
+    # and then fill them in using the node output tracker map we have.
+    entity = node.flyte_entity
+    entity_kwargs = get_promise_map(node.bindings, outputs_cache)
+
+    # Handle the calling and outputs of each node's entity
+    results = entity(**entity_kwargs)
+    expected_output_names = list(entity.python_interface.outputs.keys())
+
+    if isinstance(results, VoidPromise) or results is None:
+        return {}  # Move along, nothing to assign
+
+    # Because we should've already returned in the above check, we just raise an Exception here.
+    if len(entity.python_interface.outputs) == 0:
+        raise FlyteValueException(results, f"{results} received but should've been VoidPromise or None.")
+
+    # if there's only one output,
+    if len(expected_output_names) == 1:
+        if entity.python_interface.output_tuple_name and isinstance(results, tuple):
+            return {expected_output_names[0]: results[0]}
+        return {expected_output_names[0]: results}
+
+    if len(results) != len(expected_output_names):
+        raise FlyteValueException(results, f"Different lengths {results} {expected_output_names}")
+    return {expected_output_names[idx]: r for idx, r in enumerate(results)}
+
+
+def _literal_uris(literal: _literal_models.Literal) -> List[str]:
+    if literal.scalar is not None:
+        if literal.scalar.blob is not None:
+            return [literal.scalar.blob.uri.rstrip("/")]
+        if literal.scalar.schema is not None:
+            return [literal.scalar.schema.uri.rstrip("/")]
+    if literal.collection is not None:
+        return [u for lit in literal.collection.literals for u in _literal_uris(lit)]
+    if literal.map is not None:
+        return [u for lit in literal.map.literals.values() for u in _literal_uris(lit)]
+    return []
+
+
+class _IntermediateOutputs(object):
+    """
+    Counts the nodes that have yet to consume the outputs of every node, and releases the outputs of a node once they
+    have all run. The files of the outputs, that the node wrote to the local sandbox, are deleted as well if
+    :py:attr:`flytekit.configuration.sdk.LOCAL_RELEASE_INTERMEDIATES` is set, unless outputs that are still in use (or
+    the inputs of the workflow) refer to the same files.
+    """
+
+    def __init__(
+        self, outputs_cache: Dict[Node, Dict[str, Promise]], consumers: Dict[Node, int], keep: typing.Set[Node]
+    ):
+        self._outputs_cache = outputs_cache
+        self._consumers = consumers
+        self._keep = keep
+        self._uris: Dict[Node, List[str]] = {}
+        self._uri_refs: Dict[str, int] = {}
+        ctx = FlyteContextManager.current_context()
+        self._objects = LocalObjectTable.current(ctx)
+        self._sandbox = None
+        if _sdk_config.LOCAL_RELEASE_INTERMEDIATES.get() and isinstance(ctx.file_access.remote, LocalFileProxy):
+            self._sandbox = os.path.join(os.path.abspath(ctx.file_access.remote.sandbox), "")
+        for node in outputs_cache:
+            self.add(node)
+
+    def add(self, node: Node):
+        uris = []
+        for p in self._outputs_cache.get(node, {}).values():
+            # Values passed on as they are by fast local executions do not refer to files
+            if isinstance(p, Promise) and p.is_ready and p.native is None:
+                uris.extend(_literal_uris(p.val))
+        self._uris[node] = uris
+        for u in uris:
+            self._uri_refs[u] = self._uri_refs.get(u, 0) + 1
+        if self._consumers.get(node, 0) == 0:
+            self._release(node)
+
+    def consumed(self, node: Node):
+        self._consumers[node] -= 1
+        if self._consumers[node] == 0:
+            self._release(node)
+
+    def _release(self, node: Node):
+        if node in self._keep or node is GLOBAL_START_NODE:
+            return
+        self._outputs_cache.pop(node, None)
+        for u in self._uris.pop(node, []):
+            self._uri_refs[u] -= 1
+            if self._uri_refs[u] > 0:
+                continue
+            del self._uri_refs[u]
+            if self._objects is not None:
+                self._objects.discard(u)
+            if self._sandbox is not None and os.path.abspath(u).startswith(self._sandbox):
+                logger.debug(f"Deleting {u}, its last consumer has run")
+                if os.path.isdir(u):
+                    shutil.rmtree(u, ignore_errors=True)
+                elif os.path.exists(u):
+                    os.remove(u)
+
+
+def execute_nodes(
+    nodes: List[Node],
+    outputs_cache: Dict[Node, Dict[str, Promise]],
+    failure_policy: WorkflowFailurePolicy = WorkflowFailurePolicy.FAIL_IMMEDIATELY,
+    max_workers: Optional[int] = None,
+    keep: Optional[typing.Set[Node]] = None,
+):
+    """
+    Runs the nodes of a workflow locally, filling in the outputs of every node in outputs_cache, which has to hold the
+    outputs of the global input node (i.e. the inputs of the workflow) to start with.
+
+    A node runs as soon as all the nodes it depends on, through its bindings or as an upstream node, have completed. Up
+    to max_workers nodes (default :py:attr:`flytekit.configuration.sdk.LOCAL_WORKFLOW_WORKERS`) run concurrently on a
+    thread pool. Among the nodes that are ready, the one that was declared first runs first, so with a single worker
+    the nodes run in the order of declaration.
+
+    If a node fails, no new nodes are started if the policy is to fail immediately. Otherwise all nodes that do not
+    depend on a failed node are still run. Either way the nodes that are running are completed, and the error of the
+    first node that failed is raised.
+
+    If keep is given, the outputs of the nodes that are not in it are removed from outputs_cache as soon as all the
+    nodes that consume them have run, see :py:class:`_IntermediateOutputs`.
+    """
+    if max_workers is None:
+        max_workers = _sdk_config.LOCAL_WORKFLOW_WORKERS.get()
+    max_workers = max(1, max_workers)
+    order = {n: i for i, n in enumerate(nodes)}
+    downstream = {n: [] for n in nodes}
+    waiting_on = {}
+    consumed = {}
+    consumers = {n: 0 for n in outputs_cache}
+    consumers.update({n: 0 for n in nodes})
+    for n in nodes:
+        consumed[n] = {u for b in n.bindings for u in _binding_upstream_nodes(b.binding)}
+        for u in consumed[n]:
+            consumers[u] = consumers.get(u, 0) + 1
+        upstream = {u for u in consumed[n].union(n.upstream_nodes) if u in order}
+        for u in upstream:
+            downstream[u].append(n)
+        waiting_on[n] = len(upstream)
+    ready = [(order[n], n) for n in nodes if waiting_on[n] == 0]
+    heapq.heapify(ready)
+    intermediates = _IntermediateOutputs(outputs_cache, consumers, keep) if keep is not None else None
+
+    def run(node: Node) -> Dict[str, Promise]:
+        return _run_node(node, outputs_cache)
+
+    executor = None
+    if max_workers > 1 and len(nodes) > 1:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flyte-local-node")
+        # Every node runs with its own copy of the context of the workflow execution
+        run = FlyteContextManager.run_in_thread(run)
+
+    def submit(node: Node) -> Future:
+        if executor is not None:
+            return executor.submit(run, node)
+        f = Future()
+        try:
+            f.set_result(run(node))
+        except Exception as e:
+            f.set_exception(e)
+        return f
+
+    errors = []
+    running = {}
+    try:
+        while ready or running:
+            stop = errors and failure_policy == WorkflowFailurePolicy.FAIL_IMMEDIATELY
+            while ready and not stop and len(running) < max_workers:
+                node = heapq.heappop(ready)[1]
+                running[submit(node)] = node
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for f in sorted(done, key=lambda x: order[running[x]]):
+                node = running.pop(f)
+                if intermediates is not None:
+                    for u in consumed[node]:
+                        intermediates.consumed(u)
+                if f.exception() is not None:
+                    logger.error(f"Node {node.id} failed: {f.exception()}")
+                    errors.append(f.exception())
+                    continue
+                outputs_cache[node] = f.result()
+                if intermediates is not None:
+                    intermediates.add(node)
+                for d in downstream[node]:
+                    waiting_on[d] -= 1
+                    if waiting_on[d] == 0:
+                        heapq.heappush(ready, (order[d], d))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+    if errors:
+        raise errors[0]
+
+
 class WorkflowBase(object):
     def __init__(
         self,
@@ -243,7 +463,7 @@ class WorkflowBase(object):
         __call__ -> _local_execute -> execute
 
         From execute, different things happen for the two Workflow styles. For PythonFunctionWorkflows, the Python
-        function is run, for the ImperativeWorkflow, each node is run one at a time.
+        function is run, for the ImperativeWorkflow, each node is run once the nodes it depends on have completed.
         """
         if len(args) > 0:
             raise AssertionError("Only Keyword Arguments are supported for Workflow executions")
@@ -287,9 +507,14 @@ class WorkflowBase(object):
                 if isinstance(v, Promise):
                     raise ValueError(f"Received a promise for a workflow call, when expecting a native value for {k}")
 
+            additional_context = None
+            if _sdk_config.LOCAL_OBJECT_PASSTHROUGH.get():
+                additional_context = {LOCAL_OBJECTS_KEY: LocalObjectTable()}
             with FlyteContextManager.with_context(
                 ctx.with_execution_state(
-                    ctx.new_execution_state().with_params(mode=ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION)
+                    ctx.new_execution_state().with_params(
+                        mode=ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION, additional_context=additional_context
+                    )
                 )
             ) as child_ctx:
                 result = self._local_execute(child_ctx, **input_kwargs)
@@ -302,13 +527,56 @@ class WorkflowBase(object):
                     raise Exception(f"Workflow local execution expected 0 outputs but something received {result}")
 
             if (1 < expected_outputs == len(result)) or (result is not None and expected_outputs == 1):
-                return create_native_named_tuple(ctx, result, self.python_interface)
+                # The outputs are converted with the context of the execution, as they may only be held in memory
+                return create_native_named_tuple(child_ctx, result, self.python_interface)
 
             raise ValueError("expected outputs and actual outputs do not match")
 
     def execute(self, **kwargs):
         raise Exception("Should not be called")
 
+    def _execute_nodes(self, **kwargs):
+        """
+        Runs the nodes of the workflow locally, using the bindings between them rather than running the nodes in order
+        of declaration, see :py:func:`execute_nodes`. To keep track of outputs, we create a map to start things off,
+        filled in only with the workflow inputs (if any). As things are run, their outputs are stored in this map.
+        After all nodes are run, we fill in workflow level outputs the same way as any other previous node.
+        """
+        # Create a map that holds the outputs of each node.
+        intermediate_node_outputs = {GLOBAL_START_NODE: {}}  # type: Dict[Node, Dict[str, Promise]]
+
+        # Start things off with the outputs of the global input node, i.e. the inputs to the workflow.
+        # _local_execute should've already ensured that all the values in kwargs are Promise objects
+        for k, v in kwargs.items():
+            intermediate_node_outputs[GLOBAL_START_NODE][k] = v
+
+        failure_policy = WorkflowFailurePolicy.FAIL_IMMEDIATELY
+        if self.workflow_metadata is not None:
+            failure_policy = self.workflow_metadata.on_failure
+        # Only the outputs of the workflow are needed once the nodes have run
+        keep = {n for b in self.output_bindings for n in _binding_upstream_nodes(b.binding)}
+        execute_nodes(self.nodes, intermediate_node_outputs, failure_policy, keep=keep)
+
+        # The rest of this function looks like the above but now we're doing it for the workflow as a whole rather
+        # than just one node at a time.
+        if len(self.python_interface.outputs) == 0:
+            return VoidPromise(self.name)
+
+        # The values that we return below from the output have to be pulled by fulfilling all of the
+        # workflow's output bindings.
+        # The return style here has to match what 1) what the workflow would've returned had it been declared
+        # functionally, and 2) what a user would return in mock function. That is, if it's a tuple, then it
+        # should be a tuple here, if it's a one element named tuple, then we do a one-element non-named tuple,
+        # if it's a single element then we return a single element
+        if len(self.output_bindings) == 1:
+            # Again use presence of output_tuple_name to understand that we're dealing with a one-element
+            # named tuple
+            if self.python_interface.output_tuple_name:
+                return (get_promise(self.output_bindings[0].binding, intermediate_node_outputs),)
+            # Just a normal single element
+            return get_promise(self.output_bindings[0].binding, intermediate_node_outputs)
+        return tuple([get_promise(b.binding, intermediate_node_outputs) for b in self.output_bindings])
+
     def _local_execute(self, ctx: FlyteContext, **kwargs) -> Union[Tuple[Promise], Promise, VoidPromise]:
         # This is done to support the invariant that Workflow local executions always work with Promise objects
         # holding Flyte literal values. Even in a wf, a user can call a sub-workflow with a Python native value.
@@ -357,15 +625,24 @@ class WorkflowBase(object):
             wf_outputs_as_map = {expected_output_names[i]: function_outputs[i] for i, _ in enumerate(function_outputs)}
 
         # Basically we need to repackage the promises coming from the tasks into Promises that match the workflow's
-        # interface. We do that by extracting out the literals, and creating new Promises
+        # interface. We do that by extracting out the literals, and creating new Promises. Values passed on as they are
+        # by fast local executions are kept as they are, if they are of the type of the workflow output.
+        passed_through = {
+            k: v.with_var(k)
+            for k, v in wf_outputs_as_map.items()
+            if isinstance(v, Promise) and v.native is not None and v.native[1] == self.python_interface.outputs.get(k)
+        }
         wf_outputs_as_literal_dict = translate_inputs_to_literals(
             ctx,
-            wf_outputs_as_map,
+            {k: v for k, v in wf_outputs_as_map.items() if k not in passed_through},
             flyte_interface_types=self.interface.outputs,
             native_types=self.python_interface.outputs,
         )
         # Recreate new promises that use the workflow's output names.
-        new_promises = [Promise(var, wf_outputs_as_literal_dict[var]) for var in expected_output_names]
+        new_promises = [
+            passed_through[var] if var in passed_through else Promise(var, wf_outputs_as_literal_dict[var])
+            for var in expected_output_names
+        ]
 
         return create_task_output(new_promises, self.python_interface)
 
@@ -451,78 +728,12 @@ class ImperativeWorkflow(WorkflowBase):
 
     def execute(self, **kwargs):
         """
-        Called by _local_execute. This function is how local execution for imperative workflows runs. Because when an
-        entity is added using the add_entity function, all inputs to that entity should've been already declared, we
-        can just iterate through the nodes in order and we shouldn't run into any dependency issues. That is, we force
-        the user to declare entities already in a topological sort. To keep track of outputs, we create a map to
-        start things off, filled in only with the workflow inputs (if any). As things are run, their outputs are stored
-        in this map.
-        After all nodes are run, we fill in workflow level outputs the same way as any other previous node.
+        Called by _local_execute. This function is how local execution for imperative workflows runs, see
+        _execute_nodes.
         """
         if not self.ready():
             raise FlyteValidationException(f"Workflow not ready, wf is currently {self}")
-
-        # Create a map that holds the outputs of each node.
-        intermediate_node_outputs = {GLOBAL_START_NODE: {}}  # type: Dict[Node, Dict[str, Promise]]
-
-        # Start things off with the outputs of the global input node, i.e. the inputs to the workflow.
-        # _local_execute should've already ensured that all the values in kwargs are Promise objects
-        for k, v in kwargs.items():
-            intermediate_node_outputs[GLOBAL_START_NODE][k] = v
-
-        # Next iterate through the nodes in order.
-        for node in self.compilation_state.nodes:
-            if node not in intermediate_node_outputs.keys():
-                intermediate_node_outputs[node] = {}
-
-            # Retrieve the entity from the node, and call it by looking up the promises the node's bindings require,
-            # and then fill them in using the node output tracker map we have.
-            entity = node.flyte_entity
-            entity_kwargs = get_promise_map(node.bindings, intermediate_node_outputs)
-
-            # Handle the calling and outputs of each node's entity
-            results = entity(**entity_kwargs)
-            expected_output_names = list(entity.python_interface.outputs.keys())
-
-            if isinstance(results, VoidPromise) or results is None:
-                continue  # pragma: no cover # Move along, nothing to assign
-
-            # Because we should've already returned in the above check, we just raise an Exception here.
-            if len(entity.python_interface.outputs) == 0:
-                raise FlyteValueException(results, f"{results} received but should've been VoidPromise or None.")
-
-            # if there's only one output,
-            if len(expected_output_names) == 1:
-                if entity.python_interface.output_tuple_name and isinstance(results, tuple):
-                    intermediate_node_outputs[node][expected_output_names[0]] = results[0]
-                else:
-                    intermediate_node_outputs[node][expected_output_names[0]] = results
-
-            else:
-                if len(results) != len(expected_output_names):
-                    raise FlyteValueException(results, f"Different lengths {results} {expected_output_names}")
-                for idx, r in enumerate(results):
-                    intermediate_node_outputs[node][expected_output_names[idx]] = r
-
-        # The rest of this function looks like the above but now we're doing it for the workflow as a whole rather
-        # than just one node at a time.
-        if len(self.python_interface.outputs) == 0:
-            return VoidPromise(self.name)
-
-        # The values that we return below from the output have to be pulled by fulfilling all of the
-        # workflow's output bindings.
-        # The return style here has to match what 1) what the workflow would've returned had it been declared
-        # functionally, and 2) what a user would return in mock function. That is, if it's a tuple, then it
-        # should be a tuple here, if it's a one element named tuple, then we do a one-element non-named tuple,
-        # if it's a single element then we return a single element
-        if len(self.output_bindings) == 1:
-            # Again use presence of output_tuple_name to understand that we're dealing with a one-element
-            # named tuple
-            if self.python_interface.output_tuple_name:
-                return (get_promise(self.output_bindings[0].binding, intermediate_node_outputs),)
-            # Just a normal single element
-            return get_promise(self.output_bindings[0].binding, intermediate_node_outputs)
-        return tuple([get_promise(b.binding, intermediate_node_outputs) for b in self.output_bindings])
+        return self._execute_nodes(**kwargs)
 
     def add_entity(self, entity: Union[PythonTask, LaunchPlan, WorkflowBase], **kwargs) -> Node:
         """
@@ -652,6 +863,8 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
         #    This can be in launch plan only, but is here only so that we don't have to re-evaluate. Or
         #    we can re-evaluate.
         self._input_parameters = None
+        # Whether local executions may run the compiled nodes instead of the function, see execute
+        self._nodes_executable = False
         super().__init__(
             name=name,
             workflow_metadata=metadata,
@@ -679,7 +892,7 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
 
         with FlyteContextManager.with_context(
             ctx.with_compilation_state(CompilationState(prefix=prefix, task_resolver=self))
-        ) as comp_ctx:
+        ) as comp_ctx, _common_utils.DeferredFullGarbageCollection():
             # Construct the default input promise bindings, but then override with the provided inputs, if any
             input_kwargs = construct_input_promises([k for k in self.interface.inputs.keys()])
             input_kwargs.update(kwargs)
@@ -743,6 +956,10 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
         # Save all the things necessary to create an SdkWorkflow, except for the missing project and domain
         self._nodes = all_nodes
         self._output_bindings = bindings
+        # Conditionals are only evaluated by running the function, and so are outputs the interface does not declare
+        self._nodes_executable = all(
+            isinstance(n.flyte_entity, (PythonTask, WorkflowBase, LaunchPlan, ReferenceEntity)) for n in all_nodes
+        ) and (bool(output_names) or workflow_outputs is None or isinstance(workflow_outputs, VoidPromise))
         if not output_names:
             return None
         if len(output_names) == 1:
@@ -754,7 +971,15 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
         This function is here only to try to streamline the pattern between workflows and tasks. Since tasks
         call execute from dispatch_execute which is in _local_execute, workflows should also call an execute inside
         _local_execute. This makes mocking cleaner.
+
+        If more than one node may run at a time (:py:attr:`flytekit.configuration.sdk.LOCAL_WORKFLOW_WORKERS`), the
+        compiled nodes of the workflow are run instead of the function, so that independent nodes run concurrently.
+        This is only done if every node is a task, workflow or launch plan, conditionals need the function to run.
         """
+        if self._nodes_executable and (
+            _sdk_config.LOCAL_WORKFLOW_WORKERS.get() > 1 or _sdk_config.LOCAL_RELEASE_INTERMEDIATES.get()
+        ):
+            return self._execute_nodes(**kwargs)
         return exception_scopes.user_entry_point(self._workflow_function)(**kwargs)
 
 
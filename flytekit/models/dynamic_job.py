@@ -82,6 +82,25 @@ class DynamicJobSpec(_common.FlyteIdlEntity):
             subworkflows=[workflow.to_flyte_idl() for workflow in self.subworkflows],
         )
 
+    def to_flyte_idl_parts(self):
+        """
+        Yields DynamicJobSpec protobufs that each hold a part of this spec, in field order. Concatenated, their
+        serialized forms are the serialized form of the complete spec, so a large spec can be written without holding
+        all of it in memory as a single protobuf.
+
+        :rtype: Iterator[flyteidl.core.dynamic_job.DynamicJobSpec]
+        """
+        for node in self.nodes or []:
+            yield _dynamic_job.DynamicJobSpec(nodes=[node.to_flyte_idl()])
+        yield _dynamic_job.DynamicJobSpec(
+            min_successes=self.min_successes,
+            outputs=[output.to_flyte_idl() for output in self.outputs or []],
+        )
+        for task in self.tasks or []:
+            yield _dynamic_job.DynamicJobSpec(tasks=[task.to_flyte_idl()])
+        for workflow in self.subworkflows or []:
+            yield _dynamic_job.DynamicJobSpec(subworkflows=[workflow.to_flyte_idl()])
+
     @classmethod
     def from_flyte_idl(cls, pb2_object):
         """
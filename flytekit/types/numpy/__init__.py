@@ -0,0 +1,12 @@
+"""
+Flytekit Numpy Type
+==========================================================
+.. currentmodule:: flytekit.types.numpy
+
+.. autosummary::
+   :toctree: generated/
+
+   NumpyArrayTransformer
+"""
+
+from .ndarray import NumpyArrayTransformer
@@ -0,0 +1,73 @@
+import os
+import typing
+from typing import Type
+
+import numpy as np
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.type_engine import TypeEngine, TypeTransformer, literal_type_kind
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+
+
+class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
+    """
+    Transforms a ``numpy.ndarray`` to and from a single blob in the ``.npy`` format, which records the dtype and the
+    shape of the array in its header. Arrays are loaded using a read only memory map, so that only the parts that are
+    actually accessed are read from disk. Use ``np.array(a)`` to get a writable copy of a received array.
+
+    Arrays of python objects are not supported, as loading them would require unpickling data.
+    """
+
+    NUMPY_ARRAY_FORMAT = "NumpyArray"
+
+    def __init__(self):
+        super().__init__(name="Numpy Array", t=np.ndarray)
+
+    def _blob_type(self) -> _core_types.BlobType:
+        return _core_types.BlobType(
+            format=self.NUMPY_ARRAY_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
+        )
+
+    def get_literal_type(self, t: Type[np.ndarray]) -> LiteralType:
+        return LiteralType(blob=self._blob_type())
+
+    def to_literal(
+        self, ctx: FlyteContext, python_val: np.ndarray, python_type: Type[np.ndarray], expected: LiteralType
+    ) -> Literal:
+        if not isinstance(python_val, np.ndarray):
+            raise AssertionError(f"Expected a numpy.ndarray, received {type(python_val)}")
+        local_path = os.path.join(ctx.file_access.get_random_local_directory(), "array.npy")
+        try:
+            np.save(local_path, python_val, allow_pickle=False)
+        except ValueError as e:
+            raise AssertionError(f"Numpy arrays of dtype {python_val.dtype} are not supported, {e}") from e
+        remote_path = ctx.file_access.get_random_remote_path(local_path)
+        ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+        return Literal(scalar=Scalar(blob=Blob(metadata=BlobMetadata(type=self._blob_type()), uri=remote_path)))
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[np.ndarray]) -> np.ndarray:
+        if not (lv and lv.scalar and lv.scalar.blob):
+            raise AssertionError(f"Cannot convert {lv} to a numpy.ndarray")
+        uri = lv.scalar.blob.uri
+        local_path = uri
+        if ctx.file_access.is_remote(uri):
+            local_path = ctx.file_access.get_random_local_path(uri)
+            ctx.file_access.get_data(uri, local_path, is_multipart=False)
+        return np.load(local_path, mmap_mode="r", allow_pickle=False)
+
+    def reversible_literal_type_kinds(self) -> typing.Optional[typing.Set[typing.Hashable]]:
+        return {literal_type_kind(self.get_literal_type(np.ndarray))}
+
+    def guess_python_type(self, literal_type: LiteralType) -> typing.Type[np.ndarray]:
+        if (
+            literal_type.blob is not None
+            and literal_type.blob.dimensionality == _core_types.BlobType.BlobDimensionality.SINGLE
+            and literal_type.blob.format == self.NUMPY_ARRAY_FORMAT
+        ):
+            return np.ndarray
+        raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+
+TypeEngine.register(NumpyArrayTransformer())
@@ -9,8 +9,10 @@ Flytekit Schema Type
    SchemaFormat
    FlyteSchema
    FlyteSchema.open
+   SchemaManifest
 """
 
+from .manifest import ChunkStatistics, ColumnStatistics, SchemaManifest
 from .types import (
     FlyteSchema,
     LocalIOSchemaReader,
@@ -21,5 +23,8 @@ from .types import (
     SchemaOpenMode,
     SchemaReader,
     SchemaWriter,
+    upload_while_writing,
+    write_to_remote,
 )
+from .types_arrow import ArrowSchemaReader, ArrowSchemaWriter
 from .types_pandas import PandasSchemaReader, PandasSchemaWriter
@@ -0,0 +1,188 @@
+import json
+import os
+import typing
+from dataclasses import dataclass, field
+
+from flytekit.interfaces.data.data_proxy import FileAccessProvider
+
+SCHEMA_MANIFEST_NAME = ".manifest.json"
+"""
+Name of the manifest file in a schema directory. Readers ignore files starting with a dot, so the manifest is never
+mistaken for a chunk of data.
+"""
+
+_MANIFEST_VERSION = 1
+
+
+@dataclass
+class ColumnStatistics(object):
+    """
+    Statistics of a column in one file of a schema. min and max are only recorded for ints, floats, bools and strings,
+    and are None if the file does not have them.
+    """
+
+    min: typing.Any = None
+    max: typing.Any = None
+    null_count: typing.Optional[int] = None
+
+
+@dataclass
+class ChunkStatistics(object):
+    """
+    Statistics of one file of a schema
+    """
+
+    name: str
+    rows: int
+    bytes: int
+    columns: typing.Dict[str, ColumnStatistics] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "columns": {k: {"min": v.min, "max": v.max, "null_count": v.null_count} for k, v in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "ChunkStatistics":
+        return cls(
+            name=d["name"],
+            rows=d["rows"],
+            bytes=d["bytes"],
+            columns={k: ColumnStatistics(**v) for k, v in d.get("columns", {}).items()},
+        )
+
+
+def _may_match_predicate(stats: ColumnStatistics, op: str, value: typing.Any) -> bool:
+    lo, hi = stats.min, stats.max
+    if lo is None or hi is None:
+        return True
+    try:
+        if op in ("=", "=="):
+            return lo <= value <= hi
+        if op == "!=":
+            return not (lo == hi == value)
+        if op == "<":
+            return lo < value
+        if op == "<=":
+            return lo <= value
+        if op == ">":
+            return hi > value
+        if op == ">=":
+            return hi >= value
+        if op == "in":
+            return any(lo <= v <= hi for v in value)
+    except TypeError:
+        # Values that cannot be compared with the statistics never rule out a file
+        return True
+    return True
+
+
+@dataclass
+class SchemaManifest(object):
+    """
+    Describes the files of a schema: their row counts, sizes and per column statistics. The manifest is written next to
+    the files, so the size of a schema can be determined without reading it, and readers can skip files that cannot
+    match a filter without opening them.
+    """
+
+    chunks: typing.List[ChunkStatistics] = field(default_factory=list)
+
+    @property
+    def num_rows(self) -> int:
+        return sum(c.rows for c in self.chunks)
+
+    @property
+    def num_bytes(self) -> int:
+        return sum(c.bytes for c in self.chunks)
+
+    def column_statistics(self, column: str) -> ColumnStatistics:
+        """
+        Returns the statistics of the column over all the files. min and max are None if any file lacks them.
+        """
+        all_stats = [c.columns.get(column, ColumnStatistics()) for c in self.chunks]
+        result = ColumnStatistics()
+        if all(s.null_count is not None for s in all_stats):
+            result.null_count = sum(s.null_count for s in all_stats)
+        if all_stats and all(s.min is not None and s.max is not None for s in all_stats):
+            try:
+                result.min = min(s.min for s in all_stats)
+                result.max = max(s.max for s in all_stats)
+            except TypeError:
+                pass
+        return result
+
+    def excluded(self, filters) -> typing.Set[str]:
+        """
+        Returns the names of the files whose statistics prove that none of their rows match the filters. Filters use
+        the DNF format of pyarrow.parquet.read_table: a list of (column, op, value) tuples that all have to match, or a
+        list of such lists of which any has to match. Other kinds of filters do not exclude any file.
+        """
+        if not filters or not isinstance(filters, (list, tuple)):
+            return set()
+        # Same as pyarrow, a list of predicates is a single conjunction
+        disjunction = [filters] if isinstance(filters[0][0], str) else filters
+
+        def may_match(chunk: ChunkStatistics) -> bool:
+            return any(
+                all(
+                    col not in chunk.columns or _may_match_predicate(chunk.columns[col], op, value)
+                    for col, op, value in conjunction
+                )
+                for conjunction in disjunction
+            )
+
+        return {c.name for c in self.chunks if not may_match(c)}
+
+    def to_json(self) -> str:
+        return json.dumps({"version": _MANIFEST_VERSION, "chunks": [c.to_dict() for c in self.chunks]})
+
+    @staticmethod
+    def invalidated_json() -> str:
+        """
+        Returns the content that replaces a manifest which no longer describes all the files of its schema. It is
+        written over the old manifest, so that copies of it that were already uploaded are replaced as well.
+        """
+        return json.dumps({"version": _MANIFEST_VERSION, "chunks": None})
+
+    @classmethod
+    def from_json(cls, s: str) -> typing.Optional["SchemaManifest"]:
+        """
+        Returns None for an invalidated manifest, which readers treat the same as a schema without a manifest
+        """
+        d = json.loads(s)
+        if d.get("chunks") is None:
+            return None
+        return cls(chunks=[ChunkStatistics.from_dict(c) for c in d["chunks"]])
+
+    def write(self, directory: os.PathLike) -> str:
+        path = os.path.join(directory, SCHEMA_MANIFEST_NAME)
+        with open(path, "w") as f:
+            f.write(self.to_json())
+        return path
+
+    @classmethod
+    def read(cls, directory: os.PathLike) -> typing.Optional["SchemaManifest"]:
+        """
+        Reads the manifest of a local schema directory, returns None if the directory does not have one
+        """
+        path = os.path.join(directory, SCHEMA_MANIFEST_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return cls.from_json(f.read())
+
+    @classmethod
+    def fetch(cls, file_access: FileAccessProvider, remote_path: str) -> typing.Optional["SchemaManifest"]:
+        """
+        Downloads only the manifest of a remote schema, e.g. to show the size of a schema output fetched with
+        FlyteRemote. Returns None if the schema does not have a manifest.
+        """
+        remote = f"{remote_path.rstrip('/')}/{SCHEMA_MANIFEST_NAME}"
+        if not file_access.exists(remote):
+            return None
+        local_dir = file_access.get_random_local_directory()
+        file_access.get_data(remote, os.path.join(local_dir, SCHEMA_MANIFEST_NAME))
+        return cls.read(local_dir)
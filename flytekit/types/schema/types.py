@@ -1,30 +1,38 @@
 from __future__ import annotations
 
+import collections
+import collections.abc
 import datetime as _datetime
+import itertools
 import os
 import typing
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Type
 
 import numpy as _np
 
+from flytekit.configuration import sdk
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager
 from flytekit.core.type_engine import T, TypeEngine, TypeTransformer
 from flytekit.models.literals import Literal, Scalar, Schema
 from flytekit.models.types import LiteralType, SchemaType
 from flytekit.plugins import pandas
+from flytekit.types.schema.manifest import SCHEMA_MANIFEST_NAME, ChunkStatistics, SchemaManifest
 
 
 class SchemaFormat(Enum):
     """
     Represents the the schema storage format (at rest).
-    Currently only parquet is supported
+    Currently parquet and the Arrow IPC file format are supported. Arrow files are read through a memory map without
+    any decoding, which makes them well suited for intermediate data that is only exchanged between python tasks.
+    Readers detect the format of every file, so consumers do not have to declare the format the producer used.
     """
 
     PARQUET = "parquet"
-    # ARROW = "arrow"
+    ARROW = "arrow"
     # HDF5 = "hdf5"
     # CSV = "csv"
     # RECORDIO = "recordio"
@@ -35,11 +43,22 @@ class SchemaOpenMode(Enum):
     WRITE = "w"
 
 
-def generate_ordered_files(directory: os.PathLike, n: int) -> typing.Generator[os.PathLike, None, None]:
-    for i in range(n):
+def generate_ordered_files(
+    directory: os.PathLike, n: typing.Optional[int] = None
+) -> typing.Generator[os.PathLike, None, None]:
+    """
+    Generates the names of the files of a schema in order, without limit if n is not given
+    """
+    for i in range(n) if n is not None else itertools.count():
         yield os.path.join(directory, f"{i:05}")
 
 
+def _ordered_file_key(path: str) -> typing.Tuple[int, str]:
+    # Names longer than the padding of generate_ordered_files (100000 and up) sort after the shorter ones
+    name = os.path.basename(path)
+    return len(name), name
+
+
 class SchemaReader(typing.Generic[T]):
     """
     Base SchemaReader to handle any readers (that can manage their own IO or otherwise)
@@ -75,8 +94,7 @@ class SchemaWriter(typing.Generic[T]):
         self._to_path = to_path
         self._fmt = fmt
         self._columns = cols
-        # TODO This should be change to send a stop instead of hardcoded to 1024
-        self._file_name_gen = generate_ordered_files(self._to_path, 1024)
+        self._file_name_gen = generate_ordered_files(self._to_path)
 
     @property
     def to_path(self) -> str:
@@ -93,41 +111,362 @@ class SchemaWriter(typing.Generic[T]):
         ...
 
 
+def _list_local_files(directory: str) -> typing.List[str]:
+    files = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.startswith(".") and entry.is_file():
+                files.append(entry.path)
+    return sorted(files, key=_ordered_file_key)
+
+
+class _ChunkFetcher(object):
+    """
+    Fetches the files of a remote schema into a local directory. The files written by flytekit are named in order (see
+    generate_ordered_files), so they can be fetched one at a time while the previous one is being read, instead of
+    downloading the whole directory before the first row can be read. Directories that were written by other tools
+    are downloaded as a whole.
+    """
+
+    def __init__(
+        self,
+        remote_path: str,
+        local_path: os.PathLike,
+        downloader: typing.Callable[[str, os.PathLike], None],
+        chunk_downloader: typing.Callable[[str, os.PathLike], bool],
+    ):
+        self._remote_path = remote_path
+        self._local_path = str(local_path)
+        self._downloader = downloader
+        self._chunk_downloader = chunk_downloader
+        self._complete = False
+        self._manifest_fetched = False
+
+    @property
+    def remote_path(self) -> str:
+        return self._remote_path
+
+    @property
+    def complete(self) -> bool:
+        """
+        True once all the files are available locally
+        """
+        return self._complete
+
+    def _download_all(self):
+        if not self._complete:
+            self._downloader(self._remote_path, self._local_path)
+            self._complete = True
+
+    def _fetch_chunk(self, name: str) -> typing.Optional[str]:
+        local = os.path.join(self._local_path, name)
+        if os.path.exists(local) or self._chunk_downloader(f"{self._remote_path.rstrip('/')}/{name}", local):
+            return local
+        return None
+
+    def _fetch_listed_chunk(self, name: str) -> str:
+        f = self._fetch_chunk(name)
+        if f is None:
+            raise ValueError(f"File {name} is listed in the manifest of {self._remote_path}, but does not exist")
+        return f
+
+    def manifest(self) -> typing.Optional[SchemaManifest]:
+        """
+        Returns the manifest of the schema, only the manifest is downloaded if the files were not fetched yet
+        """
+        if not self._complete and not self._manifest_fetched:
+            self._fetch_chunk(SCHEMA_MANIFEST_NAME)
+            self._manifest_fetched = True
+        return SchemaManifest.read(self._local_path)
+
+    def all(self) -> typing.List[str]:
+        """
+        Returns all the local files, downloading the remote directory if it was not fully fetched yet
+        """
+        self._download_all()
+        return _list_local_files(self._local_path)
+
+    def iter(self, exclude: typing.Optional[typing.Set[str]] = None) -> typing.Generator[str, None, None]:
+        """
+        Yields the local files one at a time, downloading the next file in the background while the current one is
+        being consumed. The files named in exclude (listed in the manifest) are not downloaded at all.
+        """
+        if self._complete:
+            yield from (f for f in _list_local_files(self._local_path) if os.path.basename(f) not in (exclude or ()))
+            return
+        manifest = self.manifest()
+        if manifest is None:
+            names = generate_ordered_files("")
+            fetch = self._fetch_chunk
+        else:
+            names = iter([c.name for c in manifest.chunks if c.name not in (exclude or ())])
+            fetch = self._fetch_listed_chunk
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="flyte-schema-fetch") as executor:
+            name = next(names, None)
+            f = fetch(name) if name else None
+            if f is None and manifest is None:
+                self._download_all()
+                yield from _list_local_files(self._local_path)
+                return
+            while f is not None:
+                name = next(names, None)
+                read_ahead = executor.submit(fetch, name) if name else None
+                yield f
+                f = read_ahead.result() if read_ahead else None
+        if not exclude:
+            self._complete = True
+
+
 class LocalIOSchemaReader(SchemaReader[T]):
+    """
+    Base reader for schemas whose files are read from the local file system. Besides the reader specific arguments,
+    iter and all accept ``columns`` to read only a subset of the columns, and ``filters`` (in the DNF format of
+    ``pyarrow.parquet.read_table``) to only read the matching rows. When either is given and the files were not
+    downloaded yet, readers that implement _read_remote read the remote files directly, so only the required parts of
+    the files are transferred.
+    """
+
     def __init__(self, from_path: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(str(from_path), cols, fmt)
+        # Set by FlyteSchema.open, if the files still have to be fetched from the remote location
+        self._fetcher: typing.Optional[_ChunkFetcher] = None
 
     @abstractmethod
     def _read(self, *path: os.PathLike, **kwargs) -> T:
         pass
 
-    def iter(self, **kwargs) -> typing.Generator[T, None, None]:
-        with os.scandir(self._from_path) as it:
-            for entry in it:
-                if not entry.name.startswith(".") and entry.is_file():
-                    yield self._read(entry.path, **kwargs)
+    @abstractmethod
+    def _read_batches(self, files: typing.Iterable[os.PathLike], batch_rows: int, **kwargs) -> typing.Iterator[T]:
+        """
+        Reads the given files as a sequence of dataframes of batch_rows rows each (the last one may be smaller),
+        holding only one batch worth of data in memory at a time.
+        """
+        pass
 
-    def all(self, **kwargs) -> T:
-        files = []
-        with os.scandir(self._from_path) as it:
-            for entry in it:
-                if not entry.name.startswith(".") and entry.is_file():
-                    files.append(entry.path)
+    def _read_remote(self, remote_path: str, exclude: typing.Set[str], **kwargs) -> typing.Optional[T]:
+        """
+        Reads the schema directly from the remote location, skipping the files named in exclude. Returns None if the
+        remote location cannot be read directly, in which case the files are downloaded instead.
+        """
+        return None
+
+    def _iter_remote(
+        self, remote_path: str, exclude: typing.Set[str], batch_rows: typing.Optional[int], **kwargs
+    ) -> typing.Optional[typing.Iterator[T]]:
+        """
+        Same as _read_remote, but yields one dataframe per file, or dataframes of batch_rows rows if it is given.
+        """
+        return None
+
+    def manifest(self) -> typing.Optional[SchemaManifest]:
+        """
+        Returns the manifest of the schema, without fetching its files. None if the schema was written without one.
+        """
+        if self._fetcher:
+            return self._fetcher.manifest()
+        return SchemaManifest.read(self._from_path)
+
+    def _excluded(self, filters) -> typing.Set[str]:
+        # The files that cannot match the filters according to the manifest are not read at all
+        manifest = self.manifest() if filters else None
+        return manifest.excluded(filters) if manifest else set()
+
+    def _can_push_down(self, **kwargs) -> bool:
+        return bool(self._fetcher and not self._fetcher.complete and (kwargs.get("columns") or kwargs.get("filters")))
+
+    def _files(self, exclude: typing.Set[str]) -> typing.Iterable[str]:
+        if self._fetcher:
+            return self._fetcher.iter(exclude)
+        return [f for f in _list_local_files(self._from_path) if os.path.basename(f) not in exclude]
+
+    def iter(self, batch_rows: typing.Optional[int] = None, **kwargs) -> typing.Generator[T, None, None]:
+        """
+        Iterates over the schema one file at a time, or in dataframes of batch_rows rows if batch_rows is given. Remote
+        files are fetched progressively as the iteration goes on.
+        """
+        if batch_rows is not None and batch_rows <= 0:
+            raise ValueError(f"batch_rows should be a positive number, received {batch_rows}")
+        exclude = self._excluded(kwargs.get("filters"))
+        remote = None
+        if self._can_push_down(**kwargs):
+            remote = self._iter_remote(self._fetcher.remote_path, exclude, batch_rows, **kwargs)
+        if remote is not None:
+            yield from remote
+        elif batch_rows is None:
+            for f in self._files(exclude):
+                yield self._read(f, **kwargs)
+        else:
+            yield from self._read_batches(self._files(exclude), batch_rows, **kwargs)
 
-        return self._read(*files, **kwargs)
+    def all(self, **kwargs) -> T:
+        exclude = self._excluded(kwargs.get("filters"))
+        if self._can_push_down(**kwargs):
+            remote = self._read_remote(self._fetcher.remote_path, exclude, **kwargs)
+            if remote is not None:
+                return remote
+        if self._fetcher and not exclude:
+            return self._read(*self._fetcher.all(), **kwargs)
+        return self._read(*self._files(exclude), **kwargs)
 
 
 class LocalIOSchemaWriter(SchemaWriter[T]):
+    SUPPORTS_REMOTE_PATHS = False
+    """
+    Writers that open all their files through _open_output, and can therefore write to a remote path directly, set this
+    to True. See :py:attr:`flytekit.configuration.sdk.SCHEMA_DIRECT_WRITES`
+    """
+
     def __init__(self, to_local_path: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(str(to_local_path), cols, fmt)
+        self._manifest = SchemaManifest()
 
     @abstractmethod
-    def _write(self, df: T, path: os.PathLike, **kwargs):
+    def _write(self, df: T, path: os.PathLike, **kwargs) -> typing.Optional[ChunkStatistics]:
+        """
+        Writes the dataframe to the file. May return the statistics of the file if they are known without reading the
+        file back, otherwise _file_stats is called.
+        """
         pass
 
-    def write(self, *dfs, **kwargs):
-        for df in dfs:
-            self._write(df, next(self._file_name_gen), **kwargs)
+    def _open_output(self, path: os.PathLike) -> typing.BinaryIO:
+        """
+        Opens a file of the schema for writing. Writers that support remote paths return a stream that writes to the
+        remote file system.
+        """
+        return open(path, "wb")
+
+    def _file_stats(self, path: os.PathLike) -> typing.Optional[ChunkStatistics]:
+        """
+        Returns the statistics of a file that was just written. The manifest of the schema is only written if the
+        writer returns statistics for all the files.
+        """
+        return None
+
+    def _partition(self, df: T, partition_rows: int) -> typing.List[T]:
+        """
+        Splits the dataframe into dataframes of at most partition_rows rows, writers that support partitioned writes
+        should override this
+        """
+        return [df]
+
+    def write(
+        self,
+        *dfs,
+        partition_rows: typing.Optional[int] = None,
+        on_file_written: typing.Optional[typing.Callable[[str], None]] = None,
+        **kwargs,
+    ):
+        """
+        Writes every dataframe to its own file. Multiple files are encoded concurrently.
+
+        :param partition_rows: Splits the dataframes into files of at most this many rows, defaults to
+            :py:attr:`flytekit.configuration.sdk.SCHEMA_PARTITION_ROWS`
+        :param on_file_written: Called with the path of every file as soon as it is written, e.g. to upload it while
+            the remaining files are still being encoded
+        """
+        self.write_iter(dfs, partition_rows=partition_rows, on_file_written=on_file_written, **kwargs)
+
+    def write_iter(
+        self,
+        dfs: typing.Iterable[T],
+        partition_rows: typing.Optional[int] = None,
+        on_file_written: typing.Optional[typing.Callable[[str], None]] = None,
+        **kwargs,
+    ):
+        """
+        Same as write, but consumes the dataframes from an iterable (e.g. a generator) as they are being written. At
+        most sdk.schema_write_workers dataframes are being encoded at any time, so the whole result never has to be
+        held in memory.
+        """
+        if partition_rows is None:
+            partition_rows = sdk.SCHEMA_PARTITION_ROWS.get()
+        if partition_rows:
+            dfs = (p for df in dfs for p in self._partition(df, partition_rows))
+
+        def write_file(df: T, path: str) -> typing.Optional[ChunkStatistics]:
+            stats = self._write(df, path, **kwargs)
+            if stats is None:
+                stats = self._file_stats(path)
+            if on_file_written:
+                on_file_written(path)
+            return stats
+
+        workers = max(1, sdk.SCHEMA_WRITE_WORKERS.get())
+        all_stats = []
+        if workers == 1:
+            for df in dfs:
+                all_stats.append(write_file(df, next(self._file_name_gen)))
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flyte-schema-write") as executor:
+                pending = collections.deque()
+                for df in dfs:
+                    if len(pending) >= workers:
+                        all_stats.append(pending.popleft().result())
+                    pending.append(executor.submit(write_file, df, next(self._file_name_gen)))
+                    # Do not hold on to the dataframe while the next one is produced
+                    del df
+                all_stats.extend(f.result() for f in pending)
+
+        if self._manifest is not None and all_stats and all(all_stats):
+            self._manifest.chunks.extend(all_stats)
+            manifest_path = os.path.join(self._to_path, SCHEMA_MANIFEST_NAME)
+            with self._open_output(manifest_path) as f:
+                f.write(self._manifest.to_json().encode("utf-8"))
+            if on_file_written:
+                on_file_written(manifest_path)
+        elif self._manifest is not None and not all(all_stats):
+            # Some of the files are not described, a partial manifest would be wrong. The manifest of an earlier call
+            # may have been written to a remote path or uploaded already, so it is overwritten the same way instead of
+            # being removed
+            written = bool(self._manifest.chunks)
+            self._manifest = None
+            if written:
+                manifest_path = os.path.join(self._to_path, SCHEMA_MANIFEST_NAME)
+                with self._open_output(manifest_path) as f:
+                    f.write(SchemaManifest.invalidated_json().encode("utf-8"))
+                if on_file_written:
+                    on_file_written(manifest_path)
+
+
+def upload_while_writing(
+    ctx: FlyteContext, writer: LocalIOSchemaWriter, remote_path: str, dfs: typing.Iterable[T], **kwargs
+):
+    """
+    Writes the dataframes with the given writer and uploads every file to remote_path as soon as it is written, so that
+    uploading overlaps with encoding the remaining files. dfs may be a generator, in which case every dataframe is
+    uploaded before the whole result is produced.
+    """
+    remote_path = remote_path.rstrip("/")
+    with ThreadPoolExecutor(thread_name_prefix="flyte-schema-upload") as executor:
+        uploads = []
+
+        def upload(path: str):
+            uploads.append(executor.submit(ctx.file_access.put_data, path, f"{remote_path}/{os.path.basename(path)}"))
+
+        writer.write_iter(dfs, on_file_written=upload, **kwargs)
+        for u in uploads:
+            u.result()
+
+
+def write_to_remote(
+    ctx: FlyteContext,
+    writer_type: typing.Type[LocalIOSchemaWriter],
+    remote_path: str,
+    dfs: typing.Iterable[T],
+    cols: typing.Optional[typing.Dict[str, type]],
+    fmt: SchemaFormat,
+    **kwargs,
+):
+    """
+    Writes the dataframes as a schema at remote_path. If sdk.schema_direct_writes is enabled and the writer supports
+    remote paths, the files are encoded straight into the remote file system (as multipart uploads on object stores)
+    without being staged on local disk. Otherwise they are written to a local directory and uploaded while writing.
+    """
+    if sdk.SCHEMA_DIRECT_WRITES.get() and writer_type.SUPPORTS_REMOTE_PATHS:
+        writer_type(remote_path.rstrip("/"), cols, fmt).write_iter(dfs, **kwargs)
+        return
+    writer = writer_type(ctx.file_access.get_random_local_directory(), cols, fmt)
+    upload_while_writing(ctx, writer, remote_path, dfs, **kwargs)
 
 
 @dataclass
@@ -187,6 +526,9 @@ class FlyteSchema(object):
     def __class_getitem__(
         cls, columns: typing.Dict[str, typing.Type], fmt: SchemaFormat = SchemaFormat.PARQUET
     ) -> Type[FlyteSchema]:
+        if isinstance(columns, tuple):
+            # FlyteSchema[columns, fmt]
+            columns, fmt = columns
         if columns is None:
             return FlyteSchema
 
@@ -223,7 +565,13 @@ class FlyteSchema(object):
         remote_path: str = None,
         supported_mode: SchemaOpenMode = SchemaOpenMode.WRITE,
         downloader: typing.Callable[[str, os.PathLike], None] = None,
+        chunk_downloader: typing.Callable[[str, os.PathLike], bool] = None,
     ):
+        """
+        :param downloader: downloads the remote directory to the local path
+        :param chunk_downloader: optional, downloads a single remote file to the local path and returns False if the
+            remote file does not exist. When given, readers fetch the files of the schema progressively.
+        """
 
         if supported_mode == SchemaOpenMode.READ and remote_path is None:
             raise ValueError("To create a FlyteSchema in read mode, remote_path is required")
@@ -242,6 +590,9 @@ class FlyteSchema(object):
         # This is a special attribute that indicates if the data was either downloaded or uploaded
         self._downloaded = False
         self._downloader = downloader
+        self._fetcher = None
+        if downloader and chunk_downloader:
+            self._fetcher = _ChunkFetcher(remote_path, local_path, downloader, chunk_downloader)
 
     @property
     def local_path(self) -> os.PathLike:
@@ -255,6 +606,16 @@ class FlyteSchema(object):
     def supported_mode(self) -> SchemaOpenMode:
         return self._supported_mode
 
+    def manifest(self) -> typing.Optional[SchemaManifest]:
+        """
+        Returns the manifest with the row counts, sizes and column statistics of the files of this schema, e.g. to get
+        the number of rows without reading the data. Only the manifest is downloaded for schemas that were not read
+        yet. Returns None if the schema was written without a manifest.
+        """
+        if self._supported_mode == SchemaOpenMode.READ and not self._downloaded and self._fetcher:
+            return self._fetcher.manifest()
+        return SchemaManifest.read(self.local_path)
+
     def open(
         self, dataframe_fmt: type = pandas.DataFrame, override_mode: SchemaOpenMode = None
     ) -> typing.Union[SchemaReader, SchemaWriter]:
@@ -276,14 +637,19 @@ class FlyteSchema(object):
         h = SchemaEngine.get_handler(dataframe_fmt)
         if not h.handles_remote_io:
             # The Schema Handler does not manage its own IO, and this it will expect the files are on local file-system
+            if mode == SchemaOpenMode.WRITE:
+                return h.writer(self.local_path, self.columns(), self.format())
+            r = h.reader(self.local_path, self.columns(), self.format())
             if self._supported_mode == SchemaOpenMode.READ and not self._downloaded:
                 # Only for readable objects if they are not downloaded already, we should download them
                 # Write objects should already have everything written to
-                self._downloader(self.remote_path, self.local_path)
-                self._downloaded = True
-            if mode == SchemaOpenMode.WRITE:
-                return h.writer(self.local_path, self.columns(), self.format())
-            return h.reader(self.local_path, self.columns(), self.format())
+                if self._fetcher and isinstance(r, LocalIOSchemaReader):
+                    # The reader fetches the files when they are read
+                    r._fetcher = self._fetcher
+                else:
+                    self._downloader(self.remote_path, self.local_path)
+                    self._downloaded = True
+            return r
 
         # Remote IO is handled. So we will just pass the remote reference to the object
         if mode == SchemaOpenMode.WRITE:
@@ -349,16 +715,27 @@ class FlyteSchemaTransformer(TypeTransformer[FlyteSchema]):
             ctx.file_access.put_data(python_val.local_path, remote_path, is_multipart=True)
             return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type(python_type))))
 
-        schema = python_type(
-            local_path=ctx.file_access.get_random_local_directory(),
-            remote_path=ctx.file_access.get_random_remote_directory(),
-        )
-        writer = schema.open(type(python_val))
-        writer.write(python_val)
+        remote_path = ctx.file_access.get_random_remote_directory()
+        dfs = [python_val]
+        if isinstance(python_val, collections.abc.Iterator):
+            # A generator of dataframes, the type of the first one decides which handler writes them
+            first = next(python_val, None)
+            if first is None:
+                # Like the dataframe transformers, an empty generator is an empty schema without any files
+                return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type(python_type))))
+            dfs = itertools.chain([first], python_val)
+            python_val = first
+
         h = SchemaEngine.get_handler(type(python_val))
+        if not h.handles_remote_io and issubclass(h.writer, LocalIOSchemaWriter):
+            write_to_remote(ctx, h.writer, remote_path, dfs, python_type.columns(), python_type.format())
+            return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type(python_type))))
+        schema = python_type(local_path=ctx.file_access.get_random_local_directory(), remote_path=remote_path)
+        writer = schema.open(type(python_val))
+        writer.write(*dfs)
         if not h.handles_remote_io:
-            ctx.file_access.put_data(schema.local_path, schema.remote_path, is_multipart=True)
-        return Literal(scalar=Scalar(schema=Schema(schema.remote_path, self._get_schema_type(python_type))))
+            ctx.file_access.put_data(schema.local_path, remote_path, is_multipart=True)
+        return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type(python_type))))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[FlyteSchema]) -> FlyteSchema:
         if not (lv and lv.scalar and lv.scalar.schema):
@@ -367,13 +744,23 @@ class FlyteSchemaTransformer(TypeTransformer[FlyteSchema]):
         def downloader(x, y):
             ctx.file_access.download_directory(x, y)
 
+        def chunk_downloader(x, y) -> bool:
+            if not ctx.file_access.exists(x):
+                return False
+            ctx.file_access.get_data(x, y)
+            return True
+
         return expected_python_type(
             local_path=ctx.file_access.get_random_local_directory(),
             remote_path=lv.scalar.schema.uri,
             downloader=downloader,
+            chunk_downloader=chunk_downloader,
             supported_mode=SchemaOpenMode.READ,
         )
 
+    def reversible_literal_type_kinds(self) -> typing.Optional[typing.Set[typing.Hashable]]:
+        return {"schema"}
+
     def guess_python_type(self, literal_type: LiteralType) -> Type[T]:
         if not literal_type.schema:
             raise ValueError(f"Cannot reverse {literal_type}")
@@ -0,0 +1,436 @@
+import functools
+import operator
+import os
+import typing
+from typing import Type
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+from flytekit import FlyteContext
+from flytekit.configuration import aws, sdk
+from flytekit.core.local_objects import LocalObjectTable
+from flytekit.core.type_engine import TypeEngine, TypeTransformer
+from flytekit.loggers import logger
+from flytekit.models.literals import Literal, Scalar, Schema
+from flytekit.models.types import LiteralType, SchemaType
+from flytekit.types.schema import (
+    LocalIOSchemaReader,
+    LocalIOSchemaWriter,
+    SchemaEngine,
+    SchemaFormat,
+    SchemaHandler,
+    write_to_remote,
+)
+from flytekit.types.schema.manifest import ChunkStatistics, ColumnStatistics
+
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+_UNKNOWN = object()
+
+# Only values of these types are recorded as min / max statistics, as they can be stored in json as is
+_STATISTICS_TYPES = (bool, int, float, str)
+
+
+def is_arrow_file(path: os.PathLike, filesystem: pafs.FileSystem = None) -> bool:
+    """
+    Returns true if the given file is in the Arrow IPC file format (also known as Feather V2)
+    """
+    if filesystem is not None:
+        with filesystem.open_input_file(path) as f:
+            return f.read(len(_ARROW_FILE_MAGIC)) == _ARROW_FILE_MAGIC
+    with open(path, "rb") as f:
+        return f.read(len(_ARROW_FILE_MAGIC)) == _ARROW_FILE_MAGIC
+
+
+def _file_format(path: os.PathLike, filesystem: pafs.FileSystem = None) -> str:
+    return "ipc" if is_arrow_file(path, filesystem) else "parquet"
+
+
+def _filter_expression(filters) -> typing.Optional[ds.Expression]:
+    """
+    Accepts filters in the DNF format of pyarrow.parquet.read_table, e.g. [("x", ">", 1), ("y", "=", "a")], or an
+    Arrow dataset expression
+    """
+    if not filters or isinstance(filters, ds.Expression):
+        return filters or None
+    # Built here rather than with pyarrow.parquet.filters_to_expression, which needs pyarrow 10
+    if isinstance(filters[0][0], str):
+        filters = [filters]
+    return functools.reduce(
+        operator.or_,
+        [functools.reduce(operator.and_, [_filter_predicate(*f) for f in conjunction]) for conjunction in filters],
+    )
+
+
+_FILTER_COMPARISONS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+def _filter_predicate(column: str, op: str, value) -> ds.Expression:
+    field = ds.field(column)
+    if op in _FILTER_COMPARISONS:
+        return _FILTER_COMPARISONS[op](field, value)
+    if op == "in":
+        return field.isin(value)
+    if op == "not in":
+        return ~field.isin(value)
+    raise ValueError(f"Unsupported filter operator {op!r} for column {column}")
+
+
+def arrow_filesystem(path: str) -> typing.Tuple[pafs.FileSystem, str]:
+    """
+    Returns an Arrow file system that can read the given (remote) path, along with the path within that file system.
+    S3 access uses the same endpoint and credentials as the aws cli.
+    """
+    if path.startswith("s3://"):
+        endpoint = aws.S3_ENDPOINT.get()
+        access_key, secret_key = aws.S3_ACCESS_KEY_ID.get(), aws.S3_SECRET_ACCESS_KEY.get()
+        if endpoint or (access_key and secret_key):
+            kwargs = {"endpoint_override": endpoint} if endpoint else {}
+            if access_key and secret_key:
+                kwargs.update(access_key=access_key, secret_key=secret_key)
+            return pafs.S3FileSystem(**kwargs), path[len("s3://") :]
+    if "://" not in path:
+        return pafs.LocalFileSystem(), os.path.abspath(path)
+    return pafs.FileSystem.from_uri(path)
+
+
+def _select(table: pa.Table, columns: typing.Optional[typing.List[str]]) -> pa.Table:
+    if not columns:
+        return table
+    return pa.Table.from_arrays([table.column(c) for c in columns], names=columns)
+
+
+class ArrowIO(object):
+    """
+    Reads and writes Arrow tables as Arrow IPC files. Files are read through a memory map, so the returned tables
+    reference the data in the (page cache of the) file instead of a copy of it.
+    """
+
+    def _read(self, chunk: os.PathLike, columns: typing.Optional[typing.List[str]]) -> pa.Table:
+        if not is_arrow_file(chunk):
+            return pq.read_table(chunk, columns=columns, memory_map=True)
+        return _select(pa.ipc.open_file(pa.memory_map(str(chunk), "r")).read_all(), columns)
+
+    def read(self, *files: os.PathLike, columns: typing.List[str] = None, filters=None) -> pa.Table:
+        if filters:
+            expression = _filter_expression(filters)
+            tables = [
+                ds.dataset(str(f), format=_file_format(f)).to_table(columns=columns, filter=expression)
+                for f in files
+                if os.path.getsize(f) > 0
+            ]
+        else:
+            tables = [self._read(chunk=f, columns=columns) for f in files if os.path.getsize(f) > 0]
+        if len(tables) == 1:
+            return tables[0]
+        elif len(tables) > 1:
+            # Only combines the chunk lists of the columns, the data is not copied
+            return pa.concat_tables(tables)
+        return pa.table({})
+
+    def _iter_batches(
+        self, chunk: os.PathLike, batch_rows: int, columns: typing.Optional[typing.List[str]], filters
+    ) -> typing.Iterator[pa.RecordBatch]:
+        if filters:
+            dataset = ds.dataset(str(chunk), format=_file_format(chunk))
+            yield from dataset.to_batches(columns=columns, filter=_filter_expression(filters), batch_size=batch_rows)
+            return
+        if not is_arrow_file(chunk):
+            yield from pq.ParquetFile(chunk, memory_map=True).iter_batches(batch_size=batch_rows, columns=columns)
+            return
+        reader = pa.ipc.open_file(pa.memory_map(str(chunk), "r"))
+        for i in range(reader.num_record_batches):
+            yield from _select(pa.Table.from_batches([reader.get_batch(i)]), columns).to_batches()
+
+    @staticmethod
+    def _rebatch(batches: typing.Iterable[pa.RecordBatch], batch_rows: int) -> typing.Generator[pa.Table, None, None]:
+        """
+        Combines the record batches into tables of batch_rows rows each (only the last table may be smaller), holding
+        at most one table worth of record batches at any time.
+        """
+        pending: typing.List[pa.RecordBatch] = []
+        pending_rows = 0
+        for batch in batches:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= batch_rows:
+                table = pa.Table.from_batches(pending)
+                yield table.slice(0, batch_rows)
+                rest = table.slice(batch_rows)
+                pending = rest.to_batches()
+                pending_rows = rest.num_rows
+        if pending_rows:
+            yield pa.Table.from_batches(pending)
+
+    def iter_tables(
+        self, files: typing.Iterable[os.PathLike], batch_rows: int, columns: typing.List[str] = None, filters=None
+    ) -> typing.Generator[pa.Table, None, None]:
+        """
+        Reads the files lazily, as tables of batch_rows rows each. Batches are combined across file boundaries.
+        """
+
+        def batches():
+            for f in files:
+                if os.path.getsize(f) > 0:
+                    yield from self._iter_batches(f, batch_rows, columns, filters)
+
+        return self._rebatch(batches(), batch_rows)
+
+    def remote_dataset(self, remote_path: str, exclude: typing.Collection[str] = ()) -> typing.Optional[ds.Dataset]:
+        """
+        Opens the files of a remote schema as a dataset, without downloading them. Reading from the dataset only
+        fetches the file footers, the column chunks of the selected columns and the row groups whose statistics match
+        the filters. The files named in exclude are left out. Returns None if the remote location cannot be read
+        directly.
+        """
+        try:
+            filesystem, path = arrow_filesystem(remote_path)
+            infos = filesystem.get_file_info(pafs.FileSelector(path))
+            files = sorted(
+                i.path
+                for i in infos
+                if i.type == pafs.FileType.File
+                and i.size
+                and not i.base_name.startswith(".")
+                and i.base_name not in exclude
+            )
+            if not files:
+                return None
+            # All files of a schema are written by the same writer, so only the first one is inspected
+            return ds.dataset(files, format=_file_format(files[0], filesystem), filesystem=filesystem)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logger.warning(f"Cannot read {remote_path} directly, the files will be downloaded instead: {e}")
+            return None
+
+    def read_remote(
+        self, remote_path: str, columns: typing.List[str] = None, filters=None, exclude: typing.Collection[str] = ()
+    ) -> typing.Optional[pa.Table]:
+        dataset = self.remote_dataset(remote_path, exclude)
+        if dataset is None:
+            return None
+        return dataset.to_table(columns=columns, filter=_filter_expression(filters))
+
+    def iter_remote(
+        self,
+        remote_path: str,
+        batch_rows: typing.Optional[int],
+        columns: typing.List[str] = None,
+        filters=None,
+        exclude: typing.Collection[str] = (),
+    ) -> typing.Optional[typing.Iterator[pa.Table]]:
+        """
+        Yields one table per remote file, or tables of batch_rows rows if it is given
+        """
+        dataset = self.remote_dataset(remote_path, exclude)
+        if dataset is None:
+            return None
+        expression = _filter_expression(filters)
+        if batch_rows is None:
+            return (f.to_table(columns=columns, filter=expression) for f in dataset.get_fragments())
+        return self._rebatch(dataset.to_batches(columns=columns, filter=expression, batch_size=batch_rows), batch_rows)
+
+    @staticmethod
+    def _table_stats(table: pa.Table, stats: ChunkStatistics):
+        stats.rows = table.num_rows
+        for name, column in zip(table.column_names, table.columns):
+            merged = ColumnStatistics(null_count=column.null_count)
+            try:
+                min_max = pc.min_max(column)
+                lo, hi = min_max["min"].as_py(), min_max["max"].as_py()
+                if isinstance(lo, _STATISTICS_TYPES) and isinstance(hi, _STATISTICS_TYPES):
+                    merged.min, merged.max = lo, hi
+            except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                pass
+            stats.columns[name] = merged
+
+    def file_stats(self, path: os.PathLike, table: typing.Optional[pa.Table] = None) -> ChunkStatistics:
+        """
+        Computes the statistics of a file, which may be on a remote file system. For parquet files they are taken from
+        the footer, which the parquet writer already computed, Arrow files are scanned through a memory map unless the
+        table that was written to the file is given.
+        """
+        fs, p = arrow_filesystem(str(path))
+        stats = ChunkStatistics(name=os.path.basename(p), rows=0, bytes=fs.get_file_info(p).size)
+        if stats.bytes == 0:
+            return stats
+        if table is not None:
+            self._table_stats(table, stats)
+            return stats
+        if not is_arrow_file(p, fs):
+            with fs.open_input_file(p) as f:
+                md = pq.read_metadata(f)
+            stats.rows = md.num_rows
+            for rg in range(md.num_row_groups):
+                row_group = md.row_group(rg)
+                for c in range(row_group.num_columns):
+                    column = row_group.column(c)
+                    s = column.statistics
+                    if rg == 0:
+                        stats.columns[column.path_in_schema] = ColumnStatistics(null_count=0)
+                    merged = stats.columns[column.path_in_schema]
+                    if s is None or not s.has_null_count:
+                        merged.null_count = None
+                    elif merged.null_count is not None:
+                        merged.null_count += s.null_count
+                    if s is None or not s.has_min_max or not isinstance(s.min, _STATISTICS_TYPES):
+                        merged.min = merged.max = _UNKNOWN
+                    elif merged.min is not _UNKNOWN:
+                        merged.min = s.min if merged.min is None else min(merged.min, s.min)
+                        merged.max = s.max if merged.max is None else max(merged.max, s.max)
+            for merged in stats.columns.values():
+                if merged.min is _UNKNOWN:
+                    merged.min = merged.max = None
+            return stats
+        source = pa.memory_map(p, "r") if isinstance(fs, pafs.LocalFileSystem) else fs.open_input_file(p)
+        with source:
+            self._table_stats(pa.ipc.open_file(source).read_all(), stats)
+        return stats
+
+    def open_output(self, path: os.PathLike) -> pa.NativeFile:
+        """
+        Opens a file for writing, which may be on a remote file system. Files on an object store are sent as a
+        multipart upload while they are being written, so they never need space on local disk.
+        """
+        fs, p = arrow_filesystem(str(path))
+        if isinstance(fs, pafs.LocalFileSystem):
+            fs.create_dir(os.path.dirname(p), recursive=True)
+        return fs.open_output_stream(p, compression=None)
+
+    def write(self, table: pa.Table, to_file: typing.Union[os.PathLike, pa.NativeFile]):
+        """
+        Writes the table as an Arrow IPC file to the given path or to an open sink, e.g. from open_output
+        """
+        if isinstance(to_file, pa.NativeFile):
+            writer = pa.ipc.new_file(to_file, table.schema)
+            try:
+                writer.write_table(table)
+            finally:
+                writer.close()
+            return
+        with pa.OSFile(str(to_file), "wb") as sink:
+            self.write(table, sink)
+
+
+_ARROW_IO = ArrowIO()
+
+
+class ArrowSchemaReader(LocalIOSchemaReader[pa.Table]):
+    def __init__(self, local_dir: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
+        super().__init__(local_dir, cols, fmt)
+
+    def _read(self, *path: os.PathLike, columns: typing.List[str] = None, filters=None, **kwargs) -> pa.Table:
+        return _ARROW_IO.read(*path, columns=columns or self.column_names, filters=filters)
+
+    def _read_batches(
+        self,
+        files: typing.Iterable[os.PathLike],
+        batch_rows: int,
+        columns: typing.List[str] = None,
+        filters=None,
+        **kwargs,
+    ) -> typing.Iterator[pa.Table]:
+        return _ARROW_IO.iter_tables(files, batch_rows, columns=columns or self.column_names, filters=filters)
+
+    def _read_remote(
+        self, remote_path: str, exclude: typing.Set[str], columns: typing.List[str] = None, filters=None, **kwargs
+    ) -> typing.Optional[pa.Table]:
+        return _ARROW_IO.read_remote(
+            remote_path, columns=columns or self.column_names, filters=filters, exclude=exclude
+        )
+
+    def _iter_remote(
+        self,
+        remote_path: str,
+        exclude: typing.Set[str],
+        batch_rows: typing.Optional[int],
+        columns: typing.List[str] = None,
+        filters=None,
+        **kwargs,
+    ) -> typing.Optional[typing.Iterator[pa.Table]]:
+        return _ARROW_IO.iter_remote(
+            remote_path, batch_rows, columns=columns or self.column_names, filters=filters, exclude=exclude
+        )
+
+
+class ArrowSchemaWriter(LocalIOSchemaWriter[pa.Table]):
+    SUPPORTS_REMOTE_PATHS = True
+
+    def __init__(self, local_dir: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
+        super().__init__(local_dir, cols, fmt)
+
+    def _partition(self, df: pa.Table, partition_rows: int) -> typing.List[pa.Table]:
+        return [df.slice(i, partition_rows) for i in range(0, df.num_rows, partition_rows)] or [df]
+
+    def _file_stats(self, path: os.PathLike) -> ChunkStatistics:
+        return _ARROW_IO.file_stats(path)
+
+    def _open_output(self, path: os.PathLike) -> pa.NativeFile:
+        return _ARROW_IO.open_output(path)
+
+    def _write(self, df: pa.Table, path: os.PathLike, **kwargs) -> typing.Optional[ChunkStatistics]:
+        with self._open_output(path) as sink:
+            if self._fmt != SchemaFormat.ARROW:
+                pq.write_table(df, sink, **kwargs)
+                return None
+            _ARROW_IO.write(df, to_file=sink)
+        return _ARROW_IO.file_stats(path, table=df)
+
+
+class ArrowTableTransformer(TypeTransformer[pa.Table]):
+    """
+    Transforms a pyarrow.Table to Schema without column types.
+    """
+
+    def __init__(self):
+        super().__init__("ArrowTable<->GenericSchema", pa.Table)
+
+    @staticmethod
+    def _get_schema_type() -> SchemaType:
+        return SchemaType(columns=[])
+
+    def get_literal_type(self, t: Type[pa.Table]) -> LiteralType:
+        return LiteralType(schema=self._get_schema_type())
+
+    def to_literal(
+        self,
+        ctx: FlyteContext,
+        python_val: typing.Union[pa.Table, typing.Iterable[pa.Table]],
+        python_type: Type[pa.Table],
+        expected: LiteralType,
+    ) -> Literal:
+        remote_path = ctx.file_access.get_random_remote_directory()
+        # Besides a single dataframe, an iterator of dataframes (e.g. a generator) is written one dataframe at a time
+        dfs = [python_val] if isinstance(python_val, pa.Table) else python_val
+        fmt = SchemaFormat(sdk.DATAFRAME_FORMAT.get())
+        write = functools.partial(write_to_remote, ctx, ArrowSchemaWriter, remote_path, dfs, cols=None, fmt=fmt)
+        objects = LocalObjectTable.current(ctx)
+        if objects is not None and isinstance(python_val, pa.Table):
+            # Only written if a consumer needs it in another form. Tables are immutable, so consumers can share it
+            objects.put(remote_path, python_val, python_type, write)
+        else:
+            write()
+        return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type())))
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[pa.Table]) -> pa.Table:
+        if not (lv and lv.scalar and lv.scalar.schema):
+            return pa.table({})
+        local_dir = ctx.file_access.get_random_local_directory()
+        ctx.file_access.download_directory(lv.scalar.schema.uri, local_dir)
+        r = ArrowSchemaReader(local_dir=local_dir, cols=None, fmt=SchemaFormat.ARROW)
+        return r.all()
+
+
+SchemaEngine.register_handler(SchemaHandler("arrow-table-schema", pa.Table, ArrowSchemaReader, ArrowSchemaWriter))
+TypeEngine.register(ArrowTableTransformer())
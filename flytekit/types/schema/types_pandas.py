@@ -1,29 +1,45 @@
+import functools
 import os
 import typing
 from typing import Type
 
+import pyarrow
+import pyarrow.parquet as pq
+
 from flytekit import FlyteContext
 from flytekit.configuration import sdk
+from flytekit.core.local_objects import LocalObjectTable
 from flytekit.core.type_engine import T, TypeEngine, TypeTransformer
 from flytekit.models.literals import Literal, Scalar, Schema
 from flytekit.models.types import LiteralType, SchemaType
 from flytekit.plugins import pandas
-from flytekit.types.schema import LocalIOSchemaReader, LocalIOSchemaWriter, SchemaEngine, SchemaFormat, SchemaHandler
+from flytekit.types.schema import (
+    LocalIOSchemaReader,
+    LocalIOSchemaWriter,
+    SchemaEngine,
+    SchemaFormat,
+    SchemaHandler,
+    write_to_remote,
+)
+from flytekit.types.schema.manifest import ChunkStatistics
+from flytekit.types.schema.types_arrow import _ARROW_IO, is_arrow_file
 
 
 class ParquetIO(object):
     PARQUET_ENGINE = "pyarrow"
 
-    def _read(self, chunk: os.PathLike, columns: typing.List[str], **kwargs) -> pandas.DataFrame:
-        return pandas.read_parquet(chunk, columns=columns, engine=self.PARQUET_ENGINE, **kwargs)
+    def _read_table(self, files: typing.List[str], columns: typing.List[str], **kwargs) -> pyarrow.Table:
+        # Multiple files are scanned as a single dataset, so they are read and decoded concurrently and combined into
+        # one table without copying
+        return pq.read_table(files if len(files) > 1 else files[0], columns=columns, memory_map=True, **kwargs)
 
     def read(self, *files: os.PathLike, columns: typing.List[str] = None, **kwargs) -> pandas.DataFrame:
-        frames = [self._read(chunk=f, columns=columns, **kwargs) for f in files if os.path.getsize(f) > 0]
-        if len(frames) == 1:
-            return frames[0]
-        elif len(frames) > 1:
-            return pandas.concat(frames, copy=True)
-        return pandas.DataFrame()
+        files = [str(f) for f in files if os.path.getsize(f) > 0]
+        if not files:
+            return pandas.DataFrame()
+        # The table is not referenced anywhere else, so its buffers are released as the columns are converted and
+        # the data is only held twice one column at a time
+        return self._read_table(files, columns, **kwargs).to_pandas(split_blocks=True, self_destruct=True)
 
     def write(
         self,
@@ -36,7 +52,7 @@ class ParquetIO(object):
         """
         Writes data frame as a chunk to the local directory owned by the Schema object.  Will later be uploaded to s3.
         :param df: data frame to write as parquet
-        :param to_file: Sink file to write the dataframe to
+        :param to_file: Sink file to write the dataframe to, either a path or an open file
         :param coerce_timestamps: format to store timestamp in parquet. 'us', 'ms', 's' are allowed values.
             Note: if your timestamps will lose data due to the coercion, your write will fail!  Nanoseconds are
             problematic in the Parquet format and will not work. See allow_truncated_timestamps.
@@ -58,15 +74,20 @@ class ParquetIO(object):
 class FastParquetIO(ParquetIO):
     PARQUET_ENGINE = "fastparquet"
 
-    def _read(self, chunk: os.PathLike, columns: typing.List[str], **kwargs) -> pandas.DataFrame:
+    def read(self, *files: os.PathLike, columns: typing.List[str] = None, **kwargs) -> pandas.DataFrame:
         from fastparquet import ParquetFile as _ParquetFile
         from fastparquet import thrift_structures as _ts
 
+        files = [str(f) for f in files if os.path.getsize(f) > 0]
+        if not files:
+            return pandas.DataFrame()
+        # All files are scanned as one dataset, which allocates the resulting data frame once and fills it in place,
+        # instead of concatenating (and copying) a data frame per file
+        pf = _ParquetFile(files if len(files) > 1 else files[0])
         # TODO Follow up to figure out if this is not needed anymore
         # https://github.com/dask/fastparquet/issues/414#issuecomment-478983811
-        df = pandas.read_parquet(chunk, columns=columns, engine=self.PARQUET_ENGINE, index=False)
+        df = pf.to_pandas(columns=columns, index=False)
         df_column_types = df.dtypes
-        pf = _ParquetFile(chunk)
         schema_column_dtypes = {l.name: l.type for l in list(pf.schema.schema_elements)}
 
         for idx in df_column_types[df_column_types == "float16"].index.tolist():
@@ -90,17 +111,74 @@ class PandasSchemaReader(LocalIOSchemaReader[pandas.DataFrame]):
         super().__init__(local_dir, cols, fmt)
         self._parquet_engine = _PARQUETIO_ENGINES[sdk.PARQUET_ENGINE.get()]
 
-    def _read(self, *path: os.PathLike, **kwargs) -> pandas.DataFrame:
-        return self._parquet_engine.read(*path, columns=self.column_names, **kwargs)
+    def _read(self, *path: os.PathLike, columns: typing.List[str] = None, filters=None, **kwargs) -> pandas.DataFrame:
+        columns = columns or self.column_names
+        files = [p for p in path if os.path.getsize(p) > 0]
+        if filters or (files and all(is_arrow_file(p) for p in files)):
+            # The chunks are combined as arrow tables, so the data is only copied once, when converting to pandas
+            table = _ARROW_IO.read(*files, columns=columns, filters=filters)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        return self._parquet_engine.read(*path, columns=columns, **kwargs)
+
+    def _read_batches(
+        self,
+        files: typing.Iterable[os.PathLike],
+        batch_rows: int,
+        columns: typing.List[str] = None,
+        filters=None,
+        **kwargs,
+    ) -> typing.Iterator[pandas.DataFrame]:
+        # Batches are always decoded with pyarrow, which can read a parquet file one row group at a time
+        for table in _ARROW_IO.iter_tables(files, batch_rows, columns=columns or self.column_names, filters=filters):
+            yield table.to_pandas()
+
+    def _read_remote(
+        self, remote_path: str, exclude: typing.Set[str], columns: typing.List[str] = None, filters=None, **kwargs
+    ) -> typing.Optional[pandas.DataFrame]:
+        table = _ARROW_IO.read_remote(
+            remote_path, columns=columns or self.column_names, filters=filters, exclude=exclude
+        )
+        return None if table is None else table.to_pandas()
+
+    def _iter_remote(
+        self,
+        remote_path: str,
+        exclude: typing.Set[str],
+        batch_rows: typing.Optional[int],
+        columns: typing.List[str] = None,
+        filters=None,
+        **kwargs,
+    ) -> typing.Optional[typing.Iterator[pandas.DataFrame]]:
+        tables = _ARROW_IO.iter_remote(
+            remote_path, batch_rows, columns=columns or self.column_names, filters=filters, exclude=exclude
+        )
+        return None if tables is None else (t.to_pandas() for t in tables)
 
 
 class PandasSchemaWriter(LocalIOSchemaWriter[pandas.DataFrame]):
+    SUPPORTS_REMOTE_PATHS = True
+
     def __init__(self, local_dir: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(local_dir, cols, fmt)
         self._parquet_engine = _PARQUETIO_ENGINES[sdk.PARQUET_ENGINE.get()]
 
-    def _write(self, df: T, path: os.PathLike, **kwargs):
-        return self._parquet_engine.write(df, to_file=path, **kwargs)
+    def _partition(self, df: pandas.DataFrame, partition_rows: int) -> typing.List[pandas.DataFrame]:
+        return [df.iloc[i : i + partition_rows] for i in range(0, len(df), partition_rows)] or [df]
+
+    def _file_stats(self, path: os.PathLike) -> ChunkStatistics:
+        return _ARROW_IO.file_stats(path)
+
+    def _open_output(self, path: os.PathLike) -> pyarrow.NativeFile:
+        return _ARROW_IO.open_output(path)
+
+    def _write(self, df: T, path: os.PathLike, **kwargs) -> typing.Optional[ChunkStatistics]:
+        with self._open_output(path) as sink:
+            if self._fmt != SchemaFormat.ARROW:
+                self._parquet_engine.write(df, to_file=sink, **kwargs)
+                return None
+            table = pyarrow.Table.from_pandas(df)
+            _ARROW_IO.write(table, to_file=sink)
+        return _ARROW_IO.file_stats(path, table=table)
 
 
 class PandasDataFrameTransformer(TypeTransformer[pandas.DataFrame]):
@@ -122,15 +200,21 @@ class PandasDataFrameTransformer(TypeTransformer[pandas.DataFrame]):
     def to_literal(
         self,
         ctx: FlyteContext,
-        python_val: pandas.DataFrame,
+        python_val: typing.Union[pandas.DataFrame, typing.Iterable[pandas.DataFrame]],
         python_type: Type[pandas.DataFrame],
         expected: LiteralType,
     ) -> Literal:
-        local_dir = ctx.file_access.get_random_local_directory()
-        w = PandasSchemaWriter(local_dir=local_dir, cols=None, fmt=SchemaFormat.PARQUET)
-        w.write(python_val)
         remote_path = ctx.file_access.get_random_remote_directory()
-        ctx.file_access.put_data(local_dir, remote_path, is_multipart=True)
+        # Besides a single dataframe, an iterator of dataframes (e.g. a generator) is written one dataframe at a time
+        dfs = [python_val] if isinstance(python_val, pandas.DataFrame) else python_val
+        fmt = SchemaFormat(sdk.DATAFRAME_FORMAT.get())
+        write = functools.partial(write_to_remote, ctx, PandasSchemaWriter, remote_path, dfs, cols=None, fmt=fmt)
+        objects = LocalObjectTable.current(ctx)
+        if objects is not None and isinstance(python_val, pandas.DataFrame):
+            # Only written if a consumer needs it in another form, consumers get a copy they are free to modify
+            objects.put(remote_path, python_val, python_type, write, copy=pandas.DataFrame.copy)
+        else:
+            write()
         return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type())))
 
     def to_python_value(
@@ -0,0 +1,93 @@
+"""
+Measures the compilation and serialization of workflows with many nodes, which should grow linearly with the number
+of nodes. Run with ``pytest tests/flytekit/benchmark -s`` to see the timings.
+"""
+import time
+import typing
+from collections import OrderedDict
+
+from flytekit.common import utils
+from flytekit.common.translator import get_serializable
+from flytekit.core.context_manager import (
+    ExecutionState,
+    FlyteContextManager,
+    Image,
+    ImageConfig,
+    SerializationSettings,
+)
+from flytekit.core.dynamic_workflow_task import dynamic
+from flytekit.core.task import task
+from flytekit.core.workflow import workflow
+
+N = 10000
+
+serialization_settings = SerializationSettings(
+    project="project",
+    domain="domain",
+    version="version",
+    env=None,
+    image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
+)
+
+
+@task
+def t1(a: int) -> int:
+    return a + 1
+
+
+@task
+def combine(a: typing.List[int]) -> int:
+    return sum(a)
+
+
+def fan_out(n: int) -> int:
+    # Half of the nodes form a chain, the other half fan out from it and are gathered into a list
+    x = 0
+    outputs = []
+    for _ in range(n // 2):
+        x = t1(a=x)
+        outputs.append(t1(a=x))
+    return combine(a=outputs)
+
+
+def test_large_workflow_compilation_benchmark():
+    def wf() -> int:
+        return fan_out(N)
+
+    start = time.perf_counter()
+    compiled = workflow(wf)
+    compiled.compile()
+    compile_t = time.perf_counter() - start
+
+    start = time.perf_counter()
+    spec = get_serializable(OrderedDict(), serialization_settings, compiled)
+    serialize_t = time.perf_counter() - start
+
+    assert len(spec.template.nodes) == N + 1
+    print(f"\n{N} node workflow: compile {compile_t:.2f}s, serialize {serialize_t:.2f}s")
+
+
+def test_large_dynamic_workflow_compilation_benchmark():
+    @dynamic
+    def dyn(n: int) -> int:
+        return fan_out(n)
+
+    ctx = FlyteContextManager.current_context().with_serialization_settings(serialization_settings)
+    with FlyteContextManager.with_context(ctx) as ctx:
+        ctx = ctx.with_execution_state(ctx.execution_state.with_params(mode=ExecutionState.Mode.TASK_EXECUTION))
+        with FlyteContextManager.with_context(ctx) as ctx:
+            start = time.perf_counter()
+            spec = dyn.compile_into_workflow(ctx, dyn._task_function, n=N)
+            dynamic_t = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with utils.AutoDeletingTempDir("futures") as tmp:
+        size = utils.write_proto_parts_to_file(spec.to_flyte_idl_parts(), tmp.get_named_tempfile("futures.pb"))
+    write_t = time.perf_counter() - start
+
+    assert len(spec.nodes) == N + 1
+    assert len(spec.tasks) == 2
+    print(
+        f"\n{N} node dynamic workflow: compile_into_workflow {dynamic_t:.2f}s,"
+        f" futures.pb of {size / 1024 / 1024:.1f}MiB written in {write_t:.2f}s"
+    )
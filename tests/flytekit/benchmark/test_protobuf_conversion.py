@@ -0,0 +1,50 @@
+"""
+Compares the Binary encoding of protobuf messages against the Struct encoding used by default. Run with
+``pytest tests/flytekit/benchmark -s`` to see the timings.
+"""
+import os
+import timeit
+
+import mock
+from flyteidl.core import literals_pb2
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import ProtobufTransformer
+from flytekit.models.literals import Literal
+
+
+def _make_message(n: int) -> literals_pb2.LiteralCollection:
+    m = literals_pb2.LiteralCollection()
+    for i in range(n):
+        lit = m.literals.add()
+        if i % 2:
+            lit.scalar.primitive.integer = i * 1000003
+        else:
+            lit.scalar.primitive.string_value = f"value-{i}"
+    return m
+
+
+def test_protobuf_binary_benchmark():
+    ctx = FlyteContextManager.current_context()
+    pt = ProtobufTransformer()
+    t = literals_pb2.LiteralCollection
+    lt = pt.get_literal_type(t)
+    m = _make_message(1000)
+
+    def round_trip():
+        lv = pt.to_literal(ctx, m, t, lt)
+        # Includes the serialization into the inputs/outputs files
+        lv = Literal.from_flyte_idl(literals_pb2.Literal.FromString(lv.to_flyte_idl().SerializeToString()))
+        return pt.to_python_value(ctx, lv, t), lv.to_flyte_idl().ByteSize()
+
+    struct_m, struct_size = round_trip()
+    struct_t = min(timeit.repeat(round_trip, number=3, repeat=3))
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_PROTOBUF_BINARY_LITERALS": "True"}):
+        binary_m, binary_size = round_trip()
+        binary_t = min(timeit.repeat(round_trip, number=3, repeat=3))
+
+    assert struct_m == m and binary_m == m
+    print(
+        f"\nprotobuf: struct {struct_t:.4f}s ({struct_size} bytes), binary {binary_t:.4f}s ({binary_size} bytes), "
+        f"speedup {struct_t / binary_t:.2f}x"
+    )
@@ -0,0 +1,78 @@
+"""
+Compares the direct dict <-> Struct conversion used by the Dataclass and Dict transformers against the json string
+round trip it replaced. Run with ``pytest tests/flytekit/benchmark -s`` to see the timings.
+"""
+import json
+import timeit
+import typing
+from dataclasses import dataclass
+
+from dataclasses_json import dataclass_json
+from google.protobuf import json_format, struct_pb2
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import DictTransformer, TypeEngine
+
+
+@dataclass_json
+@dataclass
+class Inner(object):
+    i: int
+    f: float
+    s: str
+    ids: typing.List[int]
+
+
+@dataclass_json
+@dataclass
+class Config(object):
+    name: str
+    inners: typing.List[Inner]
+    weights: typing.Dict[str, int]
+
+
+def _make_config(n: int) -> Config:
+    return Config(
+        name="config",
+        inners=[Inner(i=i, f=i / 3, s=str(i), ids=list(range(10))) for i in range(n)],
+        weights={str(i): i for i in range(n)},
+    )
+
+
+def _legacy_dataclass_round_trip(o: Config) -> Config:
+    generic = json_format.Parse(o.to_json(), struct_pb2.Struct())
+    return Config.from_json(json_format.MessageToJson(generic))
+
+
+def _report(name: str, legacy: float, current: float):
+    print(f"\n{name}: json round trip {legacy:.4f}s, direct {current:.4f}s, speedup {legacy / current:.2f}x")
+
+
+def test_dataclass_struct_benchmark():
+    ctx = FlyteContextManager.current_context()
+    o = _make_config(200)
+    lt = TypeEngine.to_literal_type(Config)
+
+    def current():
+        return TypeEngine.to_python_value(ctx, TypeEngine.to_literal(ctx, o, Config, lt), Config)
+
+    assert current() == o
+    legacy_t = min(timeit.repeat(lambda: _legacy_dataclass_round_trip(o), number=5, repeat=3))
+    current_t = min(timeit.repeat(current, number=5, repeat=3))
+    _report("dataclass", legacy_t, current_t)
+
+
+def test_generic_dict_struct_benchmark():
+    ctx = FlyteContextManager.current_context()
+    d = {f"k{i}": {"a": i, "b": [float(x) for x in range(20)], "c": {"d": "e" * 10, "f": None}} for i in range(500)}
+
+    def legacy():
+        return json.loads(json_format.MessageToJson(json_format.Parse(json.dumps(d), struct_pb2.Struct())))
+
+    def current():
+        return TypeEngine.to_python_value(ctx, DictTransformer.dict_to_generic_literal(d), dict)
+
+    assert current() == legacy()
+    legacy_t = min(timeit.repeat(legacy, number=5, repeat=3))
+    current_t = min(timeit.repeat(current, number=5, repeat=3))
+    _report("generic dict", legacy_t, current_t)
@@ -0,0 +1,24 @@
+from click.testing import CliRunner
+
+from flytekit.clis.sdk_in_container import pyflyte
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.local_cache import LocalTaskCache
+from flytekit.models.literals import LiteralMap
+
+
+def test_local_cache(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    cache = LocalTaskCache(str(tmp_path))
+    cache.put(ctx, "k1", "wf.t1", "1", LiteralMap(literals={}))
+    cache.put(ctx, "k2", "wf.t2", "1", LiteralMap(literals={}))
+
+    runner = CliRunner()
+    result = runner.invoke(pyflyte.main, ["local-cache", "-d", str(tmp_path), "list"])
+    assert result.exit_code == 0
+    assert "2 entries" in result.output
+    assert "wf.t1" in result.output and "wf.t2" in result.output
+
+    result = runner.invoke(pyflyte.main, ["local-cache", "-d", str(tmp_path), "clear", "--task", "wf.t1"])
+    assert result.exit_code == 0
+    assert "Removed 1 entries" in result.output
+    assert [e.task_name for e in cache.entries()] == ["wf.t2"]
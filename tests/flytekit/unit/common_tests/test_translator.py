@@ -124,3 +124,24 @@ def test_container():
     )
     task_spec = get_serializable(OrderedDict(), ssettings, t2)
     assert "pyflyte" not in task_spec.template.container.args
+
+
+def test_sub_workflows_deduplicated():
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    @workflow
+    def inner(a: int) -> int:
+        return t1(a=a)
+
+    @workflow
+    def middle(a: int) -> int:
+        return inner(a=inner(a=a))
+
+    @workflow
+    def outer(a: int) -> int:
+        return middle(a=inner(a=middle(a=a)))
+
+    wf_spec = get_serializable(OrderedDict(), serialization_settings, outer)
+    assert [sub_wf.id.name for sub_wf in wf_spec.sub_workflows] == [middle.name, inner.name]
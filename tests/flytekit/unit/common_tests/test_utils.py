@@ -0,0 +1,31 @@
+import gc
+import threading
+
+from flytekit.common.utils import DeferredFullGarbageCollection
+
+
+def test_deferred_full_garbage_collection_nested():
+    original = gc.get_threshold()
+    with DeferredFullGarbageCollection(factor=10):
+        assert gc.get_threshold() == (original[0], original[1], original[2] * 10)
+        with DeferredFullGarbageCollection(factor=10):
+            assert gc.get_threshold()[2] == original[2] * 10
+        assert gc.get_threshold()[2] == original[2] * 10
+    assert gc.get_threshold() == original
+
+
+def test_deferred_full_garbage_collection_threads():
+    original = gc.get_threshold()
+    entered = threading.Barrier(8)
+
+    def run():
+        with DeferredFullGarbageCollection(factor=10):
+            # All the threads are inside at the same time and exit in any order
+            entered.wait()
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert gc.get_threshold() == original
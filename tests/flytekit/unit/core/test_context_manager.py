@@ -1,3 +1,8 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from flytekit.core.context_manager import ExecutionState, FlyteContext, FlyteContextManager, look_up_image_info
 
 
@@ -65,3 +70,104 @@ def test_additional_context():
             )
         ) as exec_ctx_inner:
             assert exec_ctx_inner.execution_state.additional_context == {1: "inner", 2: "foo", 3: "baz"}
+
+
+def test_run_in_thread():
+    b = FlyteContextManager.current_context().new_builder()
+    b.flyte_client = SampleTestClass(value=1)
+    with FlyteContextManager.with_context(b) as outer:
+        size = FlyteContextManager.size()
+
+        def push_and_read(value: int) -> int:
+            assert FlyteContextManager.current_context() is outer
+            b = FlyteContextManager.current_context().new_builder()
+            b.flyte_client = SampleTestClass(value=value)
+            with FlyteContextManager.with_context(b) as ctx:
+                return ctx.flyte_client.value
+
+        with ThreadPoolExecutor(4) as executor:
+            values = list(executor.map(FlyteContextManager.run_in_thread(push_and_read), range(100)))
+        assert values == list(range(100))
+        # The threads pushed onto copies of the stack
+        assert FlyteContextManager.size() == size
+        assert FlyteContextManager.current_context() is outer
+
+
+def _with_client(ctx: FlyteContext, value) -> FlyteContext.Builder:
+    b = ctx.new_builder()
+    b.flyte_client = SampleTestClass(value=value)
+    return b
+
+
+def test_threads_have_their_own_stack():
+    n = 8
+    barrier = threading.Barrier(n, timeout=10)
+    outer = FlyteContextManager.current_context()
+    size = FlyteContextManager.size()
+
+    def push_wait_pop(value: int) -> int:
+        # Threads start with the default context only
+        assert FlyteContextManager.size() == 1
+        with FlyteContextManager.with_context(_with_client(FlyteContextManager.current_context(), value)) as ctx:
+            # All threads have pushed their context when they pass the barrier
+            barrier.wait()
+            for _ in range(100):
+                with FlyteContextManager.with_context(_with_client(ctx, -value)):
+                    assert FlyteContextManager.current_context().flyte_client.value == -value
+                assert FlyteContextManager.current_context() is ctx
+            barrier.wait()
+            assert FlyteContextManager.size() == 2
+            return FlyteContextManager.current_context().flyte_client.value
+
+    with ThreadPoolExecutor(n) as executor:
+        assert list(executor.map(push_wait_pop, range(n))) == list(range(n))
+    assert FlyteContextManager.current_context() is outer and FlyteContextManager.size() == size
+
+
+def test_coroutines_have_their_own_stack():
+    async def push_and_yield(value: int) -> int:
+        with FlyteContextManager.with_context(_with_client(FlyteContextManager.current_context(), value)) as ctx:
+            for _ in range(10):
+                await asyncio.sleep(0)
+                assert FlyteContextManager.current_context() is ctx
+            return ctx.flyte_client.value
+
+    async def current() -> FlyteContext:
+        return FlyteContextManager.current_context()
+
+    async def main():
+        with FlyteContextManager.with_context(_with_client(FlyteContextManager.current_context(), "parent")) as ctx:
+            results = await asyncio.gather(*(push_and_yield(i) for i in range(20)))
+            assert FlyteContextManager.current_context() is ctx
+            # Tasks start with the stack of the code that created them
+            assert await asyncio.ensure_future(current()) is ctx
+            return results
+
+    outer = FlyteContextManager.current_context()
+    assert asyncio.run(main()) == list(range(20))
+    assert FlyteContextManager.current_context() is outer
+
+
+def test_concurrent_local_workflow_executions():
+    from flytekit.core.task import task
+    from flytekit.core.workflow import workflow
+
+    @task
+    def square(a: int) -> int:
+        return a * a
+
+    @workflow
+    def wf(a: int) -> int:
+        return square(a=square(a=a))
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(lambda a: wf(a=a), range(50))) == [a ** 4 for a in range(50)]
+
+
+def test_origin_stackframe():
+    ctx = FlyteContextManager.current_context()
+    with FlyteContextManager.with_context(ctx.new_builder()) as c:
+        lineno = inspect.currentframe().f_lineno - 1
+    assert c.origin_stackframe.name == "test_origin_stackframe"
+    assert c.origin_stackframe.lineno == lineno
+    assert c.get_origin_stackframe_repr().startswith(f"StackOrigin(test_origin_stackframe, {lineno}, ")
@@ -1,6 +1,6 @@
 import typing
 
-from flytekit import dynamic
+from flytekit import ContainerTask, dynamic, kwtypes
 from flytekit.core import context_manager
 from flytekit.core.context_manager import ExecutionState, FastSerializationSettings, Image, ImageConfig
 from flytekit.core.task import task
@@ -62,6 +62,68 @@ def test_wf1_with_fast_dynamic():
     assert context_manager.FlyteContextManager.size() == 1
 
 
+def test_dynamic_job_spec_deduplicated():
+    @dynamic
+    def my_subwf(a: int):
+        for i in range(a):
+            # A new task object every time, that serializes to the same template
+            t1 = ContainerTask(
+                "t1", image="alpine", inputs=kwtypes(a=int), command=["echo"], arguments=["{{.inputs.a}}"]
+            )
+            t1(a=i)
+
+    with context_manager.FlyteContextManager.with_context(
+        context_manager.FlyteContextManager.current_context().with_serialization_settings(
+            context_manager.SerializationSettings(
+                project="test_proj",
+                domain="test_domain",
+                version="abc",
+                image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
+                env={},
+            )
+        )
+    ) as ctx:
+        with context_manager.FlyteContextManager.with_context(
+            ctx.with_execution_state(ctx.execution_state.with_params(mode=ExecutionState.Mode.TASK_EXECUTION))
+        ) as ctx:
+            input_literal_map = TypeEngine.dict_to_literal_map(ctx, {"a": 5})
+            dynamic_job_spec = my_subwf.dispatch_execute(ctx, input_literal_map)
+            assert len(dynamic_job_spec.nodes) == 5
+            assert len(dynamic_job_spec.tasks) == 1
+            assert ctx.user_space_params.stats.current_value("dynamic.nodes") == 5
+            assert ctx.user_space_params.stats.current_value("dynamic.tasks") == 1
+
+    # Written part by part, the spec is the same as when serialized at once
+    serialized = b"".join(p.SerializeToString() for p in dynamic_job_spec.to_flyte_idl_parts())
+    assert serialized == dynamic_job_spec.to_flyte_idl().SerializeToString()
+
+
+def test_compile_without_user_params(tmp_path):
+    @task
+    def t1(a: int) -> int:
+        return a + 2
+
+    @dynamic
+    def my_subwf(a: int) -> typing.List[int]:
+        return [t1(a=i) for i in range(a)]
+
+    ctx = context_manager.FlyteContextManager.current_context().with_serialization_settings(
+        context_manager.SerializationSettings(
+            project="test_proj",
+            domain="test_domain",
+            version="abc",
+            image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
+            env={},
+        )
+    )
+    with context_manager.FlyteContextManager.with_context(ctx) as ctx:
+        state = ExecutionState(mode=ExecutionState.Mode.TASK_EXECUTION, working_dir=str(tmp_path))
+        with context_manager.FlyteContextManager.with_context(ctx.with_execution_state(state)) as ctx:
+            assert ctx.user_space_params is None
+            dynamic_job_spec = my_subwf.compile_into_workflow(ctx, my_subwf._task_function, a=3)
+            assert len(dynamic_job_spec.nodes) == 3
+
+
 def test_dynamic_local():
     @task
     def t1(a: int) -> str:
@@ -1,6 +1,9 @@
+import os
+import threading
 import typing
 from collections import OrderedDict
 
+import mock
 import pandas as pd
 import pytest
 
@@ -11,7 +14,14 @@ from flytekit.core.base_task import kwtypes
 from flytekit.core.context_manager import Image, ImageConfig
 from flytekit.core.launch_plan import LaunchPlan
 from flytekit.core.task import reference_task, task
-from flytekit.core.workflow import ImperativeWorkflow, get_promise, workflow
+from flytekit.core.workflow import (
+    GLOBAL_START_NODE,
+    ImperativeWorkflow,
+    WorkflowFailurePolicy,
+    execute_nodes,
+    get_promise,
+    workflow,
+)
 from flytekit.extras.sqlite3.task import SQLite3Config, SQLite3Task
 from flytekit.models import literals as literal_models
 from flytekit.types.file import FlyteFile
@@ -347,3 +357,120 @@ def test_nonfunction_task_and_df_input():
 
     assert len(wf_spec.template.interface.outputs) == 1
     assert wf_spec.template.interface.outputs["output_from_t3"].type.schema is not None
+
+
+def test_independent_nodes_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    @task
+    def wait_for_other(a: int) -> int:
+        # Only returns if both nodes run at the same time
+        barrier.wait()
+        return a
+
+    @task
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    wb = ImperativeWorkflow(name="my.workflow.concurrent")
+    wb.add_workflow_input("in1", int)
+    n1 = wb.add_entity(wait_for_other, a=wb.inputs["in1"])
+    n2 = wb.add_entity(wait_for_other, a=5)
+    n3 = wb.add_entity(add, a=n1.outputs["o0"], b=n2.outputs["o0"])
+    wb.add_workflow_output("from_n3", n3.outputs["o0"])
+
+    @workflow
+    def wf(a: int) -> int:
+        return add(a=wait_for_other(a=a), b=wait_for_other(a=5))
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_WORKFLOW_WORKERS": "2"}):
+        assert wb(in1=3) == 8
+        assert wf(a=3) == 8
+
+
+@pytest.mark.parametrize("workers", ["1", "4"])
+def test_local_failure_policy(workers):
+    ran = []
+
+    @task
+    def fail(a: int) -> int:
+        raise ValueError("failed")
+
+    @task
+    def record(a: int) -> int:
+        ran.append(a)
+        return a
+
+    def build(policy):
+        wb = ImperativeWorkflow(name="my.workflow.failure", failure_policy=policy)
+        n1 = wb.add_entity(fail, a=1)
+        wb.add_entity(record, a=n1.outputs["o0"])
+        n3 = wb.add_entity(record, a=3)
+        wb.add_workflow_output("from_n3", n3.outputs["o0"])
+        return wb
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_WORKFLOW_WORKERS": workers}):
+        with pytest.raises(ValueError):
+            build(WorkflowFailurePolicy.FAIL_AFTER_EXECUTABLE_NODES_COMPLETE)()
+        # The node that depends on the failed one never runs, the independent one does
+        assert ran == [3]
+
+        if workers == "1":
+            ran.clear()
+            with pytest.raises(ValueError):
+                build(WorkflowFailurePolicy.FAIL_IMMEDIATELY)()
+            assert ran == []
+
+
+def test_intermediate_outputs_released(tmp_path):
+    uris = []
+
+    @task
+    def write(a: str) -> FlyteFile:
+        p = tmp_path / a
+        p.write_text(a)
+        return FlyteFile(str(p))
+
+    @task
+    def read(f: FlyteFile) -> str:
+        uris.append(f.path)
+        with open(f) as r:
+            return r.read()
+
+    @task
+    def check(a: str, f: FlyteFile) -> str:
+        # The first file was only read by the first read node, which has run
+        assert not os.path.exists(uris[0])
+        assert os.path.exists(f.path)
+        return a
+
+    @workflow
+    def wf() -> (str, FlyteFile):
+        f = write(a="x")
+        f2 = write(a="y")
+        return check(a=read(f=f), f=f2), f2
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_RELEASE_INTERMEDIATES": "True"}):
+        a, f = wf()
+    assert a == "x"
+    # The outputs of the workflow are kept
+    with open(f) as r:
+        assert r.read() == "y"
+
+    wb = ImperativeWorkflow(name="my.workflow.release")
+    n1 = wb.add_entity(write, a="x")
+    n2 = wb.add_entity(read, f=n1.outputs["o0"])
+    wb.add_workflow_output("from_n2", n2.outputs["o0"])
+    outputs = {}
+
+    def run(nodes, cache, *args, **kwargs):
+        execute_nodes(nodes, cache, *args, **kwargs)
+        outputs.update(cache)
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_RELEASE_INTERMEDIATES": "False"}), mock.patch(
+        "flytekit.core.workflow.execute_nodes", side_effect=run
+    ):
+        assert wb() == "x"
+    # Only the inputs and the outputs of the workflow were held on to, files are only deleted if enabled
+    assert set(outputs) == {GLOBAL_START_NODE, n2}
+    assert os.path.exists(uris[-1])
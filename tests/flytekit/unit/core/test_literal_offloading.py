@@ -0,0 +1,62 @@
+import os
+import typing
+
+import mock
+
+from flytekit.core import literal_offloading
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import workflow
+from flytekit.models.literals import LiteralMap
+
+
+@task(offload_outputs=True)
+def produce(n: int) -> typing.List[str]:
+    return ["x" * 100] * n
+
+
+@task
+def produce_inline(n: int) -> typing.List[str]:
+    return ["x" * 100] * n
+
+
+@task
+def consume(a: typing.List[str]) -> int:
+    return len(a)
+
+
+def test_offload_outputs():
+    ctx = FlyteContextManager.current_context()
+    lm = TypeEngine.dict_to_literal_map(ctx, {"n": 20})
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LITERAL_OFFLOAD_THRESHOLD": "1000"}):
+        outputs = produce.dispatch_execute(ctx, lm)
+        assert literal_offloading.is_offloaded(outputs.literals["o0"])
+        assert ctx.user_space_params.stats.current_value("literal_offloading.offloaded") >= 1
+
+        # Small outputs stay inline
+        lm = TypeEngine.dict_to_literal_map(ctx, {"n": 2})
+        assert not literal_offloading.is_offloaded(produce.dispatch_execute(ctx, lm).literals["o0"])
+
+        # Tasks have to opt in, as the reference does not match the declared type of the output
+        lm = TypeEngine.dict_to_literal_map(ctx, {"n": 20})
+        assert not literal_offloading.is_offloaded(produce_inline.dispatch_execute(ctx, lm).literals["o0"])
+
+    # References survive serialization and are resolved when converted to a python value
+    lv = LiteralMap.from_flyte_idl(outputs.to_flyte_idl()).literals["o0"]
+    assert TypeEngine.to_python_value(ctx, lv, typing.List[str]) == ["x" * 100] * 20
+
+
+def test_offload_in_workflow():
+    @workflow
+    def wf(n: int) -> int:
+        return consume(a=produce(n=n))
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LITERAL_OFFLOAD_THRESHOLD": "1000"}):
+        assert wf(n=50) == 50
+
+
+def test_offload_disabled():
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, "x" * 10000, str, TypeEngine.to_literal_type(str))
+    assert literal_offloading.offload_if_oversized(ctx, lv) is lv
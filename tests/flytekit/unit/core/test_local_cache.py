@@ -0,0 +1,119 @@
+import os
+import typing
+
+import mock
+import pandas as pd
+import pytest
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.local_cache import LocalTaskCache, hash_literal_map
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import workflow
+from flytekit.models.literals import LiteralMap
+from flytekit.types.file import FlyteFile
+
+calls = []
+
+
+@task(cache=True, cache_version="1")
+def square(n: int) -> int:
+    calls.append(n)
+    return n * n
+
+
+@task(cache=True, cache_version="1")
+def frame(n: int) -> pd.DataFrame:
+    calls.append(n)
+    return pd.DataFrame({"x": range(n)})
+
+
+@task
+def total(df: pd.DataFrame) -> int:
+    return int(df["x"].sum())
+
+
+@workflow
+def square_wf(n: int) -> int:
+    return square(n=n)
+
+
+@workflow
+def wf(n: int) -> int:
+    return total(df=frame(n=n))
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    calls.clear()
+    with mock.patch.dict(
+        os.environ, {"FLYTE_SDK_LOCAL_CACHE_ENABLED": "True", "FLYTE_SDK_LOCAL_CACHE_DIR": str(tmp_path)}
+    ):
+        yield str(tmp_path)
+
+
+def test_cached_outputs_are_reused(cache_dir):
+    assert square_wf(n=3) == 9
+    assert square_wf(n=3) == 9
+    assert square_wf(n=4) == 16
+    assert calls == [3, 4]
+    assert len(LocalTaskCache().entries()) == 2
+
+    with mock.patch.object(square.metadata, "cache_version", "2"):
+        assert square_wf(n=3) == 9
+    assert calls == [3, 4, 3]
+
+
+def test_cache_disabled(cache_dir):
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_CACHE_ENABLED": "False"}):
+        square_wf(n=3)
+        square_wf(n=3)
+    assert calls == [3, 3]
+    assert LocalTaskCache().entries() == []
+
+
+def test_cached_files(cache_dir):
+    assert wf(n=10) == 45
+    assert wf(n=10) == 45
+    assert calls == [10]
+    # The data of the outputs is stored in the cache, and copied out of it on every hit
+    LocalTaskCache().clear("unknown")
+    assert len(LocalTaskCache().entries()) == 1
+    assert wf(n=10) == 45
+
+
+def test_files_hashed_by_content(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    paths = []
+    for name in ("a", "b", "c"):
+        paths.append(tmp_path / name)
+        paths[-1].write_text("same" if name != "c" else "different")
+
+    def to_map(p) -> LiteralMap:
+        lt = TypeEngine.to_literal_type(FlyteFile)
+        return LiteralMap(literals={"f": TypeEngine.to_literal(ctx, FlyteFile(str(p)), FlyteFile, lt)})
+
+    a, b, c = (hash_literal_map(ctx, to_map(p)) for p in paths)
+    assert a == b
+    assert a != c
+
+
+def test_least_recently_used_entries_evicted(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    cache = LocalTaskCache(str(tmp_path), max_bytes=0)
+    outputs: typing.Dict[str, LiteralMap] = {}
+    for n in range(3):
+        lv = TypeEngine.to_literal(ctx, n, int, TypeEngine.to_literal_type(int))
+        outputs[str(n)] = LiteralMap(literals={"o": lv})
+        cache.put(ctx, str(n), "t", "1", outputs[str(n)])
+        # Explicit use times, back to back writes can share a timestamp on file systems with coarse mtimes
+        used_at = 1000000000 + n
+        os.utime(os.path.join(str(tmp_path), str(n), "metadata.json"), (used_at, used_at))
+    sizes = {e.key: e.bytes for e in cache.entries()}
+    assert cache.get(ctx, "0") == outputs["0"]
+
+    removed = cache.evict(sizes["0"] + sizes["2"])
+    assert [e.key for e in removed] == ["1"]
+    assert cache.get(ctx, "1") is None
+    assert {e.key for e in cache.entries()} == {"0", "2"}
+    assert [e.key for e in cache.clear()] and cache.entries() == []
@@ -0,0 +1,85 @@
+import os
+
+import mock
+import pandas as pd
+import pyarrow as pa
+
+from flytekit import kwtypes
+from flytekit.core.context_manager import ExecutionState, FlyteContextManager
+from flytekit.core.local_objects import LOCAL_OBJECTS_KEY, LocalObjectTable
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import workflow
+from flytekit.types.schema import FlyteSchema
+from flytekit.types.schema.types_pandas import PandasSchemaWriter
+
+
+@task
+def produce(n: int) -> pd.DataFrame:
+    return pd.DataFrame({"x": range(n)})
+
+
+@task
+def mutate_and_sum(df: pd.DataFrame) -> int:
+    df["x"] = df["x"] * 10
+    return int(df["x"].sum())
+
+
+@task
+def total(df: pd.DataFrame) -> int:
+    return int(df["x"].sum())
+
+
+@task
+def schema_total(s: FlyteSchema[kwtypes(x=int)]) -> int:
+    return int(s.open().all()["x"].sum())
+
+
+@workflow
+def wf(n: int) -> (int, int, pd.DataFrame):
+    df = produce(n=n)
+    return mutate_and_sum(df=df), total(df=df), df
+
+
+@workflow
+def schema_wf(n: int) -> int:
+    return schema_total(s=produce(n=n))
+
+
+def test_dataframes_passed_in_memory():
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_OBJECT_PASSTHROUGH": "True"}), mock.patch.object(
+        PandasSchemaWriter, "_write", wraps=PandasSchemaWriter._write, autospec=True
+    ) as write:
+        mutated, unchanged, df = wf(n=10)
+        assert write.call_count == 0
+        # Consumed as a FlyteSchema, the dataframe has to be written
+        assert schema_wf(n=10) == 45
+        assert write.call_count == 1
+    # Every consumer got its own copy
+    assert (mutated, unchanged) == (450, 45)
+    assert df["x"].tolist() == list(range(10))
+
+    with mock.patch.object(PandasSchemaWriter, "_write", wraps=PandasSchemaWriter._write, autospec=True) as write:
+        assert wf(n=10)[:2] == (450, 45)
+        assert write.call_count == 1
+
+
+def test_local_object_table():
+    ctx = FlyteContextManager.current_context()
+    table = LocalObjectTable()
+    state = ctx.new_execution_state().with_params(
+        mode=ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION, additional_context={LOCAL_OBJECTS_KEY: table}
+    )
+    assert LocalObjectTable.current(ctx.with_execution_state(state).build()) is table
+    task_state = state.with_params(mode=ExecutionState.Mode.TASK_EXECUTION)
+    assert LocalObjectTable.current(ctx.with_execution_state(task_state).build()) is None
+
+    with FlyteContextManager.with_context(ctx.with_execution_state(state)) as child_ctx:
+        t = pa.table({"x": [1, 2]})
+        lv = TypeEngine.to_literal(child_ctx, t, pa.Table, TypeEngine.to_literal_type(pa.Table))
+        uri = lv.scalar.schema.uri
+        assert uri in table and not os.listdir(uri)
+        assert TypeEngine.to_python_value(child_ctx, lv, pa.Table) is t
+        # Needed as another type, the table is written to its uri
+        assert TypeEngine.to_python_value(child_ctx, lv, pd.DataFrame)["x"].tolist() == [1, 2]
+        assert os.listdir(uri)
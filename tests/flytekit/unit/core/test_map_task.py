@@ -1,6 +1,7 @@
 import typing
 from collections import OrderedDict
 
+import mock
 import pytest
 
 from flytekit import LaunchPlan, Resources, map_task
@@ -9,7 +10,9 @@ from flytekit.core import context_manager
 from flytekit.core.context_manager import Image, ImageConfig
 from flytekit.core.map_task import MapPythonTask
 from flytekit.core.task import TaskMetadata, task
+from flytekit.core.type_engine import TypeEngine
 from flytekit.core.workflow import workflow
+from flytekit.models.literals import LiteralMap
 
 
 @task
@@ -162,3 +165,37 @@ def test_inputs_outputs_length():
 
     with pytest.raises(ValueError):
         _ = map_task(many_inputs)
+
+
+def test_map_task_rejects_packed_lists():
+    @task(compact_lists=True)
+    def packed(n: int) -> typing.List[int]:
+        return list(range(n))
+
+    with pytest.raises(ValueError):
+
+        @workflow
+        def wf(n: int) -> typing.List[str]:
+            return map_task(t1)(a=packed(n=n))
+
+    with pytest.raises(ValueError):
+        map_task(t1, metadata=TaskMetadata(compact_lists=True))
+
+
+def test_map_task_execution_converts_single_element(monkeypatch):
+    monkeypatch.setenv("BATCH_JOB_ARRAY_INDEX_VAR_NAME", "AWS_BATCH_JOB_ARRAY_INDEX")
+    monkeypatch.setenv("AWS_BATCH_JOB_ARRAY_INDEX", "1")
+    mt = map_task(t1)
+    ctx = context_manager.FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(typing.List[int])
+    lm = LiteralMap(literals={"a": TypeEngine.to_literal(ctx, [5, 6, 7], typing.List[int], lt)})
+    with context_manager.FlyteContextManager.with_context(
+        ctx.with_execution_state(
+            ctx.new_execution_state().with_params(mode=context_manager.ExecutionState.Mode.TASK_EXECUTION)
+        )
+    ) as ctx:
+        with mock.patch.object(TypeEngine, "to_python_value", wraps=TypeEngine.to_python_value) as to_python_value:
+            outputs = mt.dispatch_execute(ctx, lm)
+    assert outputs.literals["o0"].scalar.primitive.string_value == "8"
+    # One call for the lazy input list and one for the element used by this instance of the array task
+    assert to_python_value.call_count == 2
@@ -1,12 +1,15 @@
+import os
 import typing
 from collections import OrderedDict
 
+import mock
 import pytest
 
 from flytekit import Resources, map_task
 from flytekit.common.exceptions.user import FlyteAssertion
 from flytekit.common.translator import get_serializable
 from flytekit.core import context_manager
+from flytekit.core import interface as flyte_interface
 from flytekit.core.context_manager import Image, ImageConfig
 from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.node_creation import create_node
@@ -198,3 +201,27 @@ def test_resource_overrides():
         _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "2"),
         _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "200"),
     ]
+
+
+def test_typed_interface_reused_per_settings():
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    transform = flyte_interface.transform_interface_to_typed_interface
+    with mock.patch.object(flyte_interface, "transform_interface_to_typed_interface", wraps=transform) as m:
+
+        @workflow
+        def wf1(a: int) -> int:
+            return t1(a=t1(a=t1(a=a)))
+
+        assert m.call_count == 1
+
+        # Literal types may depend on the dataframe format, typed interfaces computed for another format are not used
+        with mock.patch.dict(os.environ, {"FLYTE_SDK_DATAFRAME_FORMAT": "arrow"}):
+
+            @workflow
+            def wf2(a: int) -> int:
+                return t1(a=t1(a=a))
+
+        assert m.call_count == 2
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import workflow
+from flytekit.types.numpy import NumpyArrayTransformer
+
+
+def test_numpy_array_transformer():
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(np.ndarray)
+    assert lt.blob.format == NumpyArrayTransformer.NUMPY_ARRAY_FORMAT
+    assert TypeEngine.guess_python_type(lt) is np.ndarray
+
+    a = np.arange(24, dtype=np.float32).reshape(2, 3, 4)
+    lv = TypeEngine.to_literal(ctx, a, np.ndarray, lt)
+    b = TypeEngine.to_python_value(ctx, lv, np.ndarray)
+    assert isinstance(b, np.memmap)
+    assert b.dtype == np.float32 and b.shape == (2, 3, 4)
+    assert np.array_equal(a, b)
+    with pytest.raises(ValueError):
+        b[0, 0, 0] = 1
+
+    with pytest.raises(AssertionError):
+        TypeEngine.to_literal(ctx, np.array([object()]), np.ndarray, lt)
+
+
+def test_numpy_array_in_workflow():
+    @task
+    def make(n: int) -> np.ndarray:
+        return np.ones((n, n), dtype=np.int16)
+
+    @task
+    def total(a: np.ndarray) -> int:
+        return int(a.sum())
+
+    @workflow
+    def wf(n: int) -> int:
+        return total(a=make(n=n))
+
+    assert wf(n=10) == 100
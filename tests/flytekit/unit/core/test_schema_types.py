@@ -1,10 +1,33 @@
+import itertools
+import os
 from datetime import datetime, timedelta
 
+import mock
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 from flytekit import kwtypes
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.task import task
 from flytekit.core.type_engine import TypeEngine
-from flytekit.types.schema import FlyteSchema, SchemaFormat
+from flytekit.core.workflow import workflow
+from flytekit.models.literals import Literal, Scalar, Schema
+from flytekit.types.schema import (
+    ChunkStatistics,
+    ColumnStatistics,
+    FlyteSchema,
+    SchemaFormat,
+    SchemaManifest,
+    SchemaOpenMode,
+)
+from flytekit.types.schema.types import _ordered_file_key, generate_ordered_files, upload_while_writing
+from flytekit.types.schema.types_arrow import _ARROW_IO, ArrowIO, is_arrow_file
+from flytekit.types.schema.types_pandas import _PARQUETIO_ENGINES
+
+
+def _data_files(directory):
+    return [f for f in os.listdir(directory) if not f.startswith(".")]
 
 
 def test_typed_schema():
@@ -36,3 +59,355 @@ def test_bad_conversion():
     lt.schema.columns[0]._type = 15
     with pytest.raises(ValueError):
         TypeEngine.guess_python_type(lt)
+
+
+def test_typed_schema_format():
+    s = FlyteSchema[kwtypes(x=int), SchemaFormat.ARROW]
+    assert s.format() == SchemaFormat.ARROW
+    assert s.columns() == {"x": int}
+    assert TypeEngine.to_literal_type(s) == TypeEngine.to_literal_type(FlyteSchema[kwtypes(x=int)])
+
+
+def test_arrow_schema_round_trip():
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+    schema = FlyteSchema[kwtypes(x=int, y=str), SchemaFormat.ARROW]()
+    schema.open().write(df, df)
+    for f in _data_files(schema.local_path):
+        assert is_arrow_file(os.path.join(schema.local_path, f))
+
+    readonly = schema.as_readonly()
+    assert readonly.open().all().equals(pd.concat([df, df], ignore_index=True))
+    table = readonly.open(pa.Table).all()
+    assert table.num_rows == 6 and table.column_names == ["x", "y"]
+    # The reader detects the format, so consumers may declare a different one
+    other = FlyteSchema[kwtypes(x=int)](
+        local_path=schema.local_path, remote_path="", supported_mode=SchemaOpenMode.READ
+    )
+    other._downloaded = True
+    assert other.open(pa.Table).all().column_names == ["x"]
+
+
+def test_arrow_table_transformer():
+    ctx = FlyteContextManager.current_context()
+    table = pa.table({"a": [1, 2], "b": [0.5, 1.5]})
+    lt = TypeEngine.to_literal_type(pa.Table)
+    assert lt == TypeEngine.to_literal_type(pd.DataFrame)
+    for fmt in ["parquet", "arrow"]:
+        with mock.patch.dict(os.environ, {"FLYTE_SDK_DATAFRAME_FORMAT": fmt}):
+            lv = TypeEngine.to_literal(ctx, table, pa.Table, lt)
+        assert TypeEngine.to_python_value(ctx, lv, pa.Table).equals(table)
+        assert TypeEngine.to_python_value(ctx, lv, pd.DataFrame).equals(table.to_pandas())
+
+
+def test_schema_iter_batches():
+    frames = [pd.DataFrame({"x": list(range(i, i + n)), "y": [float(i)] * n}) for i, n in [(0, 3), (3, 5), (8, 2)]]
+    expected = pd.concat(frames, ignore_index=True)
+    for fmt in [SchemaFormat.PARQUET, SchemaFormat.ARROW]:
+        schema = FlyteSchema[kwtypes(x=int, y=float), fmt]()
+        schema.open().write(*frames)
+        readonly = schema.as_readonly()
+
+        batches = list(readonly.open().iter(batch_rows=4))
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert pd.concat(batches, ignore_index=True).equals(expected)
+        assert [len(b) for b in readonly.open().iter()] == [3, 5, 2]
+
+        tables = list(readonly.open(pa.Table).iter(batch_rows=6))
+        assert [t.num_rows for t in tables] == [6, 4]
+        assert pa.concat_tables(tables).to_pandas().equals(expected)
+
+        with pytest.raises(ValueError):
+            next(readonly.open().iter(batch_rows=0))
+
+
+def test_schema_iter_fetches_progressively():
+    ctx = FlyteContextManager.current_context()
+    t = FlyteSchema[kwtypes(x=int)]
+    schema = t()
+    schema.open().write(*[pd.DataFrame({"x": [i] * 10}) for i in range(4)])
+    lv = TypeEngine.to_literal(ctx, schema, t, TypeEngine.to_literal_type(t))
+
+    remote = TypeEngine.to_python_value(ctx, lv, t)
+    assert _data_files(remote.local_path) == []
+    it = remote.open().iter(batch_rows=5)
+    assert next(it)["x"].tolist() == [0] * 5
+    # Only the current file and the one read ahead are fetched
+    assert len(_data_files(remote.local_path)) <= 2
+    rest = pd.concat(list(it), ignore_index=True)
+    assert rest["x"].tolist() == [0] * 5 + [1] * 10 + [2] * 10 + [3] * 10
+    assert len(_data_files(remote.local_path)) == 4
+    # Once everything is fetched, reading all of it does not download the directory again
+    assert len(remote.open().all()) == 40
+
+
+def test_schema_iter_falls_back_to_directory_download(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    pd.DataFrame({"x": [1, 2, 3]}).to_parquet(tmp_path / "part-0.parquet")
+    lv = TypeEngine.to_literal(ctx, pd.DataFrame(), pd.DataFrame, TypeEngine.to_literal_type(pd.DataFrame))
+    lv.scalar.schema._uri = str(tmp_path)
+
+    remote = TypeEngine.to_python_value(ctx, lv, FlyteSchema)
+    assert [len(b) for b in remote.open().iter(batch_rows=2)] == [2, 1]
+
+
+def test_schema_projection_and_filters():
+    ctx = FlyteContextManager.current_context()
+    t = FlyteSchema[kwtypes(x=int, y=str, z=float)]
+    frames = [pd.DataFrame({"x": range(i, i + 10), "y": ["a"] * 10, "z": [0.5] * 10}) for i in range(0, 30, 10)]
+    schema = t()
+    schema.open().write(*frames, row_group_size=5)
+    expected = pd.DataFrame({"x": range(12, 30)})
+
+    local = schema.as_readonly()
+    assert local.open().all(columns=["x"], filters=[("x", ">", 11)]).reset_index(drop=True).equals(expected)
+
+    lv = TypeEngine.to_literal(ctx, schema, t, TypeEngine.to_literal_type(t))
+    remote = TypeEngine.to_python_value(ctx, lv, t)
+    df = remote.open().all(columns=["x"], filters=[("x", ">", 11)])
+    assert df.reset_index(drop=True).equals(expected)
+    table = remote.open(pa.Table).all(columns=["x", "z"], filters=[("x", "<", 3)])
+    assert table.column_names == ["x", "z"] and table.num_rows == 3
+    batches = list(remote.open().iter(batch_rows=7, columns=["y"], filters=[("x", ">=", 10)]))
+    assert [len(b) for b in batches] == [7, 7, 6]
+    assert [len(b) for b in remote.open().iter(columns=["x"])] == [10, 10, 10]
+    # Nothing was downloaded
+    assert _data_files(remote.local_path) == []
+    # Without projection the files are fetched as usual
+    assert len(remote.open().all()) == 30
+    # Disjunctions of conjunctions, and set membership
+    dnf = [[("x", "<", 2)], [("x", ">=", 5), ("x", "not in", [6, 7]), ("x", "!=", 9), ("x", "<=", 10)]]
+    assert remote.open().all(columns=["x"], filters=dnf)["x"].tolist() == [0, 1, 5, 8, 10]
+    assert remote.open().all(columns=["x"], filters=[("x", "in", {3, 20})])["x"].tolist() == [3, 20]
+    assert len(_data_files(remote.local_path)) == 3
+
+
+def test_schema_projection_falls_back_to_download():
+    ctx = FlyteContextManager.current_context()
+    t = FlyteSchema[kwtypes(x=int)]
+    schema = t()
+    schema.open().write(pd.DataFrame({"x": [1, 2, 3]}))
+    lv = TypeEngine.to_literal(ctx, schema, t, TypeEngine.to_literal_type(t))
+    remote = TypeEngine.to_python_value(ctx, lv, t)
+    with mock.patch("flytekit.types.schema.types_arrow.arrow_filesystem", side_effect=OSError("no access")):
+        assert remote.open().all(filters=[("x", ">", 1)])["x"].tolist() == [2, 3]
+    assert len(_data_files(remote.local_path)) == 1
+
+
+def test_ordered_files_unbounded():
+    names = [os.path.basename(f) for f in itertools.islice(generate_ordered_files("/tmp"), 100001)]
+    assert names[0] == "00000" and names[-1] == "100000"
+    assert sorted(reversed(names), key=_ordered_file_key) == names
+
+
+def test_schema_partitioned_write():
+    df = pd.DataFrame({"x": range(25), "y": [1.5] * 25})
+    for fmt in [SchemaFormat.PARQUET, SchemaFormat.ARROW]:
+        schema = FlyteSchema[kwtypes(x=int, y=float), fmt]()
+        written = []
+        schema.open().write(df, df.iloc[:3], partition_rows=10, on_file_written=written.append)
+        # The manifest is reported last, once all the files are written
+        assert os.path.basename(written[-1]) == ".manifest.json"
+        assert sorted(os.path.basename(f) for f in written[:-1]) == ["00000", "00001", "00002", "00003"]
+        readonly = schema.as_readonly()
+        assert [len(f) for f in readonly.open().iter()] == [10, 10, 5, 3]
+        expected = pd.concat([df, df.iloc[:3]], ignore_index=True)
+        assert readonly.open().all().reset_index(drop=True).equals(expected)
+        assert [t.num_rows for t in readonly.open(pa.Table).iter()] == [10, 10, 5, 3]
+
+        schema = FlyteSchema[kwtypes(x=int), fmt]()
+        schema.open(pa.Table).write(pa.table({"x": list(range(5))}), partition_rows=2)
+        assert len(_data_files(schema.local_path)) == 3
+
+
+def test_schema_write_more_than_1024_files():
+    df = pd.DataFrame({"x": range(1100)})
+    schema = FlyteSchema[kwtypes(x=int), SchemaFormat.ARROW]()
+    schema.open().write(df, partition_rows=1)
+    assert len(_data_files(schema.local_path)) == 1100
+    assert schema.as_readonly().open().all()["x"].tolist() == list(range(1100))
+
+
+def test_dataframe_partitions_uploaded_while_writing():
+    ctx = FlyteContextManager.current_context()
+    df = pd.DataFrame({"x": range(100)})
+    lt = TypeEngine.to_literal_type(pd.DataFrame)
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_SCHEMA_PARTITION_ROWS": "30"}):
+        lv = TypeEngine.to_literal(ctx, df, pd.DataFrame, lt)
+    assert len(_data_files(lv.scalar.schema.uri)) == 4
+    assert TypeEngine.to_python_value(ctx, lv, pd.DataFrame).equals(df)
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "fastparquet"])
+def test_parquet_io_multi_file_read(engine, tmp_path):
+    if engine == "fastparquet":
+        pytest.importorskip("fastparquet")
+    io = _PARQUETIO_ENGINES[engine]
+    frames = [pd.DataFrame({"x": range(i, i + 4), "y": ["a", "b", "c", "d"]}) for i in range(0, 12, 4)]
+    files = []
+    for i, df in enumerate(frames):
+        files.append(tmp_path / f"{i:05}")
+        io.write(df, files[-1])
+    (tmp_path / "empty").touch()
+
+    df = io.read(*files, tmp_path / "empty", columns=["x"])
+    assert df.columns.tolist() == ["x"] and df["x"].tolist() == list(range(12))
+    assert io.read(*files)["y"].tolist() == ["a", "b", "c", "d"] * 3
+    assert io.read(tmp_path / "empty").empty
+
+
+def test_schema_manifest():
+    df = pd.DataFrame({"x": range(25), "y": ["b"] * 12 + [None] + ["a"] * 12, "z": [1.5] * 25})
+    for fmt in [SchemaFormat.PARQUET, SchemaFormat.ARROW]:
+        schema = FlyteSchema[kwtypes(x=int, y=str, z=float), fmt]()
+        schema.open().write(df, partition_rows=10)
+        manifest = schema.manifest()
+        assert manifest.num_rows == 25
+        assert [(c.name, c.rows) for c in manifest.chunks] == [("00000", 10), ("00001", 10), ("00002", 5)]
+        sizes = [os.path.getsize(os.path.join(schema.local_path, f)) for f in _data_files(schema.local_path)]
+        assert manifest.num_bytes == sum(sizes)
+        assert manifest.chunks[1].columns["x"] == ColumnStatistics(min=10, max=19, null_count=0)
+        assert manifest.column_statistics("y") == ColumnStatistics(min="a", max="b", null_count=1)
+        assert schema.as_readonly().open().manifest() == manifest
+
+
+def test_schema_manifest_excluded():
+    manifest = SchemaManifest(
+        chunks=[
+            ChunkStatistics("00000", 10, 100, {"x": ColumnStatistics(0, 9, 0), "y": ColumnStatistics("a", "c", 0)}),
+            ChunkStatistics("00001", 10, 100, {"x": ColumnStatistics(10, 19, 0), "y": ColumnStatistics("d", "f", 0)}),
+            ChunkStatistics("00002", 10, 100, {"x": ColumnStatistics(None, None, None)}),
+        ]
+    )
+    assert manifest.excluded([("x", ">", 9)]) == {"00000"}
+    assert manifest.excluded([("x", "=", 5), ("y", "in", ["e"])]) == {"00000", "00001"}
+    assert manifest.excluded([[("x", "<", 5)], [("y", "==", "e")]]) == set()
+    assert manifest.excluded([("x", "==", "not comparable")]) == set()
+    assert manifest.excluded(None) == set()
+    assert SchemaManifest.from_json(manifest.to_json()) == manifest
+
+
+def test_schema_manifest_skips_remote_files():
+    ctx = FlyteContextManager.current_context()
+    t = FlyteSchema[kwtypes(x=int)]
+    schema = t()
+    schema.open().write(pd.DataFrame({"x": range(40)}), partition_rows=10)
+    lv = TypeEngine.to_literal(ctx, schema, t, TypeEngine.to_literal_type(t))
+
+    assert SchemaManifest.fetch(ctx.file_access, lv.scalar.schema.uri).num_rows == 40
+    remote = TypeEngine.to_python_value(ctx, lv, t)
+    assert remote.manifest().num_rows == 40
+    assert _data_files(remote.local_path) == []
+
+    # Forces the files to be downloaded instead of read remotely
+    with mock.patch("flytekit.types.schema.types_arrow.arrow_filesystem", side_effect=OSError("no access")):
+        df = remote.open().all(filters=[("x", ">=", 25)])
+    assert df["x"].tolist() == list(range(25, 40))
+    assert sorted(_data_files(remote.local_path)) == ["00002", "00003"]
+    with mock.patch.object(ArrowIO, "remote_dataset", wraps=_ARROW_IO.remote_dataset) as remote_dataset:
+        assert [len(b) for b in remote.open().iter(columns=["x"], filters=[("x", "<", 12)])] == [10, 2]
+    assert remote_dataset.call_args[0][1] == {"00002", "00003"}
+
+
+def test_schema_manifest_invalidated_after_upload():
+    ctx = FlyteContextManager.current_context()
+    t = FlyteSchema[kwtypes(x=int)]
+    remote_path = ctx.file_access.get_random_remote_directory()
+    writer = t().open()
+    upload_while_writing(ctx, writer, remote_path, [pd.DataFrame({"x": range(10)})])
+    assert SchemaManifest.fetch(ctx.file_access, remote_path).num_rows == 10
+
+    # A later file without statistics makes the uploaded manifest incomplete
+    write = writer._write
+
+    def write_without_stats(*args, **kwargs):
+        write(*args, **kwargs)
+
+    with mock.patch.object(writer, "_write", side_effect=write_without_stats), mock.patch.object(
+        writer, "_file_stats", return_value=None
+    ):
+        upload_while_writing(ctx, writer, remote_path, [pd.DataFrame({"x": range(10, 15)})])
+    assert SchemaManifest.fetch(ctx.file_access, remote_path) is None
+
+    lv = Literal(scalar=Scalar(schema=Schema(remote_path, TypeEngine.to_literal_type(t).schema)))
+    remote = TypeEngine.to_python_value(ctx, lv, t)
+    assert remote.open().all(filters=[("x", ">=", 8)])["x"].tolist() == list(range(8, 15))
+
+
+def test_schema_write_iter_bounds_in_flight_chunks():
+    produced = []
+    written = []
+
+    def chunks():
+        for i in range(6):
+            # Every chunk is produced after at most the configured number of chunks are in flight
+            assert i - len(written) <= 2 + 1
+            produced.append(i)
+            yield pd.DataFrame({"x": [i] * 3})
+
+    schema = FlyteSchema[kwtypes(x=int)]()
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_SCHEMA_WRITE_WORKERS": "2"}):
+        schema.open().write_iter(chunks(), on_file_written=written.append)
+    assert produced == list(range(6))
+    assert schema.manifest().num_rows == 18
+    assert schema.as_readonly().open().all()["x"].tolist() == [i for i in range(6) for _ in range(3)]
+
+
+def test_task_returning_dataframe_generator():
+    @task
+    def produce(n: int) -> pd.DataFrame:
+        for i in range(n):
+            yield pd.DataFrame({"x": [i, i]})
+
+    @task
+    def produce_schema(n: int) -> FlyteSchema[kwtypes(x=int)]:
+        return (pa.table({"x": [i]}) for i in range(n))
+
+    @task
+    def total(df: pd.DataFrame, s: FlyteSchema[kwtypes(x=int)]) -> int:
+        return int(df["x"].sum()) + int(s.open().all()["x"].sum())
+
+    @workflow
+    def wf(n: int) -> int:
+        return total(df=produce(n=n), s=produce_schema(n=n))
+
+    assert wf(n=4) == 2 * 6 + 6
+
+
+@pytest.mark.parametrize(
+    "python_type", [pd.DataFrame, pa.Table, FlyteSchema[kwtypes(x=int)]], ids=["pandas", "arrow", "schema"]
+)
+def test_empty_dataframe_generator(python_type):
+    # Empty generators produce empty schemas, whatever the declared type
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, iter([]), python_type, TypeEngine.to_literal_type(python_type))
+    value = TypeEngine.to_python_value(ctx, lv, python_type)
+    if python_type is pd.DataFrame:
+        assert value.empty
+    elif python_type is pa.Table:
+        assert value.num_rows == 0
+    else:
+        assert value.open().all().empty
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_direct_writes_skip_local_staging(fmt):
+    ctx = FlyteContextManager.current_context()
+    df = pd.DataFrame({"x": range(100), "y": ["a"] * 100})
+    env = {"FLYTE_SDK_SCHEMA_DIRECT_WRITES": "True", "FLYTE_SDK_DATAFRAME_FORMAT": fmt}
+    with mock.patch.dict(os.environ, env), mock.patch.object(
+        type(ctx.file_access), "put_data", side_effect=AssertionError("no upload expected")
+    ), mock.patch.object(
+        type(ctx.file_access), "get_random_local_directory", side_effect=AssertionError("no local staging expected")
+    ):
+        lv = TypeEngine.to_literal(ctx, [df.iloc[:60], df.iloc[60:]], pd.DataFrame, None)
+        table_lv = TypeEngine.to_literal(ctx, pa.Table.from_pandas(df), pa.Table, None)
+        schema_type = FlyteSchema[kwtypes(x=int, y=str)]
+        schema_lv = TypeEngine.to_literal(ctx, df, schema_type, TypeEngine.to_literal_type(schema_type))
+
+    assert _data_files(lv.scalar.schema.uri) == ["00000", "00001"]
+    manifest = SchemaManifest.read(lv.scalar.schema.uri)
+    assert manifest.num_rows == 100 and manifest.column_statistics("x") == ColumnStatistics(0, 99, 0)
+    assert os.path.getsize(os.path.join(lv.scalar.schema.uri, "00001")) == manifest.chunks[1].bytes
+    assert TypeEngine.to_python_value(ctx, lv, pd.DataFrame).equals(df)
+    assert TypeEngine.to_python_value(ctx, table_lv, pa.Table).to_pandas().equals(df)
+    assert TypeEngine.to_python_value(ctx, schema_lv, schema_type).open().all().equals(df)
@@ -1,26 +1,44 @@
 import datetime
 import os
+import threading
 import typing
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
 
+import mock
 import pytest
 from dataclasses_json import dataclass_json
 from flyteidl.core import errors_pb2
 
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager
+from flytekit.core.task import task
 from flytekit.core.type_engine import (
     DataclassTransformer,
     DictTransformer,
+    LazyDict,
+    LazyList,
     ListTransformer,
     PathLikeTransformer,
+    ProtobufTransformer,
     SimpleTransformer,
     TypeEngine,
+    TypeTransformer,
+    literal_type_kind,
+    pack_list_if_large,
 )
 from flytekit.models import types as model_types
 from flytekit.models.core.types import BlobType
-from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralCollection, LiteralMap, Primitive, Scalar
+from flytekit.models.literals import (
+    Blob,
+    BlobMetadata,
+    Literal,
+    LiteralCollection,
+    LiteralMap,
+    Primitive,
+    Scalar,
+    Void,
+)
 from flytekit.models.types import LiteralType, SimpleType
 from flytekit.types.file.file import FlyteFile
 
@@ -371,3 +389,320 @@ def test_enum_type():
 
     with pytest.raises(AssertionError):
         TypeEngine.to_literal_type(UnsupportedEnumValues)
+
+
+@dataclass_json
+@dataclass
+class Leaf(object):
+    x: int
+    y: float
+    z: typing.Optional[int] = None
+
+
+@dataclass_json
+@dataclass
+class Tree(object):
+    leaf: Leaf
+    leaves: typing.List[Leaf]
+    counts: typing.Dict[str, int]
+    ids: typing.List[int]
+    name: str
+
+
+def test_dataclass_struct_fast_path():
+    ctx = FlyteContextManager.current_context()
+    o = Tree(
+        leaf=Leaf(x=1, y=2.0, z=3),
+        leaves=[Leaf(x=4, y=5.5), Leaf(x=6, y=7.0, z=8)],
+        counts={"a": 9, "b": 10},
+        ids=[11, 12],
+        name="tree",
+    )
+    lt = TypeEngine.to_literal_type(Tree)
+    lv = TypeEngine.to_literal(ctx, o, Tree, lt)
+    assert lv.scalar.generic["leaf"]["x"] == 1.0
+
+    pv = TypeEngine.to_python_value(ctx, lv, Tree)
+    assert pv == o
+    assert type(pv.leaf.x) is int
+    assert type(pv.leaf.y) is float
+    assert type(pv.leaves[1].z) is int
+    assert type(pv.counts["a"]) is int
+    assert type(pv.ids[0]) is int
+
+
+@dataclass_json
+@dataclass
+class WithDatetime(object):
+    a: int
+    dt: datetime.datetime
+
+
+def test_dataclass_struct_json_fallback():
+    ctx = FlyteContextManager.current_context()
+    o = WithDatetime(a=1, dt=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc))
+    lv = TypeEngine.to_literal(ctx, o, WithDatetime, TypeEngine.to_literal_type(WithDatetime))
+    pv = TypeEngine.to_python_value(ctx, lv, WithDatetime)
+    assert pv == o
+    assert type(pv.a) is int
+
+
+def test_generic_dict_struct_fast_path():
+    ctx = FlyteContextManager.current_context()
+    d = {"a": 1, "b": [1, "x", True, None, {"c": 2.5}], "e": {}, "f": [], "g": (1, 2)}
+    lv = DictTransformer.dict_to_generic_literal(d)
+    pv = TypeEngine.to_python_value(ctx, lv, dict)
+    assert pv == {"a": 1.0, "b": [1.0, "x", True, None, {"c": 2.5}], "e": {}, "f": [], "g": [1.0, 2.0]}
+
+    # Non-string keys are stringified, the same way json would
+    lv = DictTransformer.dict_to_generic_literal({1: "a"})
+    assert TypeEngine.to_python_value(ctx, lv, dict) == {"1": "a"}
+
+
+@pytest.mark.parametrize(
+    "python_type,python_val",
+    [
+        (typing.List[int], [1, -2, 2 ** 40, 0]),
+        (typing.List[float], [1.5, -2.25, 0.0, 1e300]),
+        (typing.List[bool], [True, False, False, True]),
+        (typing.List[str], ["a", "", "héllo", "\x00end"]),
+    ],
+)
+def test_compact_list_encoding(python_type, python_val):
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(python_type)
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_COMPACT_LIST_THRESHOLD": "4"}):
+        lv = pack_list_if_large(python_val, python_type)
+        assert lv.scalar.binary.tag.startswith("flytekit.packed_list.")
+        # Shorter lists keep the per element encoding
+        assert pack_list_if_large(python_val[:3], python_type) is None
+        # The type engine itself never packs
+        assert TypeEngine.to_literal(ctx, python_val, python_type, lt).collection is not None
+
+    # The literal type is not affected and the value survives a serialization round trip
+    assert TypeEngine.to_literal_type(python_type) == lt
+    lv = Literal.from_flyte_idl(lv.to_flyte_idl())
+    pv = TypeEngine.to_python_value(ctx, lv, python_type)
+    assert pv == python_val
+    assert [type(x) for x in pv] == [type(x) for x in python_val]
+
+
+def test_compact_list_encoding_fallback():
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_COMPACT_LIST_THRESHOLD": "1"}):
+        # Not applicable to ints beyond 64 bits, mixed lists, invalid unicode or other types
+        for t, v in [
+            (typing.List[int], [2 ** 70]),
+            (typing.List[float], [1, 2.0]),
+            (typing.List[str], ["\ud800"]),
+            (typing.List[typing.List[int]], [[1]]),
+            (typing.Dict[str, int], {"a": 1}),
+        ]:
+            assert pack_list_if_large(v, t) is None
+    # Disabled by default
+    assert pack_list_if_large([1.0] * 10, typing.List[float]) is None
+
+
+def test_compact_list_encoding_task_opt_in():
+    @task
+    def t1(n: int) -> typing.List[int]:
+        return list(range(n))
+
+    @task(compact_lists=True)
+    def t2(n: int) -> typing.List[int]:
+        return list(range(n))
+
+    ctx = FlyteContextManager.current_context()
+    lm = LiteralMap(literals={"n": TypeEngine.to_literal(ctx, 5, int, TypeEngine.to_literal_type(int))})
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_COMPACT_LIST_THRESHOLD": "4"}):
+        assert t1.dispatch_execute(ctx, lm).literals["o0"].collection is not None
+        lv = t2.dispatch_execute(ctx, lm).literals["o0"]
+    assert lv.scalar.binary.tag == "flytekit.packed_list.int"
+    assert TypeEngine.to_python_value(ctx, lv, typing.List[int]) == list(range(5))
+
+
+def test_lazy_list():
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(LazyList[int])
+    assert lt == TypeEngine.to_literal_type(typing.List[int])
+    lv = TypeEngine.to_literal(ctx, list(range(40)), LazyList[int], lt)
+    ll = TypeEngine.to_python_value(ctx, lv, LazyList[int])
+    assert isinstance(ll, LazyList)
+    assert len(ll) == 40 and ll.num_converted == 0
+    assert "converted=0" in repr(ll)
+
+    assert ll[3] == 3 and ll[-1] == 39
+    assert ll.num_converted == 2
+    assert ll[10:15] == [10, 11, 12, 13, 14]
+    assert ll.num_converted == 7
+    with pytest.raises(IndexError):
+        _ = ll[40]
+
+    it = iter(ll)
+    assert next(it) == 0
+    assert ll.num_converted == LazyList.DEFAULT_BATCH_SIZE + 1
+    assert ll == list(range(40))
+
+    # Unconverted and converted elements both make it back to the same literals
+    ll = TypeEngine.to_python_value(ctx, lv, LazyList[int])
+    _ = ll[0]
+    assert TypeEngine.to_literal(ctx, ll, LazyList[int], lt) == lv
+    assert TypeEngine.to_python_value(ctx, lv, typing.List[int]) == list(range(40))
+
+
+def test_lazy_dict():
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(LazyDict[float])
+    assert lt == TypeEngine.to_literal_type(typing.Dict[str, float])
+    lv = TypeEngine.to_literal(ctx, {"a": 1.0, "b": 2.0}, LazyDict[float], lt)
+    ld = TypeEngine.to_python_value(ctx, lv, LazyDict[float])
+    assert isinstance(ld, LazyDict)
+    assert sorted(ld.keys()) == ["a", "b"] and ld.num_converted == 0
+    assert ld["b"] == 2.0 and ld.num_converted == 1
+    with pytest.raises(KeyError):
+        _ = ld["c"]
+    assert ld == {"a": 1.0, "b": 2.0}
+    assert TypeEngine.to_literal(ctx, ld, LazyDict[float], lt) == lv
+
+
+class NotThreadSafe(object):
+    pass
+
+
+class NotThreadSafeTransformer(TypeTransformer[NotThreadSafe]):
+    def __init__(self):
+        super().__init__("NotThreadSafe", NotThreadSafe, thread_safe=False)
+
+    def get_literal_type(self, t: typing.Type[NotThreadSafe]) -> LiteralType:
+        return LiteralType(simple=SimpleType.NONE)
+
+    def to_literal(self, ctx, python_val, python_type, expected) -> Literal:
+        return Literal(scalar=Scalar(none_type=Void()))
+
+    def to_python_value(self, ctx, lv, expected_python_type):
+        return NotThreadSafe()
+
+
+TypeEngine.register(NotThreadSafeTransformer())
+
+
+def test_convert_concurrently():
+    def thread_name():
+        return threading.current_thread().name
+
+    result = TypeEngine.convert_concurrently(
+        {
+            "b": (int, thread_name),
+            "a": (typing.List[NotThreadSafe], thread_name),
+            "c": (typing.Dict[str, str], thread_name),
+        }
+    )
+    assert list(result.keys()) == ["b", "a", "c"]
+    assert result["a"] == threading.current_thread().name
+    assert result["b"].startswith("flyte-convert") and result["c"].startswith("flyte-convert")
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_MAX_CONVERSION_WORKERS": "1"}):
+        assert TypeEngine.convert_concurrently({"b": (int, thread_name), "c": (str, thread_name)}) == {
+            "b": threading.current_thread().name,
+            "c": threading.current_thread().name,
+        }
+
+
+def test_convert_concurrently_errors():
+    def fail(name):
+        def _fail():
+            raise ValueError(name)
+
+        return _fail
+
+    # The error of the first failed variable is raised, independent of the order in which the conversions finish
+    for _ in range(5):
+        with pytest.raises(ValueError, match="^b$"):
+            TypeEngine.convert_concurrently(
+                {"a": (int, lambda: 1), "b": (int, fail("b")), "c": (NotThreadSafe, fail("c")), "d": (int, fail("d"))}
+            )
+
+
+def test_dispatch_execute_concurrent_outputs():
+    @task
+    def t1(a: int) -> typing.NamedTuple("Out", x=typing.List[int], y=typing.Dict[str, int], z=str):
+        return [a] * 3, {"a": a}, str(a)
+
+    ctx = FlyteContextManager.current_context()
+    outputs = t1.dispatch_execute(ctx, TypeEngine.dict_to_literal_map(ctx, {"a": 3}))
+    assert list(outputs.literals.keys()) == ["x", "y", "z"]
+    types = {"x": typing.List[int], "y": typing.Dict[str, int], "z": str}
+    assert TypeEngine.literal_map_to_kwargs(ctx, outputs, types) == {"x": [3, 3, 3], "y": {"a": 3}, "z": "3"}
+
+
+def test_protobuf_binary_literals():
+    ctx = FlyteContextManager.current_context()
+    pt = ProtobufTransformer()
+    lt = pt.get_literal_type(errors_pb2.ContainerError)
+    e = errors_pb2.ContainerError(code="code", message="hello", kind=errors_pb2.ContainerError.RECOVERABLE)
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_PROTOBUF_BINARY_LITERALS": "True"}):
+        lv = pt.to_literal(ctx, e, errors_pb2.ContainerError, lt)
+    assert lv.scalar.binary.tag == "pb_type=flyteidl.core.errors_pb2.ContainerError"
+    assert pt.get_literal_type(errors_pb2.ContainerError) == lt
+    lv = Literal.from_flyte_idl(lv.to_flyte_idl())
+    assert pt.to_python_value(ctx, lv, errors_pb2.ContainerError) == e
+    with pytest.raises(AssertionError):
+        pt.to_python_value(ctx, lv, errors_pb2.ErrorDocument)
+
+    # Struct literals are still read
+    lv = pt.to_literal(ctx, e, errors_pb2.ContainerError, lt)
+    assert lv.scalar.generic is not None
+    assert pt.to_python_value(ctx, lv, errors_pb2.ContainerError) == e
+
+
+def test_guess_python_type_index():
+    lt = TypeEngine.to_literal_type(typing.Dict[str, typing.List[int]])
+    assert TypeEngine.guess_python_type(lt) == typing.Dict[str, typing.List[int]]
+    assert TypeEngine.guess_python_type(LiteralType(simple=SimpleType.NONE)) is None
+
+    # Only transformers that may reverse the kind of literal type are consulted
+    kinds = [literal_type_kind(t) for t in (lt, lt.map_value_type, lt.map_value_type.collection_type)]
+    assert [tr.name for tr in TypeEngine._reverse_transformers(kinds[0])] == ["Typed Dict"]
+    assert [tr.name for tr in TypeEngine._reverse_transformers(kinds[1])] == ["Typed List"]
+    assert [tr.name for tr in TypeEngine._reverse_transformers(kinds[2])] == ["int"]
+
+    # Results are memoized
+    with mock.patch.object(ListTransformer, "guess_python_type") as guess:
+        assert TypeEngine.guess_python_type(lt) == typing.Dict[str, typing.List[int]]
+        guess.assert_not_called()
+
+    with pytest.raises(ValueError):
+        TypeEngine.guess_python_type(LiteralType(simple=SimpleType.STRUCT))
+
+
+@dataclass_json
+@dataclass
+class Point(object):
+    x: int
+    tags: typing.List[str]
+
+
+@dataclass_json
+@dataclass
+class Stamped(object):
+    at: datetime.datetime
+
+
+def test_native_passthrough():
+    assert TypeEngine.is_lossless(typing.Dict[str, typing.List[Point]])
+    assert not TypeEngine.is_lossless(typing.Dict[int, int])
+    assert not TypeEngine.is_lossless(typing.Optional[int])
+    assert not TypeEngine.is_lossless(Stamped)
+    assert not TypeEngine.is_lossless(FlyteFile)
+
+    assert TypeEngine.native_passthrough(3, int) == (True, 3)
+    # Values that conversion would change are not passed through
+    assert TypeEngine.native_passthrough(3, float) == (False, None)
+    assert TypeEngine.native_passthrough(True, int) == (False, None)
+    assert TypeEngine.native_passthrough([1, "a"], typing.List[int]) == (False, None)
+    assert TypeEngine.native_passthrough(Point(x=1.0, tags=[]), Point) == (False, None)
+
+    v = {"a": [Point(x=1, tags=["t"])]}
+    passed, copied = TypeEngine.native_passthrough(v, typing.Dict[str, typing.List[Point]])
+    assert passed and copied == v
+    assert copied["a"][0] is not v["a"][0]
@@ -6,6 +6,7 @@ import typing
 from collections import OrderedDict
 from dataclasses import dataclass
 
+import mock
 import pandas
 import pytest
 from dataclasses_json import dataclass_json
@@ -1268,3 +1269,34 @@ def test_conditional_asymmetric_return():
 
     assert consume_outputs(my_input=4, seed=7) == 32
     assert consume_outputs(my_input=4) == 16
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_fast_local_execution(fast):
+    @task
+    def append(a: typing.List[int], b: int) -> typing.List[int]:
+        a.append(b)
+        return a
+
+    @task
+    def total(a: typing.List[int], b: float) -> float:
+        return sum(a) + b
+
+    @workflow
+    def wf(a: typing.List[int]) -> (typing.List[int], float):
+        x = append(a=a, b=3)
+        return x, total(a=append(a=x, b=4), b=0.5)
+
+    @workflow
+    def wf_int_for_float(a: typing.List[int]) -> float:
+        return total(a=append(a=a, b=3), b=1)
+
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOCAL_FAST_EXECUTION": str(fast)}):
+        with mock.patch.object(TypeEngine, "to_literal", wraps=TypeEngine.to_literal) as to_literal:
+            # Every task gets its own copy of its inputs
+            assert wf(a=[1, 2]) == ([1, 2, 3], 10.5)
+        # With fast execution only the input of the workflow (a list of two ints) is converted. Otherwise so are the
+        # constants bound to b (3), the outputs of both appends (4 + 5) and the output of total (1)
+        assert to_literal.call_count == (3 if fast else 3 + 3 + 4 + 5 + 1)
+        # The int given for a float is converted either way
+        assert wf_int_for_float(a=[1, 2]) == 7.0